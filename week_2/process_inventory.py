@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, ValidationError
 import csv
-from typing import List
+from typing import Any, List
 
 
 class Product(BaseModel):
@@ -20,30 +20,65 @@ class Product(BaseModel):
     price: float = Field(gt=0.0)
 
 
-def load_and_validate_products(filename: str) -> List[Product]:
+def _product_from_row(row: dict) -> Product:
+    """Validate one CSV row; module-level so worker processes can unpickle it."""
+    return Product(**row)
+
+
+def _error_details(error: Exception) -> Any:
+    """Describe a validation error the way the serial loader logs it."""
+    return error.errors() if isinstance(error, ValidationError) else str(error)
+
+
+def _load_and_validate_parallel(filename: str, workers: int) -> List[Product]:
+    """
+    Validate line-aligned shards of the CSV file in a process pool.
+
+    Uses the shared sharding helpers from week_3's `inventory_manager.parallel`;
+    products and logged errors keep the original file order. They are imported
+    here so the serial script runs from week_2 without week_3 on the path.
+    """
+    try:
+        from inventory_manager.parallel import validate_csv_parallel
+    except ImportError:
+        from week_3.inventory_manager.parallel import validate_csv_parallel
+
+    products, errors = validate_csv_parallel(filename, workers, validate=_product_from_row, describe=_error_details)
+    with open("errors.log", "w") as error_log:
+        for line_num, details in errors:
+            error_log.write(f"Row {line_num}: {details}\n")
+    return products
+
+
+def load_and_validate_products(filename: str, workers: int = 1) -> List[Product]:
     """
     Load product data from a CSV file and validate each record using Pydantic.
 
     Args:
         filename (str): The path to the CSV file containing product data.
+        workers (int, optional): Number of processes used for validation. Values above 1
+            split the file into line-aligned shards validated in parallel. Defaults to 1.
 
     Returns:
         List[Product]: A list of validated Product objects.
 
     Notes:
         - If a row contains invalid data, the error will be logged to 'errors.log'.
+        - Parallel mode requires that quoted fields do not contain newlines.
     """
+    if workers > 1:
+        return _load_and_validate_parallel(filename, workers)
+
     products: List[Product] = []
-    with open(filename, "r") as f, open("errors.log", "w") as error_log:
+    with open(filename, "r", newline="") as f, open("errors.log", "w") as error_log:
         reader = csv.DictReader(f)
-        for i, row in enumerate(
-            reader, start=2
-        ):  # start=2 accounts for the header line
+        for row in reader:
             try:
                 product = Product(**row)
                 products.append(product)
             except ValidationError as e:
-                error_log.write(f"Row {i}: {e.errors()}\n")
+                # line_num counts blank lines too, matching the parallel loader
+                error_log.write(f"Row {reader.line_num}: {e.errors()}\n")
     return products
 
 
@@ -0,0 +1,223 @@
+# week_3/inventory_manager/columnar.py
+
+from array import array
+from itertools import compress
+from operator import mul
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+from .core import DEFAULT_BATCH_SIZE, iter_product_batches
+from .models import CATEGORY_MODELS, Product
+from .snapshot import read_columns
+from .utils import BufferedErrorLog
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the array-module paths are used instead
+    np = None
+
+#: Category names indexed by the code stored in `ColumnarInventory.category_codes`.
+CATEGORY_NAMES: Tuple[str, ...] = ("", *CATEGORY_MODELS)
+
+_CODE_BY_MODEL: Dict[Type[Product], int] = {
+    model: code for code, model in enumerate(CATEGORY_MODELS.values(), start=1)
+}
+
+
+class ColumnarInventory:
+    """
+    Inventory stored as one typed array per attribute instead of a list of models.
+
+    Numeric columns live in `array` buffers (viewed through NumPy without copying when
+    it is installed), and the stock value of every product is computed once on insert,
+    so dashboard aggregates and threshold filters run over contiguous memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty columnar inventory."""
+        self.product_ids: List[str] = []
+        self.product_names: List[str] = []
+        self.quantities: array = array("q")
+        self.prices: array = array("d")
+        self.values: array = array("d")
+        self.category_codes: array = array("b")
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "ColumnarInventory":
+        """
+        Build a columnar inventory from product models.
+
+        Args:
+            products (Iterable[Product]): Products to copy into columns.
+
+        Returns:
+            ColumnarInventory: The populated inventory.
+        """
+        inventory = cls()
+        inventory.extend(products)
+        return inventory
+
+    @classmethod
+    def from_csv(
+        cls,
+        file_path: Union[str, Path],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        error_log: Optional[BufferedErrorLog] = None,
+    ) -> "ColumnarInventory":
+        """
+        Stream a product CSV file straight into columns.
+
+        Only one batch of models exists at a time, so memory is bounded by the
+        columns themselves.
+
+        Args:
+            file_path (Union[str, Path]): Path to the CSV file.
+            batch_size (int, optional): Rows validated per batch. Defaults to DEFAULT_BATCH_SIZE.
+            error_log (Optional[BufferedErrorLog], optional): Sink for rows that fail
+                validation. Defaults to appending to "errors.log".
+
+        Returns:
+            ColumnarInventory: The populated inventory.
+        """
+        inventory = cls()
+        for batch in iter_product_batches(file_path, batch_size, error_log):
+            inventory.extend(batch)
+        return inventory
+
+    @classmethod
+    def from_snapshot(cls, path: Union[str, Path]) -> "ColumnarInventory":
+        """
+        Load the columns of a snapshot written by `Inventory.save_snapshot`.
+
+        Numeric columns are copied straight from the file into arrays and no
+        product models are built, which makes this the fastest cold start.
+
+        Args:
+            path (Union[str, Path]): Snapshot file.
+
+        Returns:
+            ColumnarInventory: The populated inventory.
+
+        Raises:
+            ValueError: If the file is not a valid snapshot or fails its checksum.
+        """
+        columns = read_columns(path)
+        inventory = cls()
+        inventory.product_ids = columns["product_id"]
+        inventory.product_names = columns["product_name"]
+        inventory.quantities = columns["quantity"]
+        inventory.prices = columns["price"]
+        inventory.values = array("d", map(mul, inventory.quantities, inventory.prices))
+        inventory.category_codes = columns["category"]
+        return inventory
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def append(self, product: Product) -> None:
+        """
+        Append a single product to every column.
+
+        Args:
+            product (Product): The product to add.
+        """
+        self.product_ids.append(product.product_id)
+        self.product_names.append(product.product_name)
+        self.quantities.append(product.quantity)
+        self.prices.append(product.price)
+        self.values.append(product.quantity * product.price)
+        self.category_codes.append(_CODE_BY_MODEL.get(type(product), 0))
+
+    def extend(self, products: Iterable[Product]) -> None:
+        """
+        Append several products to every column.
+
+        Args:
+            products (Iterable[Product]): The products to add.
+        """
+        for product in products:
+            self.append(product)
+
+    def total_quantity(self) -> int:
+        """Returns the total number of units in stock."""
+        if np is not None:
+            return int(np.frombuffer(self.quantities, dtype=np.int64).sum())
+        return sum(self.quantities)
+
+    def total_value(self) -> float:
+        """Returns the total stock value of the inventory."""
+        if np is not None:
+            return float(np.frombuffer(self.values, dtype=np.float64).sum())
+        return sum(self.values)
+
+    def highest_sale_index(self) -> Optional[int]:
+        """Returns the row index of the product with the highest stock value, or None if empty."""
+        if not self.values:
+            return None
+        if np is not None:
+            return int(np.frombuffer(self.values, dtype=np.float64).argmax())
+        return self.values.index(max(self.values))
+
+    def low_stock_indices(self, threshold: int) -> List[int]:
+        """
+        Find the rows whose quantity is below a threshold.
+
+        Args:
+            threshold (int): Quantity threshold.
+
+        Returns:
+            List[int]: Matching row indices in insertion order.
+        """
+        if np is not None:
+            quantities = np.frombuffer(self.quantities, dtype=np.int64)
+            return np.flatnonzero(quantities < threshold).tolist()
+        return list(compress(range(len(self.quantities)), map(threshold.__gt__, self.quantities)))
+
+    def category_of(self, index: int) -> str:
+        """Returns the category name of the product at a row index ('' for generic products)."""
+        return CATEGORY_NAMES[self.category_codes[index]]
+
+    def generate_low_stock_report(self, report_file: Union[str, Path], threshold: int = 5) -> None:
+        """
+        Generate a low stock report based on a quantity threshold.
+
+        Products are listed in ascending quantity order, matching `Inventory`.
+
+        Args:
+            report_file (Union[str, Path]): Path to save the report file.
+            threshold (int, optional): Quantity threshold to consider a product as low stock. Defaults to 5.
+        """
+        try:
+            low_stock = sorted(
+                self.low_stock_indices(threshold),
+                key=lambda i: (self.quantities[i], self.product_ids[i]),
+            )
+            with open(str(report_file), mode="w", encoding="utf-8") as f:
+                if not low_stock:
+                    f.write("All products are sufficiently stocked.\n")
+                else:
+                    for i in low_stock:
+                        f.write(
+                            f"{self.product_names[i]} (ID: {self.product_ids[i]}) - Qty: {self.quantities[i]}\n"
+                        )
+        except Exception as e:
+            print(f"Error generating low stock report: {e}")
+
+    def print_summary_dashboard(self) -> None:
+        """
+        Print a summary dashboard showing total products, total quantity,
+        highest sale product, and total inventory value.
+        """
+        print("Inventory Summary Dashboard")
+        print(f"Total Products : {len(self)}")
+        print(f"Total Quantity : {self.total_quantity()}")
+
+        highest = self.highest_sale_index()
+        if highest is not None:
+            print(
+                f"Highest Sale Product : {self.product_names[highest]} "
+                f"(Rs {self.values[highest]:.2f})"
+            )
+        else:
+            print("Highest Sale Product : N/A")
+
+        print(f"Total inventory value : Rs {self.total_value():.2f}")
@@ -1,55 +1,399 @@
 # week_3/inventory_manager/core.py
 
 import csv
+from itertools import islice
 from pathlib import Path
-from typing import List, Union
-from .models import Product, FoodProduct, ElectronicProduct, BookProduct
-from .utils import log_validation_error
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .indexes import SortedIndex
+from .models import CategoryTotals, InventorySummary, Product, category_of, product_from_row
+from .parallel import validate_csv_parallel
+from .snapshot import read_snapshot, write_snapshot
+from .utils import BufferedErrorLog, log_validation_error
+from .validators import validate_rows
 from pydantic import ValidationError
 
+#: Number of validated products handed to the caller at a time when streaming.
+DEFAULT_BATCH_SIZE: int = 10_000
+
+
+def _to_cents(value: float) -> int:
+    """Round a stock value to whole cents for the running totals."""
+    return round(value * 100)
+
+
+def iter_product_batches(
+    file_path: Union[str, Path],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    error_log: Optional[BufferedErrorLog] = None,
+    fast_validation: bool = False,
+) -> Iterator[List[Product]]:
+    """
+    Stream validated products from a CSV file in fixed-size batches.
+
+    Only one batch is held in memory at a time, so arbitrarily large files can be
+    processed with constant memory. Invalid rows are logged and skipped.
+
+    Args:
+        file_path (Union[str, Path]): Path to the CSV file.
+        batch_size (int, optional): Maximum number of products per batch.
+            Defaults to DEFAULT_BATCH_SIZE.
+        error_log (Optional[BufferedErrorLog], optional): Sink for rows that fail
+            validation. Defaults to appending to "errors.log".
+        fast_validation (bool, optional): Validate each batch of raw rows with the
+            compiled validator from `validators.validate_rows`. Defaults to False.
+
+    Yields:
+        List[Product]: The next batch of validated products (the last one may be shorter).
+
+    Raises:
+        ValueError: If batch_size is not positive.
+        OSError: If the file cannot be opened or read.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+
+    if fast_validation:
+        yield from _iter_fast_batches(file_path, batch_size, error_log)
+        return
+
+    with open(file_path, mode="r", encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        batch: List[Product] = []
+        for row in reader:
+            try:
+                batch.append(product_from_row(row))
+            except (ValidationError, ValueError) as e:
+                log_validation_error(reader.line_num, e, error_log)
+                continue
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _iter_fast_batches(
+    file_path: Union[str, Path], batch_size: int, error_log: Optional[BufferedErrorLog]
+) -> Iterator[List[Product]]:
+    """Read raw rows in batches and validate each batch with one compiled validator call."""
+    with open(file_path, mode="r", encoding="utf-8", newline="") as file:
+        reader = csv.DictReader(file)
+        while True:
+            rows: List[Dict[str, str]] = []
+            line_nums: List[int] = []
+            for row in islice(reader, batch_size):
+                rows.append(row)
+                line_nums.append(reader.line_num)
+            if not rows:
+                return
+            products, errors = validate_rows(rows)
+            for index, error in errors:
+                log_validation_error(line_nums[index], error, error_log)
+            if products:
+                yield products
+
 
 class Inventory:
-    """Class representing an inventory of products."""
+    """
+    Class representing an inventory of products.
+
+    Products are unique by `product_id`; an id index is maintained alongside the
+    product list so lookups and mutations through `get`, `upsert`, `remove` and
+    `bulk_upsert` run in constant time per item. Sorted indexes on quantity and
+    stock value serve threshold, range and top-k queries by binary search, and
+    running totals are updated on every mutation so `summary()` is O(1).
+    """
 
     def __init__(self) -> None:
         """Initialize an empty inventory."""
-        self.products: List[Product] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        """Clear the products, their indexes and the running totals."""
+        self._products: List[Product] = []
+        self._positions: Dict[str, int] = {}
+        self._quantity_index = SortedIndex()
+        self._value_index = SortedIndex()
+        # (quantity, value, category) each product was indexed with, so removal does
+        # not depend on the product object being left unmodified.
+        self._indexed: Dict[str, Tuple[int, float, str]] = {}
+        self._total_quantity = 0
+        # Stock values are summed in integer cents so repeated upserts and
+        # removals cancel exactly instead of accumulating float rounding error.
+        self._total_cents = 0
+        self._category_totals: Dict[str, List[int]] = {}
+
+    @property
+    def products(self) -> List[Product]:
+        """
+        List of products in the inventory.
+
+        Treat the returned list as read-only and mutate through `upsert`/`remove`
+        so the id index stays consistent. Assigning a new list rebuilds the index;
+        later duplicates of a `product_id` replace earlier ones.
+        """
+        return self._products
+
+    @products.setter
+    def products(self, products: Iterable[Product]) -> None:
+        self._reset()
+        self.bulk_upsert(products)
+
+    def _index_product(self, product: Product) -> None:
+        """Add a product to the secondary indexes and running totals."""
+        quantity, value, category = product.quantity, product.get_total_value(), category_of(product)
+        self._indexed[product.product_id] = (quantity, value, category)
+        self._quantity_index.add(quantity, product.product_id)
+        self._value_index.add(value, product.product_id)
+        cents = _to_cents(value)
+        self._total_quantity += quantity
+        self._total_cents += cents
+        totals = self._category_totals.setdefault(category, [0, 0, 0])
+        totals[0] += 1
+        totals[1] += quantity
+        totals[2] += cents
+
+    def _unindex_product(self, product: Product) -> None:
+        """Remove a product from the secondary indexes and running totals."""
+        quantity, value, category = self._indexed.pop(product.product_id)
+        self._quantity_index.discard(quantity, product.product_id)
+        self._value_index.discard(value, product.product_id)
+        cents = _to_cents(value)
+        self._total_quantity -= quantity
+        self._total_cents -= cents
+        totals = self._category_totals[category]
+        totals[0] -= 1
+        totals[1] -= quantity
+        totals[2] -= cents
+        if not totals[0]:
+            del self._category_totals[category]
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product_id: object) -> bool:
+        return product_id in self._positions
+
+    def get(self, product_id: str) -> Optional[Product]:
+        """
+        Look up a product by id.
+
+        Args:
+            product_id (str): Product identifier.
+
+        Returns:
+            Optional[Product]: The product, or None if it is not in the inventory.
+        """
+        position = self._positions.get(product_id)
+        return None if position is None else self._products[position]
+
+    def upsert(self, product: Product) -> bool:
+        """
+        Insert a product, or replace the product that has the same id.
+
+        Args:
+            product (Product): The product to store.
+
+        Returns:
+            bool: True if the product was inserted, False if it replaced an existing one.
+        """
+        position = self._positions.get(product.product_id)
+        if position is not None:
+            self._unindex_product(self._products[position])
+            self._products[position] = product
+            self._index_product(product)
+            return False
+        self._positions[product.product_id] = len(self._products)
+        self._products.append(product)
+        self._index_product(product)
+        return True
+
+    def bulk_upsert(self, products: Iterable[Product]) -> Tuple[int, int]:
+        """
+        Upsert several products.
+
+        Args:
+            products (Iterable[Product]): Products to store, applied in order.
+
+        Returns:
+            Tuple[int, int]: Number of products inserted and number replaced.
+        """
+        inserted = 0
+        replaced = 0
+        for product in products:
+            if self.upsert(product):
+                inserted += 1
+            else:
+                replaced += 1
+        return inserted, replaced
+
+    def remove(self, product_id: str) -> Optional[Product]:
+        """
+        Remove a product by id.
+
+        The last product is moved into the freed slot, so removal does not preserve
+        the order of `products`.
+
+        Args:
+            product_id (str): Product identifier.
+
+        Returns:
+            Optional[Product]: The removed product, or None if it was not found.
+        """
+        position = self._positions.pop(product_id, None)
+        if position is None:
+            return None
+        removed = self._products[position]
+        self._unindex_product(removed)
+        last = self._products.pop()
+        if position < len(self._products):
+            self._products[position] = last
+            self._positions[last.product_id] = position
+        return removed
 
-    def load_from_csv(self, file_path: Union[str, Path]) -> None:
+    def below_quantity(self, threshold: int) -> List[Product]:
+        """
+        Find products whose quantity is below a threshold.
+
+        Args:
+            threshold (int): Quantity threshold.
+
+        Returns:
+            List[Product]: Matching products in ascending quantity order.
+        """
+        return [self.get(pid) for pid in self._quantity_index.below(threshold)]
+
+    def quantity_range(self, low: Optional[int] = None, high: Optional[int] = None) -> List[Product]:
+        """
+        Find products whose quantity lies in the inclusive range [low, high].
+
+        Args:
+            low (Optional[int], optional): Minimum quantity, unbounded if None.
+            high (Optional[int], optional): Maximum quantity, unbounded if None.
+
+        Returns:
+            List[Product]: Matching products in ascending quantity order.
+        """
+        return [self.get(pid) for pid in self._quantity_index.between(low, high)]
+
+    def top_by_value(self, k: int) -> List[Product]:
+        """
+        Find the products with the highest stock value.
+
+        Args:
+            k (int): Number of products to return.
+
+        Returns:
+            List[Product]: Up to `k` products in descending stock value order.
+        """
+        return [self.get(pid) for pid in self._value_index.largest(k)]
+
+    def save_snapshot(self, path: Union[str, Path]) -> None:
+        """
+        Save the inventory to a binary columnar snapshot file.
+
+        Args:
+            path (Union[str, Path]): Destination file, replaced atomically.
+        """
+        write_snapshot(self._products, path)
+
+    @classmethod
+    def load_snapshot(cls, path: Union[str, Path]) -> "Inventory":
+        """
+        Restore an inventory from a snapshot without re-validating the products.
+
+        Args:
+            path (Union[str, Path]): Snapshot file written by `save_snapshot`.
+
+        Returns:
+            Inventory: The restored inventory.
+
+        Raises:
+            ValueError: If the file is not a valid snapshot or fails its checksum.
+        """
+        inventory = cls()
+        inventory.bulk_upsert(read_snapshot(path))
+        return inventory
+
+    def load_from_csv(
+        self,
+        file_path: Union[str, Path],
+        workers: int = 1,
+        error_log: Optional[BufferedErrorLog] = None,
+    ) -> None:
         """
         Load product data from a CSV file and populate the inventory.
 
         Args:
             file_path (Union[str, Path]): Path to the CSV file.
+            workers (int, optional): Number of processes used to validate rows. Values
+                above 1 validate byte-range shards of the file in a process pool.
+                Defaults to 1.
+            error_log (Optional[BufferedErrorLog], optional): Sink for rows that fail
+                validation. Defaults to appending to "errors.log".
 
-        Raises:
-            ValueError: If a product category is unrecognized.
-            ValidationError: If product data fails validation.
+        Notes:
+            - Rows with an unrecognized category or invalid data are logged and skipped.
         """
         try:
-            with open(file_path, mode="r", encoding="utf-8") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    try:
-                        category = row.get("category", "").lower()
-                        if category == "food":
-                            product = FoodProduct(**row)
-                        elif category == "electronic":
-                            product = ElectronicProduct(**row)
-                        elif category == "book":
-                            product = BookProduct(**row)
-                        else:
-                            raise ValueError(f"Unknown category '{category}' in row: {row}")
-                        self.products.append(product)
-                    except (ValidationError, ValueError) as e:
-                        log_validation_error(row, e)
+            if workers > 1:
+                products, errors = validate_csv_parallel(file_path, workers)
+                self.bulk_upsert(products)
+                for row_num, message in errors:
+                    log_validation_error(row_num, message, error_log)
+            else:
+                self.stream_from_csv(file_path, error_log=error_log)
         except Exception as e:
             print(f"Failed to load products from CSV: {e}")
 
+    def stream_from_csv(
+        self,
+        file_path: Union[str, Path],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        on_batch: Optional[Callable[[List[Product]], None]] = None,
+        error_log: Optional[BufferedErrorLog] = None,
+        fast_validation: bool = False,
+    ) -> int:
+        """
+        Load products from a CSV file batch by batch.
+
+        When `on_batch` is given each batch is handed to it instead of being kept in
+        the inventory, so very large feeds can be forwarded to a sink with constant
+        memory. Without a callback the batches are upserted into the inventory.
+
+        Args:
+            file_path (Union[str, Path]): Path to the CSV file.
+            batch_size (int, optional): Maximum number of products per batch.
+                Defaults to DEFAULT_BATCH_SIZE.
+            on_batch (Optional[Callable[[List[Product]], None]], optional): Callback
+                receiving each validated batch. Defaults to None.
+            error_log (Optional[BufferedErrorLog], optional): Sink for rows that fail
+                validation. Defaults to appending to "errors.log".
+            fast_validation (bool, optional): Validate whole batches with the compiled
+                validator instead of one model at a time. Defaults to False.
+
+        Returns:
+            int: Total number of valid products processed.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+            OSError: If the file cannot be opened or read.
+        """
+        total = 0
+        for batch in iter_product_batches(file_path, batch_size, error_log, fast_validation):
+            if on_batch is not None:
+                on_batch(batch)
+            else:
+                self.bulk_upsert(batch)
+            total += len(batch)
+        return total
+
     def generate_low_stock_report(self, report_file: Union[str, Path], threshold: int = 5) -> None:
         """
         Generate a low stock report based on a quantity threshold.
 
+        Products are listed in ascending quantity order, read from the quantity index.
+
         Args:
             report_file (Union[str, Path]): Path to save the report file.
             threshold (int, optional): Quantity threshold to consider a product as low stock. Defaults to 5.
@@ -58,7 +402,7 @@ class Inventory:
             Exception: If file writing fails.
         """
         try:
-            low_stock = [p for p in self.products if p.quantity < threshold]
+            low_stock = self.below_quantity(threshold)
             with open(str(report_file), mode="w", encoding="utf-8") as f:
                 if not low_stock:
                     f.write("All products are sufficiently stocked.\n")
@@ -68,18 +412,42 @@ class Inventory:
         except Exception as e:
             print(f"Error generating low stock report: {e}")
 
+    def summary(self) -> InventorySummary:
+        """
+        Return the running inventory aggregates without scanning the products.
+
+        Totals are maintained incrementally by every mutation, with each product's
+        stock value rounded to the cent, and the highest
+        stock value is read from the value index's running maximum, without merging
+        its buffered inserts, so this costs O(1) in the number of products.
+
+        Returns:
+            InventorySummary: Product count, total quantity and value, the highest
+                stock-value product and per-category totals.
+        """
+        highest = self._value_index.max()
+        return InventorySummary(
+            total_products=len(self._products),
+            total_quantity=self._total_quantity,
+            total_value=self._total_cents / 100,
+            highest_sale=self.get(highest[1]) if highest else None,
+            categories={
+                name: CategoryTotals(products=t[0], quantity=t[1], value=t[2] / 100)
+                for name, t in self._category_totals.items()
+            },
+        )
+
     def print_summary_dashboard(self) -> None:
         """
         Print a summary dashboard showing total products, total quantity,
         highest sale product, and total inventory value.
         """
-        total_products = len(self.products)
-        total_quantity = sum(p.quantity for p in self.products)
-        highest_sale = max(self.products, key=lambda p: p.price * p.quantity, default=None)
+        summary = self.summary()
+        highest_sale = summary.highest_sale
 
         print("Inventory Summary Dashboard")
-        print(f"Total Products : {total_products}")
-        print(f"Total Quantity : {total_quantity}")
+        print(f"Total Products : {summary.total_products}")
+        print(f"Total Quantity : {summary.total_quantity}")
 
         if highest_sale:
             print(
@@ -89,5 +457,4 @@ class Inventory:
         else:
             print("Highest Sale Product : N/A")
 
-        total_value = sum(p.price * p.quantity for p in self.products)
-        print(f"Total inventory value : Rs {total_value:.2f}")
+        print(f"Total inventory value : Rs {summary.total_value:.2f}")
@@ -0,0 +1,186 @@
+# week_3/inventory_manager/indexes.py
+
+from bisect import bisect_left, insort
+from itertools import chain
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple
+
+_key = itemgetter(0)
+
+#: Pending inserts up to this size are placed one by one; larger runs trigger a re-sort.
+_INSORT_LIMIT = 32
+
+#: Target block length; blocks are split at twice this size.
+_BLOCK_SIZE = 512
+
+
+class SortedIndex:
+    """
+    Secondary index keeping (key, product_id) pairs in sorted order.
+
+    Entries live in a list of sorted blocks of a few hundred items, with the
+    last entry of every block kept in a separate list. Finding a position is
+    two binary searches and inserting or removing shifts only one block, so
+    single-item mutations cost O(log n + block size) instead of O(n), and
+    threshold and range queries cost O(log n) plus the size of the result.
+
+    Inserts are buffered and merged on the next read or removal; a large
+    buffer (a bulk load) is merged with one sort instead of item by item.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._blocks: List[List[Tuple[float, str]]] = []
+        self._maxes: List[Tuple[float, str]] = []
+        self._size = 0
+        self._pending: List[Tuple[float, str]] = []
+        self._pending_max: Optional[Tuple[float, str]] = None
+
+    def __len__(self) -> int:
+        return self._size + len(self._pending)
+
+    def _settle(self) -> None:
+        """Merge buffered inserts into the sorted blocks."""
+        if not self._pending:
+            return
+        if len(self._pending) <= _INSORT_LIMIT:
+            for entry in self._pending:
+                self._insert(entry)
+        else:
+            entries = list(chain.from_iterable(self._blocks))
+            entries.extend(self._pending)
+            entries.sort()
+            self._blocks = [entries[i:i + _BLOCK_SIZE] for i in range(0, len(entries), _BLOCK_SIZE)]
+            self._maxes = [block[-1] for block in self._blocks]
+            self._size = len(entries)
+        self._pending.clear()
+        self._pending_max = None
+
+    def _insert(self, entry: Tuple[float, str]) -> None:
+        """Place one entry in its block, splitting the block when it grows too long."""
+        self._size += 1
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            return
+        index = bisect_left(self._maxes, entry)
+        if index == len(self._blocks):
+            index -= 1
+        block = self._blocks[index]
+        insort(block, entry)
+        self._maxes[index] = block[-1]
+        if len(block) > 2 * _BLOCK_SIZE:
+            self._blocks[index:index + 1] = [block[:_BLOCK_SIZE], block[_BLOCK_SIZE:]]
+            self._maxes[index:index + 1] = [block[_BLOCK_SIZE - 1], block[-1]]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._blocks.clear()
+        self._maxes.clear()
+        self._size = 0
+        self._pending.clear()
+        self._pending_max = None
+
+    def add(self, key: float, product_id: str) -> None:
+        """
+        Insert a product under a key.
+
+        Args:
+            key (float): Sort key, e.g. quantity or stock value.
+            product_id (str): Product identifier.
+        """
+        entry = (key, product_id)
+        self._pending.append(entry)
+        if self._pending_max is None or entry > self._pending_max:
+            self._pending_max = entry
+
+    def discard(self, key: float, product_id: str) -> None:
+        """
+        Remove a product entry if present.
+
+        Args:
+            key (float): The key the product was indexed under.
+            product_id (str): Product identifier.
+        """
+        self._settle()
+        entry = (key, product_id)
+        index = bisect_left(self._maxes, entry)
+        if index == len(self._blocks):
+            return
+        block = self._blocks[index]
+        position = bisect_left(block, entry)
+        if position < len(block) and block[position] == entry:
+            del block[position]
+            self._size -= 1
+            if block:
+                self._maxes[index] = block[-1]
+            else:
+                del self._blocks[index]
+                del self._maxes[index]
+
+    def max(self) -> Optional[Tuple[float, str]]:
+        """
+        Returns the largest (key, product_id) entry, or None if the index is empty.
+
+        Costs O(1): buffered inserts are compared through their running maximum
+        instead of being merged.
+        """
+        settled = self._maxes[-1] if self._maxes else None
+        if settled is None or (self._pending_max is not None and self._pending_max > settled):
+            return self._pending_max
+        return settled
+
+    def _iter_from(self, low: Optional[float]) -> Iterator[Tuple[float, str]]:
+        """Yield entries in ascending order, starting at the first key >= `low`."""
+        if low is None:
+            index, position = 0, 0
+        else:
+            index = bisect_left(self._maxes, low, key=_key)
+            if index == len(self._blocks):
+                return
+            position = bisect_left(self._blocks[index], low, key=_key)
+        for block in self._blocks[index:]:
+            yield from block[position:]
+            position = 0
+
+    def below(self, key: float) -> List[str]:
+        """Returns the ids whose key is strictly below `key`, in ascending key order."""
+        self._settle()
+        index = bisect_left(self._maxes, key, key=_key)
+        ids = [pid for block in self._blocks[:index] for _, pid in block]
+        if index < len(self._blocks):
+            block = self._blocks[index]
+            ids.extend(pid for _, pid in block[: bisect_left(block, key, key=_key)])
+        return ids
+
+    def between(self, low: Optional[float] = None, high: Optional[float] = None) -> List[str]:
+        """
+        Returns the ids whose key lies in the inclusive range [low, high].
+
+        Args:
+            low (Optional[float], optional): Lower bound, unbounded if None.
+            high (Optional[float], optional): Upper bound, unbounded if None.
+
+        Returns:
+            List[str]: Matching ids in ascending key order.
+        """
+        self._settle()
+        ids: List[str] = []
+        for key, pid in self._iter_from(low):
+            if high is not None and key > high:
+                break
+            ids.append(pid)
+        return ids
+
+    def largest(self, k: int) -> List[str]:
+        """Returns the ids of the `k` largest keys, in descending key order."""
+        if k <= 0:
+            return []
+        self._settle()
+        ids: List[str] = []
+        for block in reversed(self._blocks):
+            for _, pid in reversed(block):
+                ids.append(pid)
+                if len(ids) == k:
+                    return ids
+        return ids
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, model_validator
 from datetime import date
-from typing import Optional
+from typing import Dict, Optional, Type
 
 
 class Product(BaseModel):
@@ -54,3 +54,58 @@ class BookProduct(Product):
         if not self.author or self.pages is None:
             raise ValueError("Book products must have both author and pages")
         return self
+
+
+class CategoryTotals(BaseModel):
+    """Aggregated stock figures for one product category."""
+
+    products: int = 0
+    quantity: int = 0
+    value: float = 0.0
+
+
+class InventorySummary(BaseModel):
+    """Point-in-time aggregates of an inventory, as shown on the summary dashboard."""
+
+    total_products: int
+    total_quantity: int
+    total_value: float
+    highest_sale: Optional[Product] = None
+    categories: Dict[str, CategoryTotals] = {}
+
+
+#: Maps the lower-cased CSV `category` value to its product model.
+CATEGORY_MODELS: Dict[str, Type[Product]] = {
+    "food": FoodProduct,
+    "electronic": ElectronicProduct,
+    "book": BookProduct,
+}
+
+
+def product_from_row(row: Dict[str, str]) -> Product:
+    """
+    Build the category-specific product model for a single CSV row.
+
+    Args:
+        row (Dict[str, str]): Raw CSV row keyed by column name.
+
+    Returns:
+        Product: The validated product instance.
+
+    Raises:
+        ValueError: If the product category is unrecognized.
+        ValidationError: If the row fails model validation.
+    """
+    category = (row.get("category") or "").lower()
+    model_cls = CATEGORY_MODELS.get(category)
+    if model_cls is None:
+        raise ValueError(f"Unknown category '{category}' in row: {row}")
+    return model_cls(**row)
+
+
+_CATEGORY_BY_MODEL: Dict[Type[Product], str] = {model: name for name, model in CATEGORY_MODELS.items()}
+
+
+def category_of(product: Product) -> str:
+    """Returns the category name of a product ("generic" for plain `Product` instances)."""
+    return _CATEGORY_BY_MODEL.get(type(product), "generic")
@@ -0,0 +1,144 @@
+# week_3/inventory_manager/parallel.py
+
+import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from .models import Product, product_from_row
+from pydantic import ValidationError
+
+#: A validation error as (CSV line number, error description).
+RowError = Tuple[int, Any]
+
+#: Builds a validated object from a raw CSV row, raising ValidationError or ValueError.
+RowValidator = Callable[[Dict[str, str]], Any]
+
+
+def split_csv_shards(file_path: Union[str, Path], shard_count: int) -> List[Tuple[int, int]]:
+    """
+    Split the data section of a CSV file into byte ranges that end on line boundaries.
+
+    The header line is excluded from every shard. Files whose quoted fields contain
+    embedded newlines cannot be sharded this way and should be loaded serially.
+
+    Args:
+        file_path (Union[str, Path]): Path to the CSV file.
+        shard_count (int): Desired number of shards.
+
+    Returns:
+        List[Tuple[int, int]]: Half-open (start, end) byte offsets, in file order.
+            Fewer shards than requested are returned for small files.
+    """
+    with open(file_path, mode="rb") as file:
+        file.readline()
+        data_start = file.tell()
+        size = os.fstat(file.fileno()).st_size
+        if size <= data_start:
+            return []
+
+        step = max(1, (size - data_start) // max(1, shard_count))
+        boundaries = [data_start]
+        for k in range(1, shard_count):
+            target = data_start + k * step
+            if target <= boundaries[-1]:
+                continue
+            file.seek(target - 1)
+            file.readline()
+            offset = file.tell()
+            if offset >= size:
+                break
+            if offset > boundaries[-1]:
+                boundaries.append(offset)
+        boundaries.append(size)
+
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _validate_shard(
+    file_path: str,
+    start: int,
+    end: int,
+    fieldnames: List[str],
+    validate: RowValidator = product_from_row,
+    describe: Callable[[Exception], Any] = str,
+) -> Tuple[List[Any], List[Tuple[int, Any]], int]:
+    """
+    Validate every row in one byte range of a CSV file.
+
+    Runs inside a worker process, so line numbers are reported relative to the shard.
+    Blank lines are skipped but still counted, as in the serial loaders.
+
+    Returns:
+        Tuple[List[Any], List[Tuple[int, Any]], int]: Valid objects, errors as
+            (shard line number, description) and the number of lines in the shard.
+    """
+    with open(file_path, mode="rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode("utf-8")
+
+    products: List[Any] = []
+    errors: List[Tuple[int, Any]] = []
+    reader = csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames)
+    for row in reader:
+        try:
+            products.append(validate(row))
+        except (ValidationError, ValueError) as e:
+            errors.append((reader.line_num, describe(e)))
+    line_count = text.count("\n") + (0 if text.endswith("\n") or not text else 1)
+    return products, errors, line_count
+
+
+def validate_csv_parallel(
+    file_path: Union[str, Path],
+    workers: Optional[int] = None,
+    validate: RowValidator = product_from_row,
+    describe: Callable[[Exception], Any] = str,
+) -> Tuple[List[Product], List[RowError]]:
+    """
+    Validate a product CSV file across a pool of worker processes.
+
+    The file is split into one shard per worker at line boundaries; shard results are
+    merged back so products and errors keep the original file order.
+
+    Args:
+        file_path (Union[str, Path]): Path to the CSV file.
+        workers (Optional[int], optional): Number of worker processes.
+            Defaults to the number of CPUs.
+        validate (RowValidator, optional): Module-level callable building one object
+            per row. Defaults to `product_from_row`.
+        describe (Callable[[Exception], Any], optional): Module-level callable turning
+            a validation error into what is reported. Defaults to `str`.
+
+    Returns:
+        Tuple[List[Product], List[RowError]]: Valid objects in file order and
+            validation errors keyed by CSV line number (the header is line 1).
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(file_path, mode="r", encoding="utf-8", newline="") as file:
+        fieldnames = next(csv.reader(file), [])
+
+    shards = split_csv_shards(file_path, workers)
+    if not shards:
+        return [], []
+
+    path = str(file_path)
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+        futures = [
+            pool.submit(_validate_shard, path, start, end, fieldnames, validate, describe)
+            for start, end in shards
+        ]
+        results = [future.result() for future in futures]
+
+    products: List[Product] = []
+    errors: List[RowError] = []
+    lines_before = 1  # the header
+    for shard_products, shard_errors, line_count in results:
+        products.extend(shard_products)
+        errors.extend((lines_before + line, detail) for line, detail in shard_errors)
+        lines_before += line_count
+    return products, errors
@@ -0,0 +1,121 @@
+# week_3/inventory_manager/scanner.py
+
+import csv
+import mmap
+import operator
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+#: A pushed-down filter as (column, operator, value), e.g. ("quantity", "<", 10).
+Predicate = Tuple[str, str, Union[int, float, str]]
+
+_OPERATORS: Dict[str, Callable[[object, object], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def _compile_predicates(
+    header: List[str], where: Sequence[Predicate]
+) -> List[Tuple[int, Callable[[bytes], bool]]]:
+    """Turn (column, op, value) filters into byte-field tests keyed by column index."""
+    tests: List[Tuple[int, Callable[[bytes], bool]]] = []
+    for column, op, value in where:
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}'")
+        compare = _OPERATORS[op]
+        if isinstance(value, str):
+            encoded = value.encode("utf-8")
+            tests.append((header.index(column), lambda raw, c=compare, v=encoded: c(raw, v)))
+        else:
+            tests.append((header.index(column), lambda raw, c=compare, v=value: _numeric_test(raw, c, v)))
+    return tests
+
+
+def _numeric_test(raw: bytes, compare: Callable[[object, object], bool], value: float) -> bool:
+    try:
+        return compare(float(raw), value)
+    except ValueError:
+        return False
+
+
+def scan_csv(
+    file_path: Union[str, Path],
+    columns: Sequence[str],
+    where: Sequence[Predicate] = (),
+) -> Iterator[Tuple[str, ...]]:
+    """
+    Scan a CSV file through `mmap`, decoding only the requested columns.
+
+    Each line is split only up to the last column that is projected or filtered
+    on, predicates are tested against the raw bytes, and only the projected
+    `columns` of matching rows are decoded. No per-row dict is built and trailing
+    columns are never split or decoded. Values are returned unvalidated.
+
+    Numeric comparisons parse the field as a float and treat unparsable fields as
+    non-matching; string values are compared byte for byte. Lines containing a
+    quote are parsed with the `csv` module, but quoted fields spanning several lines
+    are not supported.
+
+    Args:
+        file_path (Union[str, Path]): Path to the CSV file.
+        columns (Sequence[str]): Columns to return, in order.
+        where (Sequence[Predicate], optional): Filters that must all hold. Defaults to ().
+
+    Yields:
+        Tuple[str, ...]: The projected fields of each matching row.
+
+    Raises:
+        ValueError: If a column is not in the header or an operator is unsupported.
+    """
+    with open(file_path, mode="rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _scan(mm, columns, where)
+
+
+def _scan(mm: mmap.mmap, columns: Sequence[str], where: Sequence[Predicate]) -> Iterator[Tuple[str, ...]]:
+    header = next(csv.reader([mm.readline().decode("utf-8").rstrip("\r\n")]))
+    projection = [header.index(name) for name in columns]
+    tests = _compile_predicates(header, where)
+    last = max([*projection, *(index for index, _ in tests)], default=-1)
+    width = last + 1
+
+    for line in iter(mm.readline, b""):
+        line = line.rstrip(b"\r\n")
+        if not line:
+            continue
+        if b'"' in line:
+            fields = [field.encode("utf-8") for field in next(csv.reader([line.decode("utf-8")]))]
+        else:
+            # Split no further than the last column we need; trailing fields stay unsplit.
+            fields = line.split(b",", width)
+        if len(fields) < width:
+            fields += [b""] * (width - len(fields))
+        if all(test(fields[i]) for i, test in tests):
+            yield tuple(fields[i].decode("utf-8") for i in projection)
+
+
+def scan_low_stock(file_path: Union[str, Path], threshold: int = 5) -> List[Tuple[str, int]]:
+    """
+    Find low-stock rows in a CSV file reading only `product_id` and `quantity`.
+
+    Rows are not validated, so this is a fast pre-check rather than a replacement
+    for loading the inventory.
+
+    Args:
+        file_path (Union[str, Path]): Path to the CSV file.
+        threshold (int, optional): Quantity threshold. Defaults to 5.
+
+    Returns:
+        List[Tuple[str, int]]: (product_id, quantity) of every row below the threshold.
+    """
+    return [
+        (product_id, int(float(quantity)))
+        for product_id, quantity in scan_csv(file_path, ("product_id", "quantity"), [("quantity", "<", threshold)])
+    ]
@@ -0,0 +1,200 @@
+# week_3/inventory_manager/snapshot.py
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+from .models import CATEGORY_MODELS, BookProduct, ElectronicProduct, FoodProduct, Product
+
+MAGIC: bytes = b"INVSNAP1"
+SNAPSHOT_VERSION: int = 1
+
+# magic, header length
+_PREAMBLE = struct.Struct("<8sI")
+_ALIGNMENT = 8
+_SEPARATOR = "\x00"
+
+# Category code 0 is a plain `Product`; 1.. follow CATEGORY_MODELS.
+_MODELS: Tuple[type, ...] = (Product, *CATEGORY_MODELS.values())
+_CODES: Dict[type, int] = {model: code for code, model in enumerate(_MODELS)}
+
+# Column name -> array typecode, or "str" for NUL-separated UTF-8 text.
+_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("category", "b"),
+    ("product_id", "str"),
+    ("product_name", "str"),
+    ("quantity", "q"),
+    ("price", "d"),
+    ("expiry_date", "i"),  # proleptic ordinal, 0 = missing
+    ("warranty_period", "q"),  # -1 = missing
+    ("author", "str"),  # "" = missing
+    ("pages", "q"),  # -1 = missing
+)
+
+
+def _encode_column(typecode: str, values: List[Any]) -> bytes:
+    if typecode != "str":
+        return array(typecode, values).tobytes()
+    if any(_SEPARATOR in value for value in values):
+        raise ValueError("Snapshot text fields cannot contain NUL characters")
+    return _SEPARATOR.join(values).encode("utf-8")
+
+
+def write_snapshot(products: Iterable[Product], path: Union[str, Path]) -> None:
+    """
+    Write products to a binary columnar snapshot file.
+
+    Layout: an 8-byte magic, a little-endian uint32 header length, a JSON header
+    (schema, row count, byte order, CRC32 of the body) and then one 8-byte aligned
+    column per field. Numeric columns are raw machine arrays, so the file can be
+    memory-mapped and read column by column. The file is written to a temporary
+    path and renamed into place.
+
+    Args:
+        products (Iterable[Product]): Validated products to store.
+        path (Union[str, Path]): Destination file.
+
+    Raises:
+        ValueError: If a text field contains a NUL character.
+    """
+    columns: Dict[str, List[Any]] = {name: [] for name, _ in _COLUMNS}
+    for p in products:
+        columns["category"].append(_CODES.get(type(p), 0))
+        columns["product_id"].append(p.product_id)
+        columns["product_name"].append(p.product_name)
+        columns["quantity"].append(p.quantity)
+        columns["price"].append(p.price)
+        expiry = getattr(p, "expiry_date", None)
+        columns["expiry_date"].append(expiry.toordinal() if expiry else 0)
+        warranty = getattr(p, "warranty_period", None)
+        columns["warranty_period"].append(-1 if warranty is None else warranty)
+        columns["author"].append(getattr(p, "author", None) or "")
+        pages = getattr(p, "pages", None)
+        columns["pages"].append(-1 if pages is None else pages)
+
+    body = bytearray()
+    schema = []
+    for name, typecode in _COLUMNS:
+        data = _encode_column(typecode, columns[name])
+        schema.append({"name": name, "type": typecode, "offset": len(body), "length": len(data)})
+        body += data
+        body += b"\0" * (-len(body) % _ALIGNMENT)
+
+    header = json.dumps(
+        {
+            "version": SNAPSHOT_VERSION,
+            "rows": len(columns["category"]),
+            "byteorder": sys.byteorder,
+            "checksum": zlib.crc32(body),
+            "columns": schema,
+        }
+    ).encode("utf-8")
+    header += b" " * (-(_PREAMBLE.size + len(header)) % _ALIGNMENT)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, len(header)))
+        f.write(header)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_columns(path: Union[str, Path]) -> Dict[str, Union[array, List[str]]]:
+    """
+    Read the raw columns of a snapshot without building product models.
+
+    Args:
+        path (Union[str, Path]): Snapshot file.
+
+    Returns:
+        Dict[str, Union[array, List[str]]]: Numeric columns as `array` objects and
+            text columns as lists of strings, keyed by field name.
+
+    Raises:
+        ValueError: If the file is not a snapshot, has an unsupported version or
+            fails the checksum.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < _PREAMBLE.size:
+            raise ValueError(f"{path} is not an inventory snapshot")
+        magic, header_len = _PREAMBLE.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an inventory snapshot")
+        header = json.loads(mm[_PREAMBLE.size:_PREAMBLE.size + header_len])
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+
+        body_start = _PREAMBLE.size + header_len
+        rows: int = header["rows"]
+        columns: Dict[str, Union[array, List[str]]] = {}
+        with memoryview(mm) as view:
+            with view[body_start:] as body:
+                if zlib.crc32(body) != header["checksum"]:
+                    raise ValueError(f"Snapshot checksum mismatch in {path}")
+            for column in header["columns"]:
+                start = body_start + column["offset"]
+                with view[start:start + column["length"]] as chunk:
+                    if column["type"] == "str":
+                        values = str(chunk, "utf-8").split(_SEPARATOR) if rows else []
+                    else:
+                        values = array(column["type"])
+                        values.frombytes(chunk)
+                        if header["byteorder"] != sys.byteorder:
+                            values.byteswap()
+                if len(values) != rows:
+                    raise ValueError(f"Snapshot column '{column['name']}' is truncated")
+                columns[column["name"]] = values
+    return columns
+
+
+def read_snapshot(path: Union[str, Path]) -> List[Product]:
+    """
+    Restore products from a snapshot written by `write_snapshot`.
+
+    The data was validated before it was written and is protected by a checksum,
+    so models are rebuilt with `model_construct` and validation is skipped.
+
+    Args:
+        path (Union[str, Path]): Snapshot file.
+
+    Returns:
+        List[Product]: The stored products in their original order.
+
+    Raises:
+        ValueError: If the file is not a snapshot, has an unsupported version or
+            fails the checksum.
+    """
+    c = read_columns(path)
+    products: List[Product] = []
+    append = products.append
+    for code, product_id, name, quantity, price, expiry, warranty, author, pages in zip(
+        c["category"], c["product_id"], c["product_name"], c["quantity"], c["price"],
+        c["expiry_date"], c["warranty_period"], c["author"], c["pages"],
+    ):
+        model = _MODELS[code]
+        if model is FoodProduct:
+            append(model.model_construct(
+                product_id=product_id, product_name=name, quantity=quantity, price=price,
+                expiry_date=date.fromordinal(expiry) if expiry else None,
+            ))
+        elif model is ElectronicProduct:
+            append(model.model_construct(
+                product_id=product_id, product_name=name, quantity=quantity, price=price,
+                warranty_period=None if warranty < 0 else warranty,
+            ))
+        elif model is BookProduct:
+            append(model.model_construct(
+                product_id=product_id, product_name=name, quantity=quantity, price=price,
+                author=author or None, pages=None if pages < 0 else pages,
+            ))
+        else:
+            append(model.model_construct(product_id=product_id, product_name=name, quantity=quantity, price=price))
+    return products
@@ -1,12 +1,198 @@
+import atexit
+import json
+import os
+import queue
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Dict, List, Optional, Type, Union
 from pydantic import ValidationError
 
+ErrorLike = Union[ValidationError, ValueError, str]
 
-def log_validation_error(row_num: int, error: ValidationError) -> None:
+
+class BufferedErrorLog:
+    """Error sink that batches validation errors and writes them from a background thread.
+
+    Errors go into a bounded in-memory queue (callers block when it is full) and a
+    writer thread appends them to a single open file in batches, so dirty feeds no
+    longer pay an open/close pair per bad row. Use as a context manager, or call
+    `close()` when loading is finished.
+
+    If the writer fails (e.g. an OSError on a full disk), it keeps draining the
+    queue so producers never block, and the error is re-raised from the next
+    `log`, `flush` or `close`.
+
+    Args:
+        path (Union[str, Path]): Log file, opened in append mode. Defaults to "errors.log".
+        jsonl (bool): Write one JSON object per line instead of plain text. Defaults to False.
+        max_pending (int): Maximum number of queued errors. Defaults to 10000.
+        batch_size (int): Maximum number of errors written per batch. Defaults to 1000.
+        flush_interval (float): Seconds the writer waits for more errors before
+            flushing the file. Defaults to 1.0.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: Union[str, Path] = "errors.log",
+        jsonl: bool = False,
+        max_pending: int = 10_000,
+        batch_size: int = 1_000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path)
+        self.jsonl = jsonl
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_pending)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._closed = False
+        self._failure: Optional[BaseException] = None
+        self._writer = threading.Thread(target=self._run, name="error-log-writer", daemon=True)
+        self._writer.start()
+
+    def log(self, row_num: int, error: ErrorLike) -> None:
+        """Queue a validation error for writing.
+
+        Args:
+            row_num (int): Row number in the CSV where the error occurred.
+            error (ErrorLike): Validation error or its message.
+        """
+        if self._closed:
+            raise ValueError("BufferedErrorLog is closed")
+        self._raise_failure()
+        self._put((row_num, error))
+
+    def _put(self, item: object) -> None:
+        """Queue `item`, waiting for space only while the writer is alive."""
+        while True:
+            try:
+                self._queue.put(item, timeout=self.flush_interval)
+                return
+            except queue.Full:
+                self._raise_failure()
+                if not self._writer.is_alive():
+                    raise RuntimeError("BufferedErrorLog writer thread has stopped")
+
+    def _raise_failure(self) -> None:
+        if self._failure is not None:
+            raise RuntimeError(f"Writing to {self.path} failed") from self._failure
+
+    def flush(self) -> None:
+        """Block until every queued error has been written to disk.
+
+        Raises:
+            RuntimeError: If the writer failed to write an error.
+        """
+        self._queue.join()
+        self._raise_failure()
+
+    def close(self) -> None:
+        """Write pending errors, stop the writer thread and close the file.
+
+        Raises:
+            RuntimeError: If the writer failed to write an error.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer.is_alive():
+            self._put(self._STOP)
+            self._writer.join()
+        self._file.close()
+        self._raise_failure()
+
+    def __enter__(self) -> "BufferedErrorLog":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _format(self, row_num: int, error: ErrorLike) -> str:
+        if not self.jsonl:
+            return f"Row {row_num}: {error}\n"
+        record = {"row": row_num, "error": str(error)}
+        if isinstance(error, ValidationError):
+            record["details"] = error.errors(include_url=False)
+        return json.dumps(record, default=str) + "\n"
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch: List[object] = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = any(item is self._STOP for item in batch)
+            try:
+                # After a failure keep draining, so producers see the error instead of blocking.
+                if self._failure is None:
+                    lines = [self._format(*item) for item in batch if item is not self._STOP]
+                    self._file.writelines(lines)
+                    self._file.flush()
+            except BaseException as exc:
+                self._failure = exc
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+#: Shared buffered logs used when no sink is passed, keyed by absolute path.
+_default_logs: Dict[str, BufferedErrorLog] = {}
+_default_logs_lock = threading.Lock()
+
+
+def default_error_log(path: Union[str, Path] = "errors.log") -> BufferedErrorLog:
+    """Return the process-wide buffered log for `path`, opening it on first use.
+
+    The log is closed (and pending errors written) at interpreter exit.
+    """
+    key = os.path.abspath(path)
+    error_log = _default_logs.get(key)
+    if error_log is None:
+        with _default_logs_lock:
+            error_log = _default_logs.get(key)
+            if error_log is None:
+                error_log = _default_logs[key] = BufferedErrorLog(key)
+    return error_log
+
+
+@atexit.register
+def close_default_error_logs() -> None:
+    """Write out and close every log opened by `default_error_log`."""
+    with _default_logs_lock:
+        logs = list(_default_logs.values())
+        _default_logs.clear()
+    for error_log in logs:
+        error_log.close()
+
+
+def log_validation_error(
+    row_num: int, error: ErrorLike, error_log: Optional[BufferedErrorLog] = None
+) -> None:
     """Log the validation error to an error log file.
 
     Args:
         row_num (int): Row number in the CSV where the error occurred.
-        error (ValidationError): Pydantic validation error.
+        error (ErrorLike): Validation error or its message.
+        error_log (Optional[BufferedErrorLog]): Buffered sink to queue the error on.
+            When omitted the error goes to the shared buffered log for "errors.log"
+            in the working directory (see `default_error_log`).
     """
-    with open("errors.log", "a") as f:
-        f.write(f"Row {row_num}: {error}\n")
+    if error_log is None:
+        error_log = default_error_log()
+    error_log.log(row_num, error)
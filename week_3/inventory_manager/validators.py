@@ -0,0 +1,65 @@
+# week_3/inventory_manager/validators.py
+
+from typing import Annotated, Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+from pydantic import Discriminator, Tag, TypeAdapter, ValidationError
+from .models import BookProduct, ElectronicProduct, FoodProduct, Product, product_from_row
+
+#: A rejected row as (index in the batch, error raised by the per-row validator).
+BatchError = Tuple[int, Union[ValidationError, ValueError]]
+
+
+def _category_tag(row: Any) -> Optional[str]:
+    """Returns the lower-cased `category` of a raw row, used as the union discriminator."""
+    category = row.get("category") if isinstance(row, dict) else None
+    return category.lower() if isinstance(category, str) else None
+
+
+ProductRow = Annotated[
+    Union[
+        Annotated[FoodProduct, Tag("food")],
+        Annotated[ElectronicProduct, Tag("electronic")],
+        Annotated[BookProduct, Tag("book")],
+    ],
+    Discriminator(_category_tag),
+]
+
+#: Core validator for a whole batch of rows, built once at import time.
+_batch_adapter: TypeAdapter = TypeAdapter(List[ProductRow])
+
+
+def validate_rows(rows: Sequence[Dict[str, Any]]) -> Tuple[List[Product], List[BatchError]]:
+    """
+    Validate a batch of raw rows with a single compiled validator.
+
+    The whole batch is validated in one call, dispatching on `category` inside
+    pydantic-core instead of building each model from Python. If any rows fail, the
+    remaining rows are validated again as one batch and the failing rows are passed
+    through `product_from_row` so their errors match the per-row loader exactly.
+
+    Args:
+        rows (Sequence[Dict[str, Any]]): Raw rows keyed by column name.
+
+    Returns:
+        Tuple[List[Product], List[BatchError]]: Valid products in input order and
+            the rejected rows with their errors.
+    """
+    try:
+        return _batch_adapter.validate_python(rows), []
+    except ValidationError as e:
+        failed: Set[int] = {err["loc"][0] for err in e.errors() if err["loc"]}
+
+    good = [row for i, row in enumerate(rows) if i not in failed]
+    validated = iter(_batch_adapter.validate_python(good) if good else [])
+
+    products: List[Product] = []
+    errors: List[BatchError] = []
+    for i, row in enumerate(rows):
+        if i not in failed:
+            products.append(next(validated))
+            continue
+        try:
+            # The per-row path is authoritative: keep rows it accepts.
+            products.append(product_from_row(row))
+        except (ValidationError, ValueError) as err:
+            errors.append((i, err))
+    return products, errors
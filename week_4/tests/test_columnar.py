@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from inventory_manager.columnar import ColumnarInventory
+from inventory_manager.core import Inventory
+from inventory_manager.models import BookProduct, ElectronicProduct, FoodProduct, Product
+
+
+@pytest.fixture
+def products() -> list:
+    """Returns a small mixed catalog."""
+    return [
+        FoodProduct(product_id="F1", product_name="Apple", quantity=3, price=2.0, expiry_date="2025-12-01"),
+        ElectronicProduct(product_id="E1", product_name="Laptop", quantity=2, price=500.0, warranty_period=2),
+        BookProduct(product_id="B1", product_name="Novel", quantity=12, price=9.5, author="A", pages=100),
+        Product(product_id="P1", product_name="Widget", quantity=0, price=1.0),
+    ]
+
+
+def test_aggregates_match_row_inventory(products: list) -> None:
+    """Test columnar aggregates equal the ones computed over models."""
+    columns = ColumnarInventory.from_products(products)
+
+    assert len(columns) == 4
+    assert columns.total_quantity() == 17
+    assert columns.total_value() == pytest.approx(sum(p.get_total_value() for p in products))
+    assert columns.product_names[columns.highest_sale_index()] == "Laptop"
+    assert columns.low_stock_indices(3) == [1, 3]
+    assert [columns.category_of(i) for i in range(4)] == ["food", "electronic", "book", ""]
+
+
+def test_empty_columnar_inventory() -> None:
+    """Test aggregates on an empty inventory."""
+    columns = ColumnarInventory()
+    assert columns.total_quantity() == 0
+    assert columns.total_value() == 0
+    assert columns.highest_sale_index() is None
+    assert columns.low_stock_indices(10) == []
+
+
+def test_dashboard_and_report_match_row_inventory(products: list, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test the columnar dashboard and report print the same text as Inventory."""
+    inventory = Inventory()
+    inventory.products = list(products)
+    columns = ColumnarInventory.from_products(products)
+
+    inventory.print_summary_dashboard()
+    expected = capsys.readouterr().out
+    columns.print_summary_dashboard()
+    assert capsys.readouterr().out == expected
+
+    inventory.generate_low_stock_report(tmp_path / "rows.txt", threshold=5)
+    columns.generate_low_stock_report(tmp_path / "cols.txt", threshold=5)
+    assert (tmp_path / "cols.txt").read_text() == (tmp_path / "rows.txt").read_text()
+
+
+def test_from_csv(tmp_path: Path) -> None:
+    """Test streaming a CSV file straight into columns."""
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(
+        "product_id,product_name,quantity,price,category,expiry_date,warranty_period,author\n"
+        "F1,Apple,10,1.2,food,2025-12-01,,\n"
+        "E1,Laptop,2,500.0,electronic,,2,\n"
+    )
+    columns = ColumnarInventory.from_csv(csv_path, batch_size=1)
+    assert columns.product_ids == ["F1", "E1"]
+    assert columns.total_quantity() == 12
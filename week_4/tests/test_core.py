@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch, mock_open
 from inventory_manager.core import Inventory
-from inventory_manager.models import FoodProduct, ElectronicProduct
+from inventory_manager.models import FoodProduct, ElectronicProduct, Product
 from pathlib import Path
 
 MOCK_CSV_DATA = """product_id,product_name,quantity,price,category,expiry_date,warranty_period,author
@@ -70,3 +70,174 @@ def test_print_summary_dashboard_no_sales(capsys: pytest.CaptureFixture) -> None
     inventory.print_summary_dashboard()
     captured = capsys.readouterr()
     assert "Highest Sale Product" in captured.out
+
+
+def test_stream_from_csv_yields_fixed_size_batches(tmp_path: Path) -> None:
+    """Test streaming hands each batch to the callback without keeping products."""
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(MOCK_CSV_DATA + "F2,Pear,4,1.5,food,2025-12-02,,\nF3,Plum,6,0.9,food,2025-12-03,,\n")
+    inventory = Inventory()
+    batches = []
+    total = inventory.stream_from_csv(csv_path, batch_size=2, on_batch=batches.append)
+
+    assert total == 4
+    assert [len(b) for b in batches] == [2, 2]
+    assert batches[1][1].product_id == "F3"
+    assert inventory.products == []
+
+
+def test_stream_from_csv_without_callback_extends_inventory(tmp_path: Path) -> None:
+    """Test streaming without a callback appends every batch to the inventory."""
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(MOCK_CSV_DATA)
+    inventory = Inventory()
+    assert inventory.stream_from_csv(csv_path, batch_size=1) == 2
+    assert [p.product_id for p in inventory.products] == ["F1", "E1"]
+
+
+def test_stream_from_csv_rejects_invalid_batch_size(tmp_path: Path) -> None:
+    """Test a non-positive batch size is rejected."""
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(MOCK_CSV_DATA)
+    with pytest.raises(ValueError):
+        Inventory().stream_from_csv(csv_path, batch_size=0)
+
+
+def _food(product_id: str, quantity: int = 1) -> FoodProduct:
+    """Build a food product for index tests."""
+    return FoodProduct(product_id=product_id, product_name=f"Item {product_id}", quantity=quantity, price=1.0, expiry_date="2025-12-01")
+
+
+def test_upsert_get_and_remove_maintain_index() -> None:
+    """Test point lookups and mutations keep the id index consistent."""
+    inventory = Inventory()
+    assert inventory.upsert(_food("A")) is True
+    assert inventory.upsert(_food("B")) is True
+    assert inventory.upsert(_food("A", quantity=9)) is False
+
+    assert len(inventory) == 2
+    assert inventory.get("A").quantity == 9
+    assert inventory.get("missing") is None
+
+    assert inventory.remove("A").product_id == "A"
+    assert inventory.remove("A") is None
+    assert "A" not in inventory
+    assert inventory.get("B") is inventory.products[0]
+
+
+def test_bulk_upsert_and_products_setter_deduplicate() -> None:
+    """Test duplicate ids replace earlier products instead of coexisting."""
+    inventory = Inventory()
+    assert inventory.bulk_upsert([_food("A"), _food("B"), _food("A", quantity=4)]) == (2, 1)
+    assert [p.product_id for p in inventory.products] == ["A", "B"]
+
+    inventory.products = [_food("C"), _food("C", quantity=7)]
+    assert len(inventory) == 1
+    assert inventory.get("C").quantity == 7
+    assert inventory.get("A") is None
+
+
+def test_quantity_and_value_index_queries() -> None:
+    """Test threshold, range and top-k queries follow mutations."""
+    inventory = Inventory()
+    inventory.bulk_upsert([_food("A", 5), _food("B", 1), _food("C", 9), _food("D", 3)])
+
+    assert [p.product_id for p in inventory.below_quantity(5)] == ["B", "D"]
+    assert [p.product_id for p in inventory.quantity_range(3, 5)] == ["D", "A"]
+    assert [p.product_id for p in inventory.top_by_value(2)] == ["C", "A"]
+
+    inventory.upsert(_food("C", 0))
+    inventory.remove("B")
+    assert [p.product_id for p in inventory.below_quantity(5)] == ["C", "D"]
+    assert [p.product_id for p in inventory.quantity_range(low=4)] == ["A"]
+    assert [p.product_id for p in inventory.top_by_value(10)] == ["A", "D", "C"]
+
+
+def test_summary_tracks_mutations_incrementally() -> None:
+    """Test running aggregates follow upserts and removals."""
+    inventory = Inventory()
+    assert inventory.summary().total_products == 0
+    assert inventory.summary().highest_sale is None
+
+    inventory.bulk_upsert([
+        _food("A", 5),
+        ElectronicProduct(product_id="E1", product_name="Laptop", quantity=2, price=500.0, warranty_period=2),
+    ])
+    inventory.upsert(_food("A", 8))
+    summary = inventory.summary()
+    assert (summary.total_products, summary.total_quantity) == (2, 10)
+    assert summary.total_value == pytest.approx(1008.0)
+    assert summary.highest_sale.product_id == "E1"
+    assert summary.categories["food"].quantity == 8
+
+    inventory.remove("E1")
+    summary = inventory.summary()
+    assert summary.highest_sale.product_id == "A"
+    assert set(summary.categories) == {"food"}
+    assert summary.total_value == pytest.approx(8.0)
+
+
+def test_summary_totals_do_not_drift_over_many_mutations() -> None:
+    """Test running value totals match a fresh sum after many upserts and removals."""
+    import random
+
+    rng = random.Random(3)
+    inventory = Inventory()
+    for _ in range(20_000):
+        pid = f"P{rng.randrange(200)}"
+        if pid in inventory and rng.random() < 0.3:
+            inventory.remove(pid)
+        else:
+            price = rng.choice([0.1, 0.07, 19.99, 3.3, 1234.56])
+            inventory.upsert(Product(product_id=pid, product_name="x", quantity=rng.randrange(1, 500), price=price))
+
+    summary = inventory.summary()
+    expected = sum(round(p.get_total_value() * 100) for p in inventory.products) / 100
+    assert summary.total_value == expected
+    assert summary.categories["generic"].value == expected
+    for pid in [p.product_id for p in inventory.products][1:]:
+        inventory.remove(pid)
+    assert inventory.summary().total_value == round(inventory.products[0].get_total_value(), 2)
+
+
+def test_sorted_index_matches_a_sorted_list_across_block_splits() -> None:
+    """Test block splits, merges and removals keep the index in sorted order."""
+    import random
+    from inventory_manager.indexes import SortedIndex
+
+    rng = random.Random(7)
+    index = SortedIndex()
+    expected = set()
+    for i in range(3000):
+        entry = (rng.randrange(200), f"P{i}")
+        index.add(*entry)
+        expected.add(entry)
+    for i in range(4000):
+        if expected and rng.random() < 0.5:
+            entry = rng.choice(sorted(expected)) if i % 100 == 0 else next(iter(expected))
+            index.discard(*entry)
+            expected.discard(entry)
+        else:
+            entry = (rng.randrange(200), f"Q{i}")
+            index.add(*entry)
+            expected.add(entry)
+    index.discard(999, "missing")
+
+    ordered = sorted(expected)
+    assert len(index) == len(ordered)
+    assert index.below(50) == [pid for key, pid in ordered if key < 50]
+    assert index.between(20, 120) == [pid for key, pid in ordered if 20 <= key <= 120]
+    assert index.between() == [pid for _, pid in ordered]
+    assert index.largest(5) == [pid for _, pid in reversed(ordered[-5:])]
+    assert index.max() == ordered[-1]
+
+
+def test_summary_does_not_settle_the_value_index() -> None:
+    """Test summary reads the highest value without merging buffered index inserts."""
+    inventory = Inventory()
+    inventory.bulk_upsert(_food(f"P{i}", i) for i in range(100))
+    assert inventory.summary().highest_sale.product_id == "P99"
+    assert len(inventory._value_index._pending) == 100
+
+    inventory.remove("P99")
+    assert inventory.summary().highest_sale.product_id == "P98"
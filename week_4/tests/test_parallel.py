@@ -0,0 +1,82 @@
+import re
+from pathlib import Path
+
+from inventory_manager.core import Inventory
+from inventory_manager.parallel import split_csv_shards, validate_csv_parallel
+
+HEADER = "product_id,product_name,quantity,price,category,expiry_date,warranty_period,author,pages\n"
+
+
+def _write_feed(tmp_path: Path, rows: int) -> Path:
+    """Write a feed where every fifth row has a negative quantity."""
+    lines = [HEADER]
+    for i in range(rows):
+        quantity = -1 if i % 5 == 4 else i
+        lines.append(f"F{i},Item {i},{quantity},1.5,food,2025-12-01,,,\n")
+    path = tmp_path / "feed.csv"
+    path.write_text("".join(lines))
+    return path
+
+
+def test_split_csv_shards_are_contiguous_and_line_aligned(tmp_path: Path) -> None:
+    """Test shards cover the data section exactly and start on line boundaries."""
+    path = _write_feed(tmp_path, 50)
+    data = path.read_bytes()
+    shards = split_csv_shards(path, 4)
+
+    assert shards[0][0] == len(HEADER)
+    assert shards[-1][1] == len(data)
+    for (_, end), (start, _) in zip(shards, shards[1:]):
+        assert end == start
+        assert data[start - 1:start] == b"\n"
+
+
+def test_validate_csv_parallel_matches_serial_order(tmp_path: Path) -> None:
+    """Test parallel validation keeps file order and reports CSV line numbers."""
+    path = _write_feed(tmp_path, 40)
+    products, errors = validate_csv_parallel(path, workers=3)
+
+    serial = Inventory()
+    serial.stream_from_csv(path)
+    assert [p.product_id for p in products] == [p.product_id for p in serial.products]
+    assert [row for row, _ in errors] == [i + 2 for i in range(40) if i % 5 == 4]
+
+
+def test_validate_csv_parallel_empty_file(tmp_path: Path) -> None:
+    """Test a header-only file yields no products and no errors."""
+    path = tmp_path / "empty.csv"
+    path.write_text(HEADER)
+    assert validate_csv_parallel(path, workers=2) == ([], [])
+
+
+def test_load_from_csv_with_workers(tmp_path: Path) -> None:
+    """Test Inventory.load_from_csv uses the process pool when workers > 1."""
+    path = _write_feed(tmp_path, 10)
+    inventory = Inventory()
+    inventory.load_from_csv(path, workers=2)
+    assert len(inventory.products) == 8
+
+
+def test_parallel_and_serial_error_rows_agree_with_blank_lines(tmp_path: Path) -> None:
+    """Test blank lines shift parallel error line numbers exactly like the serial loader."""
+    from inventory_manager.utils import BufferedErrorLog
+
+    lines = [HEADER]
+    for i in range(30):
+        quantity = -1 if i % 4 == 3 else i
+        lines.append(f"F{i},Item {i},{quantity},1.5,food,2025-12-01,,,\n")
+        if i % 7 == 0:
+            lines.append("\n")
+    path = tmp_path / "feed.csv"
+    path.write_text("".join(lines))
+
+    serial_log = tmp_path / "serial.log"
+    with BufferedErrorLog(serial_log) as error_log:
+        Inventory().load_from_csv(path, error_log=error_log)
+    serial_rows = [int(n) for n in re.findall(r"^Row (\d+):", serial_log.read_text(), re.MULTILINE)]
+
+    for workers in (2, 3, 5):
+        _, errors = validate_csv_parallel(path, workers=workers)
+        assert [row for row, _ in errors] == serial_rows
+    expected = [n for n, line in enumerate(lines, start=1) if ",-1," in line]
+    assert serial_rows == expected
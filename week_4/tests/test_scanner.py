@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from inventory_manager.scanner import scan_csv, scan_low_stock
+
+CSV_DATA = (
+    "product_id,product_name,quantity,price,category\r\n"
+    "F1,Apple,10,1.2,food\r\n"
+    "E1,\"Laptop, 15\"\"\",2,500.0,electronic\r\n"
+    "B1,Book,abc,9.99,book\r\n"
+    "\r\n"
+    "B2,Short,1\r\n"
+    "B3,Tail,4,3.0,book"
+)
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    """Writes the sample CSV with CRLF endings, a quoted row and a short row."""
+    path = tmp_path / "products.csv"
+    path.write_bytes(CSV_DATA.encode("utf-8"))
+    return path
+
+
+def test_scan_csv_projects_requested_columns(csv_path: Path) -> None:
+    """Test only the requested columns are returned, in the requested order."""
+    rows = list(scan_csv(csv_path, ["price", "product_name"]))
+    assert rows == [
+        ("1.2", "Apple"),
+        ("500.0", 'Laptop, 15"'),
+        ("9.99", "Book"),
+        ("", "Short"),
+        ("3.0", "Tail"),
+    ]
+
+
+def test_scan_csv_applies_predicates(csv_path: Path) -> None:
+    """Test numeric and string predicates are pushed down into the scan."""
+    assert list(scan_csv(csv_path, ["product_id"], [("quantity", "<", 5)])) == [("E1",), ("B2",), ("B3",)]
+    assert list(scan_csv(csv_path, ["product_id"], [("category", "==", "book"), ("price", ">", 5)])) == [("B1",)]
+    with pytest.raises(ValueError):
+        list(scan_csv(csv_path, ["product_id"], [("quantity", "~", 1)]))
+    with pytest.raises(ValueError):
+        list(scan_csv(csv_path, ["missing"]))
+
+
+def test_scan_low_stock(csv_path: Path, tmp_path: Path) -> None:
+    """Test the low-stock helper and an empty file."""
+    assert scan_low_stock(csv_path, threshold=3) == [("E1", 2), ("B2", 1)]
+    empty = tmp_path / "empty.csv"
+    empty.write_text("")
+    assert scan_low_stock(empty) == []
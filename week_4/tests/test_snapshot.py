@@ -0,0 +1,68 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from inventory_manager.core import Inventory
+from inventory_manager.models import BookProduct, ElectronicProduct, FoodProduct, Product
+from inventory_manager.snapshot import read_snapshot, write_snapshot
+
+
+@pytest.fixture
+def inventory() -> Inventory:
+    """Returns an inventory with one product of every model."""
+    inventory = Inventory()
+    inventory.bulk_upsert([
+        FoodProduct(product_id="F1", product_name="Äpfel", quantity=3, price=2.0, expiry_date=date(2025, 12, 1)),
+        ElectronicProduct(product_id="E1", product_name="Laptop", quantity=2, price=500.0, warranty_period=0),
+        BookProduct(product_id="B1", product_name="Novel", quantity=12, price=9.5, author="A", pages=100),
+        Product(product_id="P1", product_name="Widget", quantity=0, price=1.0),
+    ])
+    return inventory
+
+
+def test_snapshot_round_trip(inventory: Inventory, tmp_path: Path) -> None:
+    """Test products, their types and the indexes survive save and restore."""
+    path = tmp_path / "inventory.snap"
+    inventory.save_snapshot(path)
+    restored = Inventory.load_snapshot(path)
+
+    assert [type(p) for p in restored.products] == [type(p) for p in inventory.products]
+    assert [p.model_dump() for p in restored.products] == [p.model_dump() for p in inventory.products]
+    assert restored.summary() == inventory.summary()
+    assert [p.product_id for p in restored.below_quantity(3)] == ["P1", "E1"]
+
+
+def test_empty_snapshot(tmp_path: Path) -> None:
+    """Test an empty inventory round-trips."""
+    path = tmp_path / "empty.snap"
+    write_snapshot([], path)
+    assert read_snapshot(path) == []
+
+
+def test_snapshot_rejects_corruption(inventory: Inventory, tmp_path: Path) -> None:
+    """Test a flipped body byte fails the checksum and a foreign file is rejected."""
+    path = tmp_path / "inventory.snap"
+    inventory.save_snapshot(path)
+    data = bytearray(path.read_bytes())
+    data[-9] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="checksum"):
+        read_snapshot(path)
+
+    path.write_bytes(b"product_id,product_name\n")
+    with pytest.raises(ValueError, match="not an inventory snapshot"):
+        read_snapshot(path)
+
+
+def test_columnar_inventory_from_snapshot(inventory: Inventory, tmp_path: Path) -> None:
+    """Test a snapshot restores straight into columns."""
+    from inventory_manager.columnar import ColumnarInventory
+
+    path = tmp_path / "inventory.snap"
+    inventory.save_snapshot(path)
+    columns = ColumnarInventory.from_snapshot(path)
+
+    assert columns.product_ids == ["F1", "E1", "B1", "P1"]
+    assert [columns.category_of(i) for i in range(4)] == ["food", "electronic", "book", ""]
+    assert columns.total_value() == pytest.approx(inventory.summary().total_value)
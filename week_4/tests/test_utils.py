@@ -0,0 +1,95 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from inventory_manager.core import Inventory
+from inventory_manager.models import Product
+from inventory_manager.utils import BufferedErrorLog, log_validation_error
+
+
+def _validation_error() -> ValidationError:
+    """Returns a real Pydantic validation error."""
+    with pytest.raises(ValidationError) as exc_info:
+        Product(product_id="X", product_name="Bad", quantity=-1, price=1.0)
+    return exc_info.value
+
+
+def test_buffered_error_log_writes_text_lines(tmp_path: Path) -> None:
+    """Test queued errors are written in order once the sink is closed."""
+    path = tmp_path / "errors.log"
+    with BufferedErrorLog(path, batch_size=2) as error_log:
+        for row in range(2, 7):
+            error_log.log(row, f"bad row {row}")
+
+    lines = path.read_text().splitlines()
+    assert lines == [f"Row {row}: bad row {row}" for row in range(2, 7)]
+
+
+def test_buffered_error_log_jsonl_and_flush(tmp_path: Path) -> None:
+    """Test JSONL records keep the row number and structured details."""
+    path = tmp_path / "errors.jsonl"
+    error_log = BufferedErrorLog(path, jsonl=True)
+    log_validation_error(4, _validation_error(), error_log)
+    error_log.flush()
+
+    record = json.loads(path.read_text())
+    assert record["row"] == 4
+    assert record["details"][0]["loc"] == ["quantity"]
+
+    error_log.close()
+    with pytest.raises(ValueError):
+        error_log.log(5, "after close")
+
+
+def test_load_from_csv_routes_errors_to_sink(tmp_path: Path) -> None:
+    """Test loaders report invalid rows with their CSV line number."""
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(
+        "product_id,product_name,quantity,price,category,expiry_date\n"
+        "F1,Apple,10,1.2,food,2025-12-01\n"
+        "F2,Pear,-3,1.2,food,2025-12-01\n"
+    )
+    log_path = tmp_path / "errors.log"
+    with BufferedErrorLog(log_path) as error_log:
+        Inventory().load_from_csv(csv_path, error_log=error_log)
+
+    assert log_path.read_text().startswith("Row 3: ")
+
+
+def test_buffered_error_log_surfaces_writer_failures(tmp_path: Path) -> None:
+    """Test a failing writer raises in the producer instead of leaving it blocked."""
+
+    class _FullDisk:
+        def writelines(self, lines) -> None:
+            raise OSError("No space left on device")
+
+        def flush(self) -> None:
+            pass
+
+        def close(self) -> None:
+            pass
+
+    error_log = BufferedErrorLog(tmp_path / "errors.log", max_pending=2, batch_size=1, flush_interval=0.05)
+    error_log._file.close()
+    error_log._file = _FullDisk()
+    with pytest.raises(RuntimeError) as exc_info:
+        for row in range(1000):
+            error_log.log(row, "bad")
+    assert isinstance(exc_info.value.__cause__, OSError)
+    with pytest.raises(RuntimeError):
+        error_log.close()
+
+
+def test_log_validation_error_defaults_to_shared_buffered_log(tmp_path: Path, monkeypatch) -> None:
+    """Test the default path reuses one buffered log per file instead of reopening it."""
+    from inventory_manager.utils import close_default_error_logs, default_error_log
+
+    monkeypatch.chdir(tmp_path)
+    log_validation_error(2, "first")
+    log_validation_error(3, "second")
+    assert default_error_log() is default_error_log("errors.log")
+    close_default_error_logs()
+
+    assert (tmp_path / "errors.log").read_text().splitlines() == ["Row 2: first", "Row 3: second"]
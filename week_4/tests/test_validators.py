@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from inventory_manager.core import Inventory
+from inventory_manager.models import BookProduct, ElectronicProduct, FoodProduct
+from inventory_manager.validators import validate_rows
+
+
+def test_validate_rows_dispatches_on_category() -> None:
+    """Test a clean batch validates into the category-specific models."""
+    rows = [
+        {"product_id": "F1", "product_name": "Apple", "quantity": "3", "price": "1.0", "category": "food", "expiry_date": "2025-12-01"},
+        {"product_id": "E1", "product_name": "Phone", "quantity": "1", "price": "99", "category": "Electronic", "warranty_period": "12"},
+        {"product_id": "B1", "product_name": "Novel", "quantity": "2", "price": "5", "category": "book", "author": "A", "pages": "10"},
+    ]
+    products, errors = validate_rows(rows)
+
+    assert errors == []
+    assert [type(p) for p in products] == [FoodProduct, ElectronicProduct, BookProduct]
+
+
+def test_validate_rows_reports_failures_by_index() -> None:
+    """Test bad rows are reported with the same errors as the per-row path."""
+    rows = [
+        {"product_id": "F1", "product_name": "Apple", "quantity": "3", "price": "1.0", "category": "food", "expiry_date": "2025-12-01"},
+        {"product_id": "F2", "product_name": "Pear", "quantity": "1", "price": "1.0", "category": "food"},
+        {"product_id": "X1", "product_name": "Thing", "quantity": "1", "price": "1.0", "category": "toy"},
+        {"product_id": "B1", "product_name": "Novel", "quantity": "2", "price": "5", "category": "book", "author": "A", "pages": "10"},
+    ]
+    products, errors = validate_rows(rows)
+
+    assert [p.product_id for p in products] == ["F1", "B1"]
+    assert [index for index, _ in errors] == [1, 2]
+    assert isinstance(errors[0][1], ValidationError)
+    assert "expiry_date" in str(errors[0][1])
+    assert "Unknown category 'toy'" in str(errors[1][1])
+
+
+def test_validate_rows_keeps_rows_the_per_row_path_accepts(monkeypatch) -> None:
+    """Test a row rejected by the batch validator but accepted on retry is returned in order."""
+    from inventory_manager import validators
+
+    rows = [
+        {"product_id": "F1", "product_name": "Apple", "quantity": "3", "price": "1.0", "category": "food", "expiry_date": "2025-12-01"},
+        {"product_id": "X1", "product_name": "Thing", "quantity": "1", "price": "1.0", "category": "toy"},
+        {"product_id": "B1", "product_name": "Novel", "quantity": "2", "price": "5", "category": "book", "author": "A", "pages": "10"},
+    ]
+    lenient = FoodProduct(product_id="X1", product_name="Thing", quantity=1, price=1.0, expiry_date="2030-01-01")
+    monkeypatch.setattr(validators, "product_from_row", lambda row: lenient)
+
+    products, errors = validate_rows(rows)
+
+    assert [p.product_id for p in products] == ["F1", "X1", "B1"]
+    assert errors == []
+
+
+def test_stream_from_csv_fast_validation_matches_default(tmp_path: Path) -> None:
+    """Test the compiled fast path loads the same products as the default path."""
+    csv_path = tmp_path / "feed.csv"
+    csv_path.write_text(
+        "product_id,product_name,quantity,price,category,expiry_date,warranty_period,author,pages\n"
+        "F1,Apple,10,1.2,food,2025-12-01,,,\n"
+        "E1,Laptop,2,500.0,electronic,,2,,\n"
+        "B1,Book,-1,0.0,book,,,John Doe,3\n"
+        "B2,Book 2,4,8.0,book,,,Jane Doe,30\n"
+    )
+    default, fast = Inventory(), Inventory()
+    default.stream_from_csv(csv_path)
+    fast.stream_from_csv(csv_path, batch_size=2, fast_validation=True)
+
+    assert fast.products == default.products
+    assert [p.product_id for p in fast.products] == ["F1", "E1", "B2"]
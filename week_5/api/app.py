@@ -15,6 +15,13 @@ def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
         config (Optional[Dict[str, Any]]): Optional dictionary of configuration values.
             Supported keys:
               - "DATA_CSV": str → path to the products CSV file.
+              - "STORE_COMPACT_AFTER": int → pending changes before the journal
+                is compacted into the CSV.
+              - "STORE_COMPACT_INTERVAL": float → maximum seconds pending changes
+                wait for a background compaction.
+              - "STORE_FSYNC_EVERY": int → journal records written between fsyncs.
+              - "STORE_FSYNC_INTERVAL": float → maximum seconds an appended record
+                waits for fsync.
 
     Returns:
         Flask: The configured Flask application instance.
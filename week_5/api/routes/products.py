@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import csv
+import hashlib
+from bisect import bisect_right
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Type, Tuple
+from urllib.parse import urlencode
 
 from flask import Blueprint, current_app, jsonify, request, Response
-from pydantic import ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from ..store import CSV_FIELDS, ProductStore, get_product_store
 
 try:
     from inventory_manager.models import Product, FoodProduct, ElectronicProduct, BookProduct
@@ -14,36 +18,150 @@ except Exception:
 
 api_bp: Blueprint = Blueprint("api", __name__, url_prefix="/api")
 
-CSV_FIELDS: List[str] = [
-    "product_id",
-    "product_name",
-    "quantity",
-    "price",
-    "type",
-    "expiry_date",
-    "warranty_period",
-    "author",
-    "pages",
-]
+MAX_PAGE_SIZE: int = 1000
+
+
+class ProductListQuery(BaseModel):
+    """
+    Query parameters accepted by GET /api/products.
+
+    `after` is the keyset cursor: the last product_id of the previous page, as
+    returned in the X-Next-Cursor header. Paginated listings are ordered by product_id.
+    """
+
+    after: Optional[str] = None
+    limit: Optional[int] = Field(None, ge=1, le=MAX_PAGE_SIZE)
+    fields: Optional[List[str]] = None
+    type: Optional[str] = None
+    min_quantity: Optional[int] = None
+    max_quantity: Optional[int] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: Any) -> Any:
+        """Accept `fields` as a comma-separated string of CSV columns."""
+        if isinstance(value, str):
+            value = [name.strip() for name in value.split(",") if name.strip()]
+        unknown: List[str] = [name for name in value or () if name not in CSV_FIELDS or name == "type"]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return value
+
+    @field_validator("type")
+    @classmethod
+    def normalize_type(cls, value: Optional[str]) -> Optional[str]:
+        """Compare product types case-insensitively."""
+        return value.strip().lower() if value is not None else None
+
+    @property
+    def paginated(self) -> bool:
+        return self.limit is not None or self.after is not None
+
+    @property
+    def filtered(self) -> bool:
+        return any(
+            v is not None
+            for v in (self.type, self.min_quantity, self.max_quantity, self.min_price, self.max_price)
+        )
 
 
 def _csv_path_from_app() -> Path:
     return Path(current_app.config["DATA_CSV"])
 
 
-def _read_all_rows(csv_path: Path) -> List[Dict[str, str]]:
-    if not csv_path.exists():
-        return []
-    with csv_path.open("r", newline="", encoding="utf-8") as fh:
-        return list(csv.DictReader(fh))
-
-
-def _write_all_rows(csv_path: Path, rows: List[Dict[str, str]]) -> None:
-    csv_path.parent.mkdir(parents=True, exist_ok=True)
-    with csv_path.open("w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        writer.writerows(rows)
+def _store_from_app() -> ProductStore:
+    return get_product_store(current_app, _csv_path_from_app())
+
+
+class _CatalogView:
+    """Validated, serialized products for one version of a store."""
+
+    __slots__ = ("store", "version", "products", "types", "body", "etag", "_sorted_ids")
+
+    def __init__(self, store: ProductStore, version: int, rows: List[Dict[str, str]]) -> None:
+        self.store: ProductStore = store
+        self.version: int = version
+        self.products: Dict[str, Dict[str, Any]] = {}
+        self.types: Dict[str, str] = {}
+        for row in rows:
+            model: Optional[Product] = _row_to_model(row)
+            if model is not None:
+                product_id: str = row.get("product_id") or ""
+                self.products[product_id] = model.model_dump()
+                self.types[product_id] = (row.get("type") or "").strip().lower()
+        self.body: bytes = jsonify(list(self.products.values())).get_data()
+        # Hashing the body keeps the tag stable across stores, restarts and workers.
+        self.etag: str = hashlib.sha256(self.body).hexdigest()
+        self._sorted_ids: Optional[List[str]] = None
+
+    @property
+    def sorted_ids(self) -> List[str]:
+        """Product ids in cursor order, sorted on first use."""
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self.products)
+        return self._sorted_ids
+
+    def select(self, query: ProductListQuery) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Apply filters, the cursor and projection to the cached products.
+
+        Args:
+            query (ProductListQuery): Parsed query-string parameters.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The page of products and the
+            cursor for the next page, or None if this is the last one.
+        """
+        if query.paginated:
+            ids: List[str] = self.sorted_ids
+            start: int = bisect_right(ids, query.after) if query.after is not None else 0
+        else:
+            ids, start = list(self.products), 0
+
+        page: List[Dict[str, Any]] = []
+        last_id: Optional[str] = None
+        for index in range(start, len(ids)):
+            product_id: str = ids[index]
+            product: Dict[str, Any] = self.products[product_id]
+            if query.type is not None and self.types[product_id] != query.type:
+                continue
+            if query.min_quantity is not None and product["quantity"] < query.min_quantity:
+                continue
+            if query.max_quantity is not None and product["quantity"] > query.max_quantity:
+                continue
+            if query.min_price is not None and product["price"] < query.min_price:
+                continue
+            if query.max_price is not None and product["price"] > query.max_price:
+                continue
+            if query.limit is not None and len(page) == query.limit:
+                return page, last_id
+            if query.fields:
+                product = {name: product[name] for name in query.fields if name in product}
+            page.append(product)
+            last_id = product_id
+        return page, None
+
+
+def _catalog_view() -> _CatalogView:
+    """
+    Return the cached view of the app's products, rebuilding it if the store changed.
+
+    Rows are validated and the list body serialized once per store version, so
+    repeated reads of an unchanged catalog skip both steps.
+
+    Returns:
+        _CatalogView: View matching the store's current version.
+    """
+    store: ProductStore = _store_from_app()
+    views: Dict[str, _CatalogView] = current_app.extensions.setdefault("product_catalog_views", {})
+    key: str = str(store.csv_path)
+    view: Optional[_CatalogView] = views.get(key)
+    if view is None or view.store is not store or view.version != store.version:
+        view = _CatalogView(store, *store.versioned_rows())
+        views[key] = view
+    return view
 
 
 def _build_model_kwargs_for_type(row: Dict[str, Any], model_cls: Type[Product]) -> Dict[str, Any]:
@@ -110,21 +228,42 @@ def _model_to_csv_row(model: Product, type_value: str) -> Dict[str, str]:
 
 
 @api_bp.route("/products", methods=["GET"])
-def get_products() -> Tuple[Response, int]:
-    csv_path: Path = _csv_path_from_app()
-    rows: List[Dict[str, str]] = _read_all_rows(csv_path)
-    products: List[Dict[str, Any]] = [m.model_dump() for r in rows if (m := _row_to_model(r))]
-    return jsonify(products), 200
+def get_products() -> Response | Tuple[Response, int]:
+    """
+    List products, optionally filtered, projected and paginated.
+
+    Supports `type`, `min_quantity`, `max_quantity`, `min_price`, `max_price`,
+    `fields` and the keyset pair `after`/`limit`. When more products follow a
+    page, the X-Next-Cursor and Link headers give the next cursor. The ETag is a
+    hash of the response body, so it matches across processes serving the same data.
+    """
+    try:
+        query: ProductListQuery = ProductListQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        return jsonify({"error": e.errors(include_url=False, include_context=False)}), 400
+
+    view: _CatalogView = _catalog_view()
+    if query.paginated or query.filtered or query.fields:
+        page, cursor = view.select(query)
+        resp: Response = jsonify(page)
+        if cursor is not None:
+            args: Dict[str, Any] = request.args.to_dict()
+            args["after"] = cursor
+            resp.headers["X-Next-Cursor"] = cursor
+            resp.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+        resp.add_etag()
+    else:
+        resp = current_app.response_class(view.body, mimetype="application/json")
+        resp.set_etag(view.etag)
+    return resp.make_conditional(request)
 
 
 @api_bp.route("/products/<product_id>", methods=["GET"])
 def get_product(product_id: str) -> Tuple[Response, int]:
-    csv_path: Path = _csv_path_from_app()
-    for r in _read_all_rows(csv_path):
-        if (r.get("product_id") or "") == product_id:
-            if (m := _row_to_model(r)):
-                return jsonify(m.model_dump()), 200
-            break
+    row: Optional[Dict[str, str]] = _store_from_app().get(product_id)
+    model: Optional[Product] = _row_to_model(row) if row is not None else None
+    if model is not None:
+        return jsonify(model.model_dump()), 200
     return jsonify({"error": "Product not found"}), 404
 
 
@@ -157,15 +296,9 @@ def create_product() -> Tuple[Response, int]:
         else:
             return jsonify({"error": "Invalid product data"}), 400
 
-    csv_path: Path = _csv_path_from_app()
-    rows: List[Dict[str, str]] = _read_all_rows(csv_path)
-
-    if any((r.get("product_id") or "") == product.product_id for r in rows):
+    if not _store_from_app().add(_model_to_csv_row(product, final_type)):
         return jsonify({"error": "Product with this product_id already exists"}), 409
 
-    rows.append(_model_to_csv_row(product, final_type))
-    _write_all_rows(csv_path, rows)
-
     result: Dict[str, Any] = product.model_dump()
     if requested_type == "book":
         result.setdefault("pages", None)
@@ -184,15 +317,8 @@ def update_product(product_id: str) -> Tuple[Response, int]:
     if not body:
         return jsonify({"error": "Invalid or missing JSON body"}), 400
 
-    csv_path: Path = _csv_path_from_app()
-    rows: List[Dict[str, str]] = _read_all_rows(csv_path)
-
-    existing_row_index: Optional[int] = None
-    for idx, r in enumerate(rows):
-        if (r.get("product_id") or "") == product_id:
-            existing_row_index = idx
-            break
-    if existing_row_index is None:
+    store: ProductStore = _store_from_app()
+    if product_id not in store:
         return jsonify({"error": "Product not found"}), 404
 
     type_value: str = (body.get("type") or "").strip().lower()
@@ -204,19 +330,17 @@ def update_product(product_id: str) -> Tuple[Response, int]:
     except ValidationError as e:
         return jsonify({"error": str(e)}), 400
 
-    rows[existing_row_index] = _model_to_csv_row(product, type_value)
-    _write_all_rows(csv_path, rows)
+    try:
+        replaced: bool = store.replace(product_id, _model_to_csv_row(product, type_value))
+    except ValueError:
+        return jsonify({"error": "Product with this product_id already exists"}), 409
+    if not replaced:
+        return jsonify({"error": "Product not found"}), 404
     return jsonify(product.model_dump()), 200
 
 
 @api_bp.route("/products/<product_id>", methods=["DELETE"])
 def delete_product(product_id: str) -> Tuple[Response, int] | Tuple[str, int]:
-    csv_path: Path = _csv_path_from_app()
-    rows: List[Dict[str, str]] = _read_all_rows(csv_path)
-    new_rows: List[Dict[str, str]] = [r for r in rows if (r.get("product_id") or "") != product_id]
-
-    if len(new_rows) == len(rows):
+    if not _store_from_app().delete(product_id):
         return jsonify({"error": "Product not found"}), 404
-
-    _write_all_rows(csv_path, new_rows)
     return "", 204
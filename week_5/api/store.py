@@ -0,0 +1,516 @@
+"""In-memory product store backed by the products CSV and an append-only journal."""
+from __future__ import annotations
+
+import atexit
+import csv
+import json
+import os
+import struct
+import threading
+import time
+import weakref
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from flask import Flask
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - advisory locks are POSIX-only
+    fcntl = None
+
+CSV_FIELDS: List[str] = [
+    "product_id",
+    "product_name",
+    "quantity",
+    "price",
+    "type",
+    "expiry_date",
+    "warranty_period",
+    "author",
+    "pages",
+]
+
+DEFAULT_COMPACT_AFTER: int = 1000
+DEFAULT_COMPACT_INTERVAL: float = 5.0
+DEFAULT_FSYNC_EVERY: int = 64
+DEFAULT_FSYNC_INTERVAL: float = 0.5
+
+# Journal record header: payload length and CRC32 of the payload.
+_RECORD_HEADER = struct.Struct("<II")
+
+_registry_lock = threading.Lock()
+_open_stores: "weakref.WeakSet[ProductStore]" = weakref.WeakSet()
+
+
+def _read_all_rows(csv_path: Path) -> List[Dict[str, str]]:
+    if not csv_path.exists():
+        return []
+    with csv_path.open("r", newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+def _write_rows_tmp(csv_path: Path, rows: List[Dict[str, str]]) -> Path:
+    """Write rows to a fsynced temporary file next to `csv_path` and return its path."""
+    tmp_path = csv_path.with_name(f"{csv_path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+        fh.flush()
+        os.fsync(fh.fileno())
+    return tmp_path
+
+
+def _fsync_dir(directory: Path) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # directories cannot be opened on every platform
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    """Frame a journal record as length, CRC32 and JSON payload."""
+    payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+    return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def iter_records(data: bytes) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Decode framed journal records.
+
+    Stops at the first truncated or corrupt record, which is what an interrupted
+    append leaves behind.
+
+    Yields:
+        Tuple[Dict[str, Any], int]: Each record and the offset just past it.
+    """
+    pos = 0
+    while pos + _RECORD_HEADER.size <= len(data):
+        length, checksum = _RECORD_HEADER.unpack_from(data, pos)
+        start = pos + _RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            return
+        pos = start + length
+        yield json.loads(payload), pos
+
+
+class ProductStore:
+    """
+    Product rows for one CSV file, held in memory and indexed by product_id.
+
+    The CSV is the base; every mutation is appended as a framed, checksummed record
+    to a journal next to it (``<csv>.journal``) and applied to the in-memory index,
+    so a write costs one small append instead of a full rewrite. Journal appends are
+    fsynced in batches of `fsync_every` records or every `fsync_interval` seconds.
+
+    A background thread compacts the journal into the CSV: the journal is rotated to
+    ``<csv>.journal.1`` so writers continue on a fresh file, the new base is written
+    to a temporary file and atomically renamed over the CSV, and only then is the
+    rotated journal removed. Loading replays both journals over the base, and replay
+    is idempotent, so a crash at any point leaves a consistent catalog.
+
+    Several processes may serve the same CSV. Writers hold an exclusive advisory lock
+    on ``<csv>.lock`` while they catch up and append; readers only take it shared,
+    and only when the files changed since they last looked, in which case they replay
+    the journal tail written by other processes. One compaction runs at a time,
+    guarded by ``<csv>.compact.lock``.
+    """
+
+    def __init__(
+        self,
+        csv_path: Path,
+        compact_after: int = DEFAULT_COMPACT_AFTER,
+        compact_interval: float = DEFAULT_COMPACT_INTERVAL,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+    ) -> None:
+        """
+        Args:
+            csv_path (Path): Products CSV file.
+            compact_after (int): Pending changes that trigger a compaction.
+            compact_interval (float): Maximum seconds pending changes wait for compaction.
+            fsync_every (int): Journal records written between fsyncs.
+            fsync_interval (float): Maximum seconds an appended record waits for fsync.
+        """
+        self.csv_path: Path = csv_path
+        self.journal_path: Path = csv_path.with_name(csv_path.name + ".journal")
+        self.rotated_journal_path: Path = csv_path.with_name(csv_path.name + ".journal.1")
+        self.lock_path: Path = csv_path.with_name(csv_path.name + ".lock")
+        self.compact_lock_path: Path = csv_path.with_name(csv_path.name + ".compact.lock")
+        self.compact_after: int = compact_after
+        self.compact_interval: float = compact_interval
+        self.fsync_every: int = fsync_every
+        self.fsync_interval: float = fsync_interval
+
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._rows: Dict[str, Dict[str, str]] = {}
+        self._version: int = 0
+        self._pending: int = 0
+        self._unsynced: int = 0
+        self._last_compaction: float = time.monotonic()
+        self._csv_signature: Optional[Tuple[int, int]] = None
+        self._rotated_signature: Optional[Tuple[int, int]] = None
+        self._journal_inode: Optional[int] = None
+        self._journal_offset: int = 0
+        self._journal: Optional[BinaryIO] = None
+        self._wake = threading.Event()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_file = self.lock_path.open("a+b")
+        with self._lock, self._file_lock(exclusive=False):
+            self._load()
+        _open_stores.add(self)
+
+    # ----- locking -----
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold the cross-process lock; callers must already hold `_lock`."""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+
+    # ----- loading -----
+
+    def _load(self) -> None:
+        rows: Dict[str, Dict[str, str]] = {}
+        for row in _read_all_rows(self.csv_path):
+            rows.setdefault(row.get("product_id") or "", row)
+        self._rows = rows
+        self._version += 1
+        self._csv_signature = _file_signature(self.csv_path)
+        self._rotated_signature = _file_signature(self.rotated_journal_path)
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._pending = self._replay(self.rotated_journal_path) + self._replay_journal_tail()
+
+    def _replay(self, path: Path, offset: int = 0) -> int:
+        try:
+            with path.open("rb") as fh:
+                fh.seek(offset)
+                data = fh.read()
+        except FileNotFoundError:
+            return 0
+        applied = 0
+        for record, end in iter_records(data):
+            self._apply(record)
+            applied += 1
+            if path == self.journal_path:
+                self._journal_offset = offset + end
+        return applied
+
+    def _replay_journal_tail(self) -> int:
+        try:
+            st = self.journal_path.stat()
+        except FileNotFoundError:
+            return 0
+        if st.st_ino != self._journal_inode:
+            self._journal_inode = st.st_ino
+            self._journal_offset = 0
+        if st.st_size <= self._journal_offset:
+            return 0
+        return self._replay(self.journal_path, self._journal_offset)
+
+    def _journal_stale(self) -> bool:
+        try:
+            st = self.journal_path.stat()
+        except FileNotFoundError:
+            return self._journal_inode is not None
+        return st.st_ino != self._journal_inode or st.st_size != self._journal_offset
+
+    def _is_stale(self) -> bool:
+        return (
+            _file_signature(self.csv_path) != self._csv_signature
+            or _file_signature(self.rotated_journal_path) != self._rotated_signature
+            or self._journal_stale()
+        )
+
+    def _sync_from_disk(self) -> None:
+        """Catch up with changes made by other processes; the file lock must be held."""
+        if (
+            _file_signature(self.csv_path) != self._csv_signature
+            or _file_signature(self.rotated_journal_path) != self._rotated_signature
+        ):
+            self._load()
+            return
+        try:
+            inode = self.journal_path.stat().st_ino
+        except FileNotFoundError:
+            inode = None
+        if self._journal_inode is not None and inode != self._journal_inode:
+            self._load()  # our journal was rotated away by another process's compaction
+        else:
+            self._pending += self._replay_journal_tail()
+
+    def _refresh(self) -> None:
+        if self._is_stale():
+            with self._file_lock(exclusive=False):
+                self._sync_from_disk()
+
+    # ----- reads -----
+
+    def rows(self) -> List[Dict[str, str]]:
+        """Return every row in file order."""
+        with self._lock:
+            self._refresh()
+            return list(self._rows.values())
+
+    def versioned_rows(self) -> Tuple[int, List[Dict[str, str]]]:
+        """
+        Return every row together with the store version they belong to.
+
+        The version changes whenever the rows do, including changes made by other
+        processes, so it can key caches of anything derived from the rows.
+
+        Returns:
+            Tuple[int, List[Dict[str, str]]]: Current version and rows in file order.
+        """
+        with self._lock:
+            self._refresh()
+            return self._version, list(self._rows.values())
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the rows change."""
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def get(self, product_id: str) -> Optional[Dict[str, str]]:
+        """Return the row for `product_id`, or None."""
+        with self._lock:
+            self._refresh()
+            return self._rows.get(product_id)
+
+    def __contains__(self, product_id: object) -> bool:
+        with self._lock:
+            self._refresh()
+            return product_id in self._rows
+
+    # ----- writes -----
+
+    def add(self, row: Dict[str, str]) -> bool:
+        """Append a new row, returning False if its product_id already exists."""
+        product_id = row.get("product_id") or ""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync_from_disk()
+            if product_id in self._rows:
+                return False
+            self._record({"op": "put", "key": product_id, "row": row})
+            return True
+
+    def replace(self, product_id: str, row: Dict[str, str]) -> bool:
+        """
+        Replace the row stored under `product_id`, returning False if it does not exist.
+
+        If the new row carries a different product_id it keeps the old row's position.
+
+        Raises:
+            ValueError: If the new product_id already belongs to another row. Nothing
+                is written in that case.
+        """
+        new_id: str = row.get("product_id") or ""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync_from_disk()
+            if product_id not in self._rows:
+                return False
+            if new_id != product_id and new_id in self._rows:
+                raise ValueError(f"Product with product_id {new_id!r} already exists")
+            self._record({"op": "put", "key": product_id, "row": row})
+            return True
+
+    def delete(self, product_id: str) -> bool:
+        """Delete a row, returning False if it did not exist."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync_from_disk()
+            if product_id not in self._rows:
+                return False
+            self._record({"op": "delete", "key": product_id})
+            return True
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        self._version += 1
+        key: str = record["key"]
+        if record["op"] == "delete":
+            self._rows.pop(key, None)
+            return
+        row: Dict[str, str] = record["row"]
+        new_key = row.get("product_id") or ""
+        if new_key == key or key not in self._rows:
+            self._rows[new_key] = row
+        else:
+            # Writers refuse renames onto another row; drop it explicitly so a
+            # journal written before that check still replays to one row per id.
+            self._rows.pop(new_key, None)
+            self._rows = {(new_key if k == key else k): (row if k == key else v) for k, v in self._rows.items()}
+
+    def _open_journal(self) -> BinaryIO:
+        """Return a handle on the current journal; the exclusive file lock must be held."""
+        if self._journal is not None and self._journal_inode != os.fstat(self._journal.fileno()).st_ino:
+            self._close_journal()  # another process rotated the file we had open
+        if self._journal is None:
+            self._journal = self.journal_path.open("ab")
+            self._journal_inode = os.fstat(self._journal.fileno()).st_ino
+        if os.fstat(self._journal.fileno()).st_size > self._journal_offset:
+            self._journal.truncate(self._journal_offset)  # drop a torn tail left by a crash
+        return self._journal
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        journal = self._open_journal()
+        journal.write(encode_record(record))
+        journal.flush()
+        self._journal_offset = journal.tell()
+        self._apply(record)
+        self._pending += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every:
+            self._sync()
+        self._start_worker()
+        if self._pending >= self.compact_after:
+            self._wake.set()
+
+    def _sync(self) -> None:
+        if self._journal is not None and self._unsynced:
+            os.fsync(self._journal.fileno())
+            self._unsynced = 0
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._sync()
+            self._journal.close()
+            self._journal = None
+
+    # ----- compaction -----
+
+    def compact(self) -> None:
+        """Fold the journal into a new CSV base, written atomically."""
+        with self._compact_lock, self.compact_lock_path.open("a+b") as guard:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(guard.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return  # another process is compacting
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock, self._file_lock(exclusive=True):
+            self._sync_from_disk()
+            if not self._pending and not self.rotated_journal_path.exists():
+                return
+            self._close_journal()
+            if self.journal_path.exists():
+                if self.rotated_journal_path.exists():
+                    # Left behind by an interrupted compaction: append the live journal
+                    # to it so both are folded. Replay is idempotent, so a crash while
+                    # copying only means some records are replayed twice.
+                    with self.rotated_journal_path.open("ab") as rotated:
+                        rotated.write(self.journal_path.read_bytes()[:self._journal_offset])
+                        rotated.flush()
+                        os.fsync(rotated.fileno())
+                    self.journal_path.unlink()
+                else:
+                    os.replace(self.journal_path, self.rotated_journal_path)
+            self._journal_inode = None
+            self._journal_offset = 0
+            self._rotated_signature = _file_signature(self.rotated_journal_path)
+            rows = list(self._rows.values())
+            compacted = self._pending
+
+        # The slow rewrite runs without blocking readers or writers, which keep
+        # appending to the fresh journal.
+        tmp_path = _write_rows_tmp(self.csv_path, rows)
+
+        with self._lock, self._file_lock(exclusive=True):
+            os.replace(tmp_path, self.csv_path)
+            _fsync_dir(self.csv_path.parent)
+            self.rotated_journal_path.unlink(missing_ok=True)
+            self._csv_signature = _file_signature(self.csv_path)
+            self._rotated_signature = None
+            # A reload during the rewrite may already have recounted pending records.
+            self._pending = max(0, self._pending - compacted)
+            self._last_compaction = time.monotonic()
+
+    def _start_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker, name="product-store-journal", daemon=True)
+            self._worker.start()
+
+    def _run_worker(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.fsync_interval)
+            self._wake.clear()
+            with self._lock:
+                self._sync()
+                due = self._pending >= self.compact_after or (
+                    self._pending and time.monotonic() - self._last_compaction >= self.compact_interval
+                )
+            if due:
+                self.compact()
+
+    def close(self) -> None:
+        """Compact pending changes, close the journal and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self.compact()
+        with self._lock:
+            self._close_journal()
+            self._lock_file.close()
+
+
+def get_product_store(app: Flask, csv_path: Path) -> ProductStore:
+    """
+    Return the app's store for `csv_path`, creating it on first use.
+
+    Args:
+        app (Flask): Application whose config provides the STORE_* settings.
+        csv_path (Path): Products CSV file.
+
+    Returns:
+        ProductStore: The shared store for this file.
+    """
+    stores: Dict[str, ProductStore] = app.extensions.setdefault("product_stores", {})
+    key = str(csv_path.resolve())
+    with _registry_lock:
+        store = stores.get(key)
+        if store is None:
+            store = ProductStore(
+                csv_path,
+                compact_after=int(app.config.get("STORE_COMPACT_AFTER", DEFAULT_COMPACT_AFTER)),
+                compact_interval=float(app.config.get("STORE_COMPACT_INTERVAL", DEFAULT_COMPACT_INTERVAL)),
+                fsync_every=int(app.config.get("STORE_FSYNC_EVERY", DEFAULT_FSYNC_EVERY)),
+                fsync_interval=float(app.config.get("STORE_FSYNC_INTERVAL", DEFAULT_FSYNC_INTERVAL)),
+            )
+            stores[key] = store
+    return store
+
+
+@atexit.register
+def _close_open_stores() -> None:
+    for store in list(_open_stores):
+        store.close()
@@ -265,3 +265,28 @@ def test_get_product_invalid_id(client):
     resp = client.get("/api/products/invalid-id")
     assert resp.status_code == 404
     assert "not found" in resp.get_json()["error"].lower()
+
+
+def test_list_filters_and_projection(client):
+    resp = client.get("/api/products?type=Electronic&fields=product_id,quantity")
+    assert resp.get_json() == [{"product_id": "206", "quantity": 3}]
+
+    resp = client.get("/api/products?min_price=1&max_price=10&min_quantity=10")
+    assert [p["product_id"] for p in resp.get_json()] == ["201"]
+
+
+def test_list_keyset_pagination(client):
+    first = client.get("/api/products?limit=1&fields=product_name")
+    assert first.get_json() == [{"product_name": "Strawberries"}]
+    assert first.headers["X-Next-Cursor"] == "201"
+    assert "after=201" in first.headers["Link"]
+
+    second = client.get("/api/products?limit=1&fields=product_name&after=201")
+    assert second.get_json() == [{"product_name": "Smartphone"}]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_list_rejects_bad_params(client):
+    assert client.get("/api/products?limit=0").status_code == 400
+    assert client.get("/api/products?fields=secret").status_code == 400
+    assert client.get("/api/products?max_quantity=lots").status_code == 400
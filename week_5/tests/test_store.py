@@ -0,0 +1,196 @@
+import multiprocessing
+import time
+from pathlib import Path
+
+import pytest
+
+from api.app import create_app
+from api.store import ProductStore, encode_record
+
+HEADER = "product_id,product_name,quantity,price,type,expiry_date,warranty_period,author,pages\n"
+
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text(HEADER + "201,Strawberries,12,3.0,food,2025-10-05,,,\n")
+    return csv_file
+
+
+def _row(product_id: str, name: str = "Widget") -> dict:
+    return {"product_id": product_id, "product_name": name, "quantity": "1", "price": "2.0",
+            "type": "", "expiry_date": "", "warranty_period": "", "author": "", "pages": ""}
+
+
+def test_writes_go_to_journal_until_compaction(csv_file: Path):
+    store = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    assert store.add(_row("300"))
+    assert not store.add(_row("300"))
+    assert store.replace("201", _row("201", "Renamed"))
+    assert store.delete("300")
+    assert not store.delete("300")
+
+    assert csv_file.read_text().count("\n") == 2
+    assert store.journal_path.exists()
+    assert [r["product_name"] for r in store.rows()] == ["Renamed"]
+
+    store.compact()
+    assert not store.journal_path.exists()
+    assert "Renamed" in csv_file.read_text()
+    store.close()
+
+
+def test_journal_is_replayed_on_load(csv_file: Path):
+    first = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    first.add(_row("300"))
+
+    second = ProductStore(csv_file)
+    assert second.get("300")["product_name"] == "Widget"
+    assert [r["product_id"] for r in second.rows()] == ["201", "300"]
+
+
+def test_torn_journal_tail_is_truncated(csv_file: Path):
+    first = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    first.add(_row("300"))
+    first.add(_row("301"))
+    first._close_journal()
+    whole = first.journal_path.read_bytes()
+    first.journal_path.write_bytes(whole[:-3])
+
+    second = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    assert [r["product_id"] for r in second.rows()] == ["201", "300"]
+    assert second.add(_row("302"))
+    third = ProductStore(csv_file)
+    assert [r["product_id"] for r in third.rows()] == ["201", "300", "302"]
+
+
+def test_rotated_journal_left_by_interrupted_compaction_is_replayed(csv_file: Path):
+    rotated = csv_file.with_name(csv_file.name + ".journal.1")
+    rotated.write_bytes(encode_record({"op": "put", "key": "300", "row": _row("300")}))
+    journal = csv_file.with_name(csv_file.name + ".journal")
+    journal.write_bytes(encode_record({"op": "delete", "key": "201"}))
+
+    store = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    assert [r["product_id"] for r in store.rows()] == ["300"]
+    store.compact()
+    assert not rotated.exists() and not journal.exists()
+    assert "201," not in csv_file.read_text()
+    store.close()
+
+
+def test_rename_onto_existing_product_is_refused(csv_file: Path):
+    store = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    store.add(_row("300"))
+    journal_size = store.journal_path.stat().st_size
+    with pytest.raises(ValueError):
+        store.replace("201", _row("300", "Renamed"))
+    assert store.journal_path.stat().st_size == journal_size
+    assert [r["product_name"] for r in store.rows()] == ["Strawberries", "Widget"]
+
+    assert store.replace("201", _row("301", "Renamed"))
+    assert [r["product_id"] for r in store.rows()] == ["301", "300"]
+    store.close()
+
+    # A conflicting rename already in the journal replays to one row per id.
+    journal = csv_file.with_name(csv_file.name + ".journal")
+    journal.write_bytes(encode_record({"op": "put", "key": "301", "row": _row("300", "Renamed")}))
+    store = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    assert [(r["product_id"], r["product_name"]) for r in store.rows()] == [("300", "Renamed")]
+    store.close()
+
+    client = create_app({"DATA_CSV": str(csv_file), "STORE_COMPACT_AFTER": 100}).test_client()
+    client.post("/api/products", json={"product_id": "302", "product_name": "B", "quantity": 1, "price": 1.0})
+    resp = client.put("/api/products/302", json={"product_id": "300", "product_name": "B", "quantity": 1, "price": 1.0})
+    assert resp.status_code == 409
+    assert {p["product_id"] for p in client.get("/api/products").get_json()} == {"300", "302"}
+
+
+def test_compaction_is_triggered_by_pending_changes(csv_file: Path):
+    store = ProductStore(csv_file, compact_after=1, compact_interval=60)
+    store.add(_row("300"))
+    deadline = time.monotonic() + 2
+    while "300" not in csv_file.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert "300" in csv_file.read_text()
+    store.close()
+
+
+def test_api_serves_reads_from_store(csv_file: Path):
+    app = create_app({"DATA_CSV": str(csv_file), "STORE_COMPACT_AFTER": 100})
+    client = app.test_client()
+    resp = client.post("/api/products", json={"product_id": "999", "product_name": "Pen", "quantity": 1, "price": 1.0})
+    assert resp.status_code == 201
+
+    assert "999" not in csv_file.read_text()
+    assert client.get("/api/products/999").status_code == 200
+    assert len(client.get("/api/products").get_json()) == 2
+
+
+def _add_rows(csv_path: str, start: int, count: int) -> None:
+    store = ProductStore(Path(csv_path), compact_after=7, compact_interval=60)
+    for i in range(start, start + count):
+        assert store.add(_row(str(i)))
+    store.close()
+
+
+def test_concurrent_processes_do_not_lose_writes(csv_file: Path):
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_add_rows, args=(str(csv_file), 1000 * n, 40)) for n in range(1, 5)]
+    for proc in workers:
+        proc.start()
+    for proc in workers:
+        proc.join(30)
+        assert proc.exitcode == 0
+
+    ids = [r["product_id"] for r in ProductStore(csv_file).rows()]
+    assert len(ids) == 1 + 4 * 40
+    assert len(set(ids)) == len(ids)
+
+
+def test_reader_sees_writes_from_another_store(csv_file: Path):
+    reader = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    writer = ProductStore(csv_file, compact_after=100, compact_interval=60)
+    assert reader.get("300") is None
+
+    writer.add(_row("300"))
+    assert reader.get("300")["product_name"] == "Widget"
+    writer.compact()
+    writer.delete("201")
+    assert [r["product_id"] for r in reader.rows()] == ["300"]
+    assert not reader.add(_row("300"))
+    writer.close()
+    reader.close()
+
+
+def test_list_body_is_cached_per_store_version(csv_file: Path):
+    app = create_app({"DATA_CSV": str(csv_file), "STORE_COMPACT_AFTER": 100})
+    client = app.test_client()
+    first = client.get("/api/products")
+    etag = first.headers["ETag"]
+    assert client.get("/api/products", headers={"If-None-Match": etag}).status_code == 304
+
+    client.delete("/api/products/201")
+    second = client.get("/api/products", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.get_json() == []
+    assert client.get("/api/products/201").status_code == 404
+
+    with csv_file.open("a") as fh:
+        fh.write("202,Cherries,4,5.0,,,,,\n")
+    assert client.get("/api/products/202").get_json()["product_name"] == "Cherries"
+
+
+def test_list_etag_depends_only_on_content(csv_file: Path):
+    def get(path: str, etag: str = ""):
+        app = create_app({"DATA_CSV": str(csv_file), "STORE_COMPACT_AFTER": 100})
+        return app.test_client().get(path, headers={"If-None-Match": etag} if etag else {})
+
+    etag = get("/api/products").headers["ETag"]
+    # A fresh app and store over the same data answers the same tag.
+    assert get("/api/products", etag).status_code == 304
+    page_etag = get("/api/products?limit=1").headers["ETag"]
+    assert get("/api/products?limit=1", page_etag).status_code == 304
+
+    with csv_file.open("a") as fh:
+        fh.write("202,Cherries,4,5.0,,,,,\n")
+    assert get("/api/products", etag).status_code == 200
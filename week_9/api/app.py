@@ -49,6 +49,9 @@ def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
     app.config.setdefault(
         "JWT_EXP_MINUTES", int(os.getenv("JWT_EXP_DELTA_SECONDS", "3600")) // 60
     )
+    # asymmetric signing (RS256/EdDSA) from <kid>.pem files; unset means HS256 with the secret
+    app.config.setdefault("JWT_KEYS_DIR", os.getenv("JWT_KEYS_DIR"))
+    app.config.setdefault("JWT_ACTIVE_KID", os.getenv("JWT_ACTIVE_KID"))
 
     # allow config override (tests or custom)
     if config:
@@ -0,0 +1,122 @@
+"""Set-based product writes shared by the bulk endpoints and the seed command."""
+
+from __future__ import annotations
+
+import csv
+import io
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import insert
+
+from .db import db
+from .models import Product
+
+#: Product columns written by bulk loads, in COPY order.
+PRODUCT_COLUMNS: tuple[str, ...] = (
+    "product_id",
+    "product_name",
+    "quantity",
+    "price",
+    "type",
+    "expiry_date",
+    "warranty_period",
+    "author",
+    "pages",
+    "created_by",
+)
+
+_STAGING_TABLE: str = "products_staging"
+
+
+def insert_new_products(rows: list[dict[str, Any]]) -> set[int]:
+    """Insert `rows` with one executemany, skipping product_ids that already exist.
+
+    On PostgreSQL and SQLite the insert uses ON CONFLICT DO NOTHING, so rows
+    created concurrently since any duplicate check are skipped rather than
+    failing the whole batch. Other dialects get a plain insert, so callers must
+    filter out existing product_ids first.
+
+    Args:
+        rows (list[dict[str, Any]]): Product column values, one dict per product.
+
+    Returns:
+        set[int]: product_ids that were actually inserted.
+    """
+    if not rows:
+        return set()
+    # Core inserts against the table: the ORM bulk path rewinds RETURNING rows per
+    # batch, which makes large inserts quadratic.
+    table = Product.__table__
+    dialect: str = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        db.session.execute(insert(table), rows)
+        return {row["product_id"] for row in rows}
+
+    stmt = dialect_insert(table).on_conflict_do_nothing(index_elements=["product_id"])
+    return set(db.session.scalars(stmt.returning(table.c.product_id), rows))
+
+
+def supports_copy() -> bool:
+    """Return True if the session is bound to PostgreSQL, which can COPY."""
+    return db.session.get_bind().dialect.name == "postgresql"
+
+
+def create_staging_table() -> None:
+    """Create the session-local table that COPY loads into.
+
+    It has the product columns without constraints, plus a sequence number so
+    the merge can keep the first of several rows with the same product_id. The
+    table is dropped when the transaction commits.
+    """
+    db.session.execute(db.text(
+        f"CREATE TEMP TABLE {_STAGING_TABLE} ON COMMIT DROP AS "
+        f"SELECT {', '.join(PRODUCT_COLUMNS)} FROM products WITH NO DATA"
+    ))
+    db.session.execute(db.text(f"ALTER TABLE {_STAGING_TABLE} ADD COLUMN seq BIGSERIAL"))
+
+
+def copy_to_staging(rows: Sequence[Sequence[Any]]) -> None:
+    """Stream one batch of rows (in PRODUCT_COLUMNS order) into the staging table with COPY.
+
+    Works with both psycopg (3) and psycopg2 connections.
+    """
+    columns: str = ", ".join(PRODUCT_COLUMNS)
+    raw = db.session.connection().connection.driver_connection
+    with raw.cursor() as cursor:
+        if hasattr(cursor, "copy"):  # psycopg 3
+            with cursor.copy(f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:  # psycopg2
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor.copy_expert(
+                f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN "
+                f"WITH (FORMAT csv, FORCE_NOT_NULL (product_name))",
+                buffer,
+            )
+
+
+def merge_staging() -> int:
+    """Move staged rows into products, skipping existing product_ids.
+
+    Returns:
+        int: Number of products inserted.
+    """
+    columns: str = ", ".join(PRODUCT_COLUMNS)
+    result = db.session.execute(db.text(
+        f"INSERT INTO products ({columns}) "
+        f"SELECT DISTINCT ON (product_id) {columns} FROM {_STAGING_TABLE} ORDER BY product_id, seq "
+        f"ON CONFLICT (product_id) DO NOTHING"
+    ))
+    return result.rowcount
+
+
+def as_copy_rows(products: Iterable[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    """Order product dicts as COPY rows."""
+    return [tuple(product.get(column) for column in PRODUCT_COLUMNS) for product in products]
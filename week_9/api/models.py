@@ -3,11 +3,13 @@
 from datetime import date, datetime, timezone
 from typing import Optional
 from .db import db
-from sqlalchemy import CheckConstraint, ForeignKey, Column, Integer, Text, String, DateTime, UniqueConstraint
+from sqlalchemy import CheckConstraint, ForeignKey, Column, Index, Integer, Text, String, DateTime, UniqueConstraint, func
 from sqlalchemy.orm import relationship
 from enum import Enum
+from flask import has_app_context
 from werkzeug.security import generate_password_hash, check_password_hash
 from pgvector.sqlalchemy import Vector
+from .utils.passwords import get_password_hasher
 
 class Product(db.Model):
     """SQLAlchemy model representing a product in the inventory."""
@@ -16,7 +18,7 @@ class Product(db.Model):
 
     product_id: int = db.Column(db.Integer, primary_key=True, nullable=False)
     product_name: str = db.Column(db.String(256), nullable=False)
-    quantity: int = db.Column(db.Integer, nullable=False)
+    quantity: int = db.Column(db.Integer, nullable=False, index=True)
     price: float = db.Column(db.Float, nullable=False)
     type: Optional[str] = db.Column(db.String(50), nullable=True)
     expiry_date: Optional[date] = db.Column(db.Date, nullable=True)
@@ -30,6 +32,9 @@ class Product(db.Model):
 
     __table_args__ = (
         CheckConstraint('product_id > 0', name='check_product_id_positive'),
+        # Owner- and type-scoped listings filter on the first column and page by product_id.
+        Index('ix_products_created_by_product_id', 'created_by', 'product_id'),
+        Index('ix_products_type_lower_product_id', func.lower(type), 'product_id'),
     )
 
     def __repr__(self) -> str:
@@ -65,11 +70,18 @@ class User(db.Model):
     role = db.Column(db.String(20), default=RoleEnum.STAFF.value, nullable=False)
 
     def set_password(self, password: str) -> None:
-        """Hash and set the user's password."""
-        self.password_hash = generate_password_hash(password)
+        """Hash and set the user's password with the app's configured hashing method."""
+        if has_app_context():
+            self.password_hash = get_password_hasher().hash(password)
+        else:
+            self.password_hash = generate_password_hash(password)
 
     def check_password(self, password: str) -> bool:
-        """Verify the user's password against the stored hash."""
+        """Verify the user's password against the stored hash in the calling thread.
+
+        Request handlers should prefer `PasswordHasher.verify`, which runs on the
+        bounded verification pool and reports outdated hashes.
+        """
         return check_password_hash(self.password_hash, password)
 
     def __repr__(self) -> str:
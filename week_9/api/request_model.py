@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 from datetime import date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+from pydantic import BaseModel, Field, field_validator
 from pydantic import ConfigDict
 
 
@@ -61,4 +61,51 @@ class ProductUpdate(BaseModel):
     pages: Optional[int] = Field(None, ge=1)
 
     model_config = ConfigDict(extra="forbid")
-    
\ No newline at end of file
+    
+
+class ProductBulkUpdate(ProductUpdate):
+    """One item of a bulk update: the product to change and the fields to set."""
+    product_id: int = Field(..., gt=0, description="Product to update")
+
+
+class ProductBulkDelete(BaseModel):
+    """Schema for deleting several products at once."""
+    product_ids: List[int] = Field(..., min_length=1, description="Products to delete")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+MAX_PAGE_SIZE: int = 1000
+
+
+class ProductListQuery(BaseModel):
+    """Query parameters accepted by GET /api/products.
+
+    Results are ordered by product_id. `after` is the keyset cursor: the last
+    product_id of the previous page, as returned in the X-Next-Cursor header.
+    """
+
+    after: Optional[int] = Field(None, ge=0, description="Return products with a larger product_id")
+    limit: Optional[int] = Field(None, ge=1, le=MAX_PAGE_SIZE, description="Maximum products per page")
+    fields: Optional[List[str]] = Field(None, description="Comma-separated response fields to include")
+    type: Optional[str] = Field(None, description="Only products of this type; empty for generic")
+    created_by: Optional[int] = Field(None, description="Only products owned by this user id")
+    min_quantity: Optional[int] = None
+    max_quantity: Optional[int] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    stream: bool = Field(False, description="Send the JSON array in chunks as rows are read")
+
+    @field_validator("fields", mode="before")
+    @classmethod
+    def split_fields(cls, value: Any) -> Any:
+        """Accept `fields` as a comma-separated string."""
+        if isinstance(value, str):
+            return [name.strip() for name in value.split(",") if name.strip()]
+        return value
+
+    @field_validator("type")
+    @classmethod
+    def normalize_type(cls, value: Optional[str]) -> Optional[str]:
+        """Compare product types case-insensitively."""
+        return value.strip().lower() if value is not None else None
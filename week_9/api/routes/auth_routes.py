@@ -1,13 +1,27 @@
-"""Authentication routes: register, login, and token refresh."""
+"""Authentication routes: register, login, token refresh, logout and the public key set."""
 
-from flask import Blueprint, request, jsonify
+import logging
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from flask import Blueprint, request, jsonify, g
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..db import db
 from ..models import User
-from ..utils.security import create_access_token, create_refresh_token, decode_access_token
+from ..utils.keys import get_keyring
+from ..utils.passwords import PasswordVerifierBusy, get_password_hasher, verify_timeout
+from ..utils.revocation import get_revocation_store
+from ..utils.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_access_token,
+    jwt_required,
+    new_token_family,
+    revoke_token_family,
+)
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
+logger = logging.getLogger(__name__)
 
 @auth_bp.route("/register", methods=["POST"])
 def register():
@@ -71,11 +85,31 @@ def login():
     password = data["password"]
 
     user = User.query.filter_by(username=username).first()
-    if not user or not user.check_password(password):
+    if not user:
+        return jsonify({"error": "Invalid credentials"}), 401
+
+    # Verify on the bounded hashing pool; shed load rather than queue without limit.
+    try:
+        valid, new_hash = get_password_hasher().verify(user.password_hash, password, timeout=verify_timeout())
+    except (PasswordVerifierBusy, FutureTimeoutError):
+        resp = jsonify({"error": "Too many login attempts in progress, retry shortly"})
+        resp.headers["Retry-After"] = "1"
+        return resp, 503
+    if not valid:
         return jsonify({"error": "Invalid credentials"}), 401
 
-    access_token = create_access_token(user_id=user.id, role=user.role)
-    refresh_token = create_refresh_token(user_id=user.id, role=user.role)
+    # Transparently upgrade hashes made with older method, cost or salt settings.
+    if new_hash is not None:
+        user.password_hash = new_hash
+        try:
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.warning("Could not rehash password for user %s: %s", user.id, e)
+
+    family = new_token_family()
+    access_token = create_access_token(user_id=user.id, role=user.role, family=family)
+    refresh_token = create_refresh_token(user_id=user.id, role=user.role, family=family)
 
     return jsonify({
         "access_token": access_token,
@@ -85,7 +119,11 @@ def login():
 
 @auth_bp.route("/refresh", methods=["POST"])
 def refresh_token():
-    """Refresh access + refresh tokens using a valid refresh token.
+    """Rotate a refresh token: spend it and issue new access + refresh tokens.
+
+    Every refresh token is single use. Presenting one that was already rotated
+    means it leaked, so its whole family (the login session) is revoked and the
+    holder has to log in again.
 
     Expected JSON body:
         {
@@ -109,13 +147,23 @@ def refresh_token():
 
         user_id = payload.get("sub")
         role = payload.get("role", "staff")
+        jti = payload.get("jti")
+        family = payload.get("fam")
 
-        if user_id is None:
+        if user_id is None or not jti or not family:
             return jsonify({"error": "Invalid token payload"}), 401
 
-        # Generate new access + refresh tokens
-        new_access_token = create_access_token(user_id=int(user_id), role=role)
-        new_refresh_token = create_refresh_token(user_id=int(user_id), role=role)
+        revocations = get_revocation_store()
+        if revocations.is_family_revoked(family):
+            return jsonify({"error": "Refresh token has been revoked"}), 401
+        if not revocations.spend(jti, float(payload["exp"])):
+            revoke_token_family(family)
+            logger.warning("Refresh token reuse for user %s; revoked token family %s", user_id, family)
+            return jsonify({"error": "Refresh token reuse detected"}), 401
+
+        # Generate new access + refresh tokens in the same family
+        new_access_token = create_access_token(user_id=int(user_id), role=role, family=family)
+        new_refresh_token = create_refresh_token(user_id=int(user_id), role=role, family=family)
 
         return jsonify({
             "access_token": new_access_token,
@@ -125,3 +173,32 @@ def refresh_token():
 
     except Exception as e:
         return jsonify({"error": "Invalid or expired refresh token"}), 401
+
+
+@auth_bp.route("/logout", methods=["POST"])
+@jwt_required
+def logout():
+    """Revoke the caller's login session.
+
+    The access token's family is revoked, which invalidates it and every
+    refresh token rotated from the same login.
+    """
+    family = g.jwt_payload.get("fam")
+    if not family:
+        return jsonify({"error": "Token does not belong to a revocable session"}), 400
+    revoke_token_family(family)
+    return "", 204
+
+
+@auth_bp.route("/jwks", methods=["GET"])
+def jwks():
+    """Publish the public token-signing keys as a JSON Web Key Set.
+
+    Downstream services verify tokens locally by matching the token's `kid`
+    header against this set. Empty when tokens are signed with a shared secret.
+    """
+    keyring = get_keyring()
+    resp = jsonify(keyring.jwks() if keyring is not None else {"keys": []})
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 300
+    return resp, 200
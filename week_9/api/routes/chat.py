@@ -1,5 +1,5 @@
 from flask import Blueprint, request, jsonify
-from ..utils.security import jwt_required, get_current_user
+from ..utils.security import jwt_required, get_current_identity
 from week_9.scripts.rag_bot import load_vector_store, build_rag_chain
 from ..utils.cache import get_cached_response, set_cached_response
 from typing import List
@@ -91,13 +91,13 @@ def chat_inventory():
 
     try:
         # Identify current user
-        user = get_current_user()
+        user = get_current_identity()
         if user is None:
             return jsonify({"error": "Unauthorized"}), 401
 
         # 1. Check cache (tenant-scoped)
         cached = get_cached_response(
-            model_name=model_name, prompt=question, user_id=int(user.id)
+            model_name=model_name, prompt=question, user_id=user.id
         )
         if cached:
             return (
@@ -110,7 +110,7 @@ def chat_inventory():
         user_vs = load_vector_store(collection_name="user_embeddings_hf")
 
         # Build a combined retriever (user + products) and wrap as Runnable
-        cr = CombinedRetriever(user_vs, product_vs, user_id=int(user.id))
+        cr = CombinedRetriever(user_vs, product_vs, user_id=user.id)
         retriever = RunnableLambda(lambda q: cr.get_relevant_documents(q))
         chain = build_rag_chain(retriever, provider=provider)
 
@@ -118,7 +118,7 @@ def chat_inventory():
 
         # 3. Store in cache (tenant-scoped)
         set_cached_response(
-            model_name=model_name, prompt=question, response=answer, user_id=int(user.id)
+            model_name=model_name, prompt=question, response=answer, user_id=user.id
         )
 
         return jsonify({"answer": answer, "model": model_name}), 200
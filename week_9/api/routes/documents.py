@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from flask import Blueprint, request, jsonify
-from ..utils.security import jwt_required, get_current_user
+from ..utils.security import jwt_required, get_current_identity
 from ..utils.cache import invalidate_user_cache
 from ..models import Document as DocumentModel
 from ..db import db
@@ -23,7 +23,7 @@ def _get_user_vs():
 @jwt_required
 def upload_document():
     """Upload a text file, store raw in DB, chunk+embed to PGVector with user_id metadata, and invalidate user cache."""
-    user = get_current_user()
+    user = get_current_identity()
     if user is None:
         return jsonify({"error": "Unauthorized"}), 401
 
@@ -45,7 +45,7 @@ def upload_document():
 
         # 1) Persist original document
         doc_row = DocumentModel(
-            user_id=int(user.id),
+            user_id=user.id,
             filename=file.filename,
             content_type=content_type,
             text=text,
@@ -59,13 +59,13 @@ def upload_document():
 
         if chunks:
             metadatas = [
-                {"user_id": int(user.id), "filename": file.filename, "doc_id": int(doc_row.id)}
+                {"user_id": user.id, "filename": file.filename, "doc_id": int(doc_row.id)}
                 for _ in chunks
             ]
             _get_user_vs().add_texts(texts=chunks, metadatas=metadatas)
 
         # 3) Invalidate cache for this user
-        invalidate_user_cache(int(user.id))
+        invalidate_user_cache(user.id)
 
         return jsonify({
             "message": "File uploaded and embedded",
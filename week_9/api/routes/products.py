@@ -1,9 +1,13 @@
 """Product-related API routes."""
 
-from typing import Type, Any, Tuple
-from flask import Blueprint, request, jsonify, Response, g
+from typing import Type, Any, Iterator, Tuple
+from urllib.parse import urlencode
+from flask import Blueprint, current_app, request, jsonify, Response, g, stream_with_context
+from sqlalchemy import delete, func, or_, update
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Query
 from pydantic import ValidationError, BaseModel
+from ..bulk import insert_new_products
 from ..db import db
 from ..models import Product
 from ..schemas import (
@@ -13,12 +17,18 @@ from ..schemas import (
     GenericProductCreate,
     ProductUpdate,
     ProductResponse,
+    ProductListQuery,
+    ProductBulkUpdate,
+    ProductBulkDelete,
 )
 
 from ..utils.security import jwt_required, roles_required
 
 api_bp: Blueprint = Blueprint("api", __name__, url_prefix="/api")
 
+NDJSON_MIMETYPE: str = "application/x-ndjson"
+_DEFAULT_STREAM_BATCH_SIZE: int = 1000
+
 
 def _choose_create_schema(product_type: str) -> Type[BaseModel]:
     """Return correct Pydantic schema based on product type.
@@ -37,11 +47,142 @@ def _choose_create_schema(product_type: str) -> Type[BaseModel]:
     return type_map.get(product_type.lower().strip(), GenericProductCreate)
 
 
+def _product_list_query(params: ProductListQuery) -> Tuple[Query, list[str]]:
+    """Build the filtered, keyset-ordered query for a product listing.
+
+    Filters, the cursor and the column projection are all pushed into SQL, so
+    only the requested page and columns leave the database. Each row starts with
+    the product_id (the cursor key), followed by the requested columns.
+
+    Args:
+        params (ProductListQuery): Parsed query-string parameters.
+
+    Returns:
+        Tuple[Query, list[str]]: The query and the names of the requested columns.
+
+    Raises:
+        ValueError: If `fields` names a column the API does not expose.
+    """
+    names: list[str] = list(ProductResponse.model_fields)
+    if params.fields:
+        unknown: list[str] = [f for f in params.fields if f not in names]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        names = params.fields
+
+    query: Query = db.session.query(Product.product_id, *(getattr(Product, name) for name in names))
+    if params.type is not None:
+        if params.type:
+            query = query.filter(func.lower(Product.type) == params.type)
+        else:
+            query = query.filter(or_(Product.type.is_(None), Product.type == ""))
+    if params.created_by is not None:
+        query = query.filter(Product.created_by == params.created_by)
+    if params.min_quantity is not None:
+        query = query.filter(Product.quantity >= params.min_quantity)
+    if params.max_quantity is not None:
+        query = query.filter(Product.quantity <= params.max_quantity)
+    if params.min_price is not None:
+        query = query.filter(Product.price >= params.min_price)
+    if params.max_price is not None:
+        query = query.filter(Product.price <= params.max_price)
+    if params.after is not None:
+        query = query.filter(Product.product_id > params.after)
+    return query.order_by(Product.product_id), names
+
+
+def _parse_list_request() -> Tuple[ProductListQuery, Query, list[str]]:
+    """Parse the listing query string and build its query.
+
+    Raises:
+        ValidationError: If a query parameter has an invalid value.
+        ValueError: If `fields` names an unknown column.
+    """
+    params: ProductListQuery = ProductListQuery.model_validate(request.args.to_dict())
+    query, names = _product_list_query(params)
+    return params, query, names
+
+
+def _set_next_page_headers(resp: Response, cursor: int) -> None:
+    """Point the client at the page after `cursor`."""
+    args: dict[str, Any] = request.args.to_dict()
+    args["after"] = cursor
+    resp.headers["X-Next-Cursor"] = str(cursor)
+    resp.headers["Link"] = f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+
+
+def _stream_batch_size() -> int:
+    return int(current_app.config.get("PRODUCT_STREAM_BATCH_SIZE", _DEFAULT_STREAM_BATCH_SIZE))
+
+
+def _stream_products(query: Query, names: list[str], ndjson: bool) -> Iterator[str]:
+    """Serialize listing rows as they are fetched.
+
+    Rows are read from a server-side cursor `PRODUCT_STREAM_BATCH_SIZE` at a time,
+    so memory use does not grow with the size of the catalog.
+
+    Args:
+        query (Query): Listing query from `_product_list_query`.
+        names (list[str]): Names of the selected columns after the product_id.
+        ndjson (bool): Emit one JSON object per line instead of a JSON array.
+
+    Yields:
+        str: Chunks of the response body.
+    """
+    dumps = current_app.json.dumps
+    rows = query.execution_options(stream_results=True).yield_per(_stream_batch_size())
+    if ndjson:
+        for row in rows:
+            yield dumps(dict(zip(names, row[1:]))) + "\n"
+        return
+
+    yield "["
+    separator: str = ""
+    for row in rows:
+        yield separator + dumps(dict(zip(names, row[1:])))
+        separator = ","
+    yield "]\n"
+
+
 @api_bp.route("/products", methods=["GET"])
 def get_products() -> Tuple[Response, int]:
-    """Fetch all products."""
-    products: list[Product] = Product.query.all()
-    return jsonify([ProductResponse.model_validate(p).model_dump() for p in products]), 200
+    """Fetch products, optionally filtered, projected and paginated.
+
+    Supports `type`, `created_by`, `min_quantity`, `max_quantity`, `min_price`,
+    `max_price`, `fields` and the keyset pair `after`/`limit`. When a limited page
+    is followed by more products, the X-Next-Cursor and Link headers give the
+    next cursor.
+
+    Clients that send `Accept: application/x-ndjson` receive one product per line,
+    and `stream=true` sends the JSON array in chunks; both are streamed from the
+    database as rows arrive and carry no cursor headers, since the last product_id
+    of the body is the next cursor.
+    """
+    try:
+        params, query, names = _parse_list_request()
+    except ValidationError as e:
+        return jsonify({"error": e.errors(include_url=False, include_context=False)}), 400
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    ndjson: bool = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+    if ndjson or params.stream:
+        if params.limit is not None:
+            query = query.limit(params.limit)
+        body: Iterator[str] = stream_with_context(_stream_products(query, names, ndjson))
+        return Response(body, mimetype=NDJSON_MIMETYPE if ndjson else "application/json"), 200
+
+    if params.limit is not None:
+        query = query.limit(params.limit + 1)
+    rows: list[Any] = query.all()
+    has_more: bool = params.limit is not None and len(rows) > params.limit
+    if has_more:
+        rows = rows[:params.limit]
+
+    resp: Response = jsonify([dict(zip(names, row[1:])) for row in rows])
+    if has_more:
+        _set_next_page_headers(resp, rows[-1][0])
+    return resp, 200
 
 
 @api_bp.route("/products/<int:product_id>", methods=["GET"])
@@ -135,4 +276,182 @@ def delete_product(product_id: int) -> Tuple[str | Response, int]:
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
-    return jsonify({"message": f"Product {product_id} deleted successfully"}), 200
\ No newline at end of file
+    return jsonify({"message": f"Product {product_id} deleted successfully"}), 200
+
+# ----- bulk endpoints -----
+
+_DEFAULT_BULK_MAX_ITEMS: int = 5000
+
+
+def _bulk_items(body: Any) -> list[Any] | Tuple[Response, int]:
+    """Return the items of a bulk request body, or an error response."""
+    if not isinstance(body, list) or not body:
+        return jsonify({"error": "Expected a non-empty JSON array"}), 400
+    max_items: int = int(current_app.config.get("BULK_MAX_ITEMS", _DEFAULT_BULK_MAX_ITEMS))
+    if len(body) > max_items:
+        return jsonify({"error": f"At most {max_items} items per request"}), 413
+    return body
+
+
+def _item_error(index: int, status: int, error: Any, product_id: Any = None) -> dict[str, Any]:
+    return {"index": index, "product_id": product_id, "status": status, "error": error}
+
+
+def _bulk_response(results: list[dict[str, Any]]) -> Tuple[Response, int]:
+    failed: int = sum(1 for r in results if "error" in r)
+    return jsonify({"results": results, "succeeded": len(results) - failed, "failed": failed}), 200
+
+
+def _existing_owners(product_ids: Any) -> dict[int, int]:
+    """Map each of `product_ids` that exists to its owner, using a single IN query."""
+    if not product_ids:
+        return {}
+    rows = db.session.query(Product.product_id, Product.created_by).filter(Product.product_id.in_(list(product_ids)))
+    return {pid: owner for pid, owner in rows}
+
+
+def _commit_bulk() -> Tuple[Response, int] | None:
+    try:
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+    return None
+
+
+@api_bp.route("/products/bulk", methods=["POST"])
+@jwt_required
+@roles_required('manager', 'admin')
+def create_products_bulk() -> Tuple[Response, int]:
+    """Create many products in one transaction.
+
+    Every item is validated on its own; duplicates are found with a single IN
+    query and the new rows are written with one executemany. The response lists
+    a result per item, in request order.
+    """
+    items = _bulk_items(request.get_json(force=True, silent=True))
+    if isinstance(items, tuple):
+        return items
+
+    results: list[dict[str, Any] | None] = [None] * len(items)
+    candidates: dict[int, Tuple[int, dict[str, Any]]] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _item_error(index, 400, "Expected a JSON object")
+            continue
+        try:
+            product_in: BaseModel = _choose_create_schema(str(item.get("type") or ""))(**item)
+        except ValidationError as e:
+            results[index] = _item_error(index, 400, e.errors(include_url=False, include_context=False),
+                                         item.get("product_id"))
+            continue
+        if product_in.product_id in candidates:
+            results[index] = _item_error(index, 409, "Duplicate product_id in request", product_in.product_id)
+            continue
+        candidates[product_in.product_id] = (index, {**product_in.model_dump(), "created_by": g.current_user_id})
+
+    for pid in _existing_owners(candidates):
+        index, _ = candidates.pop(pid)
+        results[index] = _item_error(index, 409, "Product with this product_id already exists", pid)
+
+    inserted: set[int] = insert_new_products([row for _, row in candidates.values()])
+    failure = _commit_bulk()
+    if failure:
+        return failure
+
+    for pid, (index, _) in candidates.items():
+        if pid in inserted:
+            results[index] = {"index": index, "product_id": pid, "status": 201}
+        else:
+            results[index] = _item_error(index, 409, "Product with this product_id already exists", pid)
+    return _bulk_response(results)
+
+
+@api_bp.route("/products/bulk", methods=["PATCH"])
+@jwt_required
+@roles_required('manager', 'admin')
+def update_products_bulk() -> Tuple[Response, int]:
+    """Apply partial updates to many products in one transaction.
+
+    Each item carries a product_id and the fields to change. Managers may only
+    update their own products, as with PUT /api/products/<id>.
+    """
+    items = _bulk_items(request.get_json(force=True, silent=True))
+    if isinstance(items, tuple):
+        return items
+
+    results: list[dict[str, Any] | None] = [None] * len(items)
+    updates: dict[int, Tuple[int, dict[str, Any]]] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = _item_error(index, 400, "Expected a JSON object")
+            continue
+        try:
+            update_in: ProductBulkUpdate = ProductBulkUpdate(**item)
+        except ValidationError as e:
+            results[index] = _item_error(index, 400, e.errors(include_url=False, include_context=False),
+                                         item.get("product_id"))
+            continue
+        if update_in.product_id in updates:
+            results[index] = _item_error(index, 409, "Duplicate product_id in request", update_in.product_id)
+            continue
+        updates[update_in.product_id] = (index, update_in.model_dump(exclude_unset=True))
+
+    owners: dict[int, int] = _existing_owners(updates)
+    for pid in list(updates):
+        index, _ = updates[pid]
+        if pid not in owners:
+            results[index] = _item_error(index, 404, "Product not found", pid)
+        elif g.current_user_role == "manager" and owners[pid] != g.current_user_id:
+            results[index] = _item_error(index, 403, "Forbidden: Managers can only update their own products", pid)
+        else:
+            continue
+        del updates[pid]
+
+    rows: list[dict[str, Any]] = [changes for _, changes in updates.values() if len(changes) > 1]
+    if rows:
+        db.session.execute(update(Product), rows)
+    failure = _commit_bulk()
+    if failure:
+        return failure
+
+    for pid, (index, _) in updates.items():
+        results[index] = {"index": index, "product_id": pid, "status": 200}
+    return _bulk_response(results)
+
+
+@api_bp.route("/products/bulk", methods=["DELETE"])
+@jwt_required
+@roles_required('admin')
+def delete_products_bulk() -> Tuple[Response, int]:
+    """Delete many products with a single DELETE ... WHERE product_id IN (...)."""
+    data: dict[str, Any] | None = request.get_json(force=True, silent=True)
+    if not data:
+        return jsonify({"error": "Invalid or missing JSON body"}), 400
+    try:
+        delete_in: ProductBulkDelete = ProductBulkDelete(**data)
+    except ValidationError as e:
+        return jsonify({"error": e.errors(include_url=False, include_context=False)}), 400
+    checked = _bulk_items(delete_in.product_ids)
+    if isinstance(checked, tuple):
+        return checked
+
+    existing: dict[int, int] = _existing_owners(set(delete_in.product_ids))
+    if existing:
+        db.session.execute(
+            delete(Product).where(Product.product_id.in_(list(existing))),
+            execution_options={"synchronize_session": False},
+        )
+    failure = _commit_bulk()
+    if failure:
+        return failure
+
+    results: list[dict[str, Any]] = []
+    deleted: set[int] = set()
+    for index, pid in enumerate(delete_in.product_ids):
+        if pid in existing and pid not in deleted:
+            deleted.add(pid)
+            results.append({"index": index, "product_id": pid, "status": 200})
+        else:
+            results.append(_item_error(index, 404, "Product not found", pid))
+    return _bulk_response(results)
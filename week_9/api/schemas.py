@@ -18,6 +18,9 @@ from .request_model import (
     BookProductCreate,
     GenericProductCreate,
     ProductUpdate,
+    ProductListQuery,
+    ProductBulkUpdate,
+    ProductBulkDelete,
 )
 
 # Response model
@@ -30,5 +33,8 @@ __all__ = [
     "BookProductCreate",
     "GenericProductCreate",
     "ProductUpdate",
+    "ProductListQuery",
+    "ProductBulkUpdate",
+    "ProductBulkDelete",
     "ProductResponse",
 ]
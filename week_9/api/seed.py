@@ -2,21 +2,253 @@
 
 import csv
 import os
-from typing import Type
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
 import click
 from flask.cli import with_appcontext
 from pydantic import ValidationError, BaseModel
 
+from .bulk import (
+    as_copy_rows,
+    copy_to_staging,
+    create_staging_table,
+    insert_new_products,
+    merge_staging,
+    supports_copy,
+)
 from .db import db
 from .models import Product
 from .schemas import ProductBase, FoodProductCreate, ElectronicProductCreate, BookProductCreate
 
 CSV_PATH: str = os.path.join(os.getcwd(), "data", "products.csv")
+BULK_BATCH_SIZE: int = 50_000
+VALIDATION_CHUNK_SIZE: int = 5_000
+#: Most product_ids bound in one IN (...) lookup; stays under SQLite's 32766-variable limit.
+EXISTING_ID_CHUNK_SIZE: int = 10_000
+
+
+def _check_row(
+    row: Dict[str, str], created_by: Optional[int]
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Validate one CSV row, returning its product column values or an error message."""
+    type_value: str = (row.get("type") or row.get("category") or "").strip().lower()
+    schema_cls: Type[BaseModel] = {
+        "food": FoodProductCreate,
+        "electronic": ElectronicProductCreate,
+        "book": BookProductCreate,
+    }.get(type_value, ProductBase)
+
+    # The request schemas forbid extra keys, so drop the CSV's empty optional columns.
+    fields: Dict[str, str] = {key: value for key, value in row.items() if value not in ("", None)}
+    try:
+        validated: BaseModel = schema_cls(**fields)
+    except ValidationError as e:
+        return None, f"Row {row} validation error: {e}"
+
+    values: Dict[str, Any] = {
+        "product_id": validated.product_id,
+        "product_name": validated.product_name,
+        "quantity": validated.quantity,
+        "price": validated.price,
+        "type": type_value or None,
+        "expiry_date": getattr(validated, "expiry_date", None),
+        "warranty_period": getattr(validated, "warranty_period", None),
+        "author": getattr(validated, "author", None),
+        "pages": getattr(validated, "pages", None),
+    }
+    if created_by is not None:
+        values["created_by"] = created_by
+    return values, None
+
+
+def _log_errors(errors: List[str]) -> None:
+    if errors:
+        with open("errors.log", "a", encoding="utf-8") as ef:
+            ef.writelines(f"{error}\n" for error in errors)
+
+
+def _validate_row(row: Dict[str, str], created_by: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Validate one CSV row, returning product column values or None if invalid.
+
+    Validation errors are appended to errors.log.
+    """
+    values, error = _check_row(row, created_by)
+    if error is not None:
+        _log_errors([error])
+    return values
+
+
+def _validate_chunk(
+    rows: List[Dict[str, str]], created_by: Optional[int]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Validate a chunk of rows in a worker process, returning valid values and error messages."""
+    valid: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    for row in rows:
+        values, error = _check_row(row, created_by)
+        if values is None:
+            errors.append(error)
+        else:
+            valid.append(values)
+    return valid, errors
+
+
+def _iter_batches(
+    reader: Iterator[Dict[str, str]], created_by: int, batch_size: int
+) -> Iterator[tuple[List[Dict[str, Any]], int]]:
+    """Yield batches of validated products with the number of invalid rows seen for each."""
+    batch: List[Dict[str, Any]] = []
+    invalid: int = 0
+    for row in reader:
+        values = _validate_row(row, created_by)
+        if values is None:
+            invalid += 1
+            continue
+        batch.append(values)
+        if len(batch) >= batch_size:
+            yield batch, invalid
+            batch, invalid = [], 0
+    if batch or invalid:
+        yield batch, invalid
+
+
+def _put(q: "queue.Queue[Any]", item: Any, stop: threading.Event) -> bool:
+    """Put `item` on a bounded queue, giving up once `stop` is set."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _pipelined_batches(
+    reader: Iterator[Dict[str, str]], created_by: int, batch_size: int, workers: int
+) -> Iterator[tuple[List[Dict[str, Any]], int]]:
+    """Validate rows in a process pool while the caller writes earlier batches.
+
+    A reader thread cuts the CSV into chunks and submits them to `workers`
+    processes. Pending chunks go through a bounded queue, in file order, so the
+    reader stalls when validation or the database falls behind instead of
+    buffering the whole file. The consuming (writer) side regroups validated
+    rows into batches of `batch_size`.
+
+    Yields:
+        tuple[List[Dict[str, Any]], int]: A batch and the invalid rows seen since the previous one.
+    """
+    pending: "queue.Queue[Any]" = queue.Queue(maxsize=2 * workers)
+    stop = threading.Event()
+    done = object()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        def read() -> None:
+            try:
+                while True:
+                    chunk: List[Dict[str, str]] = list(islice(reader, VALIDATION_CHUNK_SIZE))
+                    if not chunk or not _put(pending, pool.submit(_validate_chunk, chunk, created_by), stop):
+                        break
+            except BaseException as exc:  # surfaced in the writer
+                _put(pending, exc, stop)
+            _put(pending, done, stop)
+
+        reader_thread = threading.Thread(target=read, name="seed-reader", daemon=True)
+        reader_thread.start()
+        batch: List[Dict[str, Any]] = []
+        invalid: int = 0
+        try:
+            while (item := pending.get()) is not done:
+                if isinstance(item, BaseException):
+                    raise item
+                valid, errors = item.result()
+                _log_errors(errors)
+                invalid += len(errors)
+                batch.extend(valid)
+                while len(batch) >= batch_size:
+                    yield batch[:batch_size], invalid
+                    batch, invalid = batch[batch_size:], 0
+            if batch or invalid:
+                yield batch, invalid
+        finally:
+            stop.set()
+            reader_thread.join()
+
+
+class _Progress:
+    """Periodic progress and throughput lines on stderr."""
+
+    def __init__(self) -> None:
+        self.started: float = time.perf_counter()
+        self.rows: int = 0
+
+    def update(self, rows: int) -> None:
+        self.rows += rows
+        elapsed: float = time.perf_counter() - self.started
+        rate: float = self.rows / max(elapsed, 1e-9)
+        click.echo(f"  {self.rows:,} rows processed in {elapsed:.1f}s ({rate:,.0f} rows/s)", err=True)
+
+
+def _existing_product_ids(product_ids: List[int]) -> set[int]:
+    """Return which of `product_ids` are already stored, querying in bounded chunks."""
+    existing: set[int] = set()
+    for start in range(0, len(product_ids), EXISTING_ID_CHUNK_SIZE):
+        chunk: List[int] = product_ids[start:start + EXISTING_ID_CHUNK_SIZE]
+        existing.update(pid for (pid,) in db.session.query(Product.product_id).filter(Product.product_id.in_(chunk)))
+    return existing
+
+
+def _seed_bulk(batches: Iterator[tuple[List[Dict[str, Any]], int]]) -> tuple[int, int]:
+    """Load validated batches set-wise in one transaction and return (added, skipped).
+
+    On PostgreSQL every batch is streamed with COPY into a temporary staging table,
+    which is then merged with INSERT ... ON CONFLICT DO NOTHING, so the added and
+    skipped counts come from the merge itself. Other databases insert each batch
+    with one executemany that skips existing product_ids.
+    """
+    progress = _Progress()
+    staged: int = 0
+    invalid: int = 0
+    if supports_copy():
+        create_staging_table()
+        for batch, batch_invalid in batches:
+            copy_to_staging(as_copy_rows(batch))
+            staged += len(batch)
+            invalid += batch_invalid
+            progress.update(len(batch) + batch_invalid)
+        added: int = merge_staging()
+    else:
+        added = 0
+        seen: set[int] = set()
+        for batch, batch_invalid in batches:
+            fresh: List[Dict[str, Any]] = []
+            for values in batch:
+                if values["product_id"] not in seen:
+                    seen.add(values["product_id"])
+                    fresh.append(values)
+            existing = _existing_product_ids([v["product_id"] for v in fresh])
+            added += len(insert_new_products([v for v in fresh if v["product_id"] not in existing]))
+            staged += len(batch)
+            invalid += batch_invalid
+            progress.update(len(batch) + batch_invalid)
+    db.session.commit()
+    return added, invalid + staged - added
 
 
 @click.command("seed-db")
+@click.option("--bulk", is_flag=True, help="Load set-wise (COPY + merge on PostgreSQL) instead of row by row.")
+@click.option("--created-by", type=int, default=None, help="User id recorded as the owner of seeded products.")
+@click.option("--batch-size", type=int, default=BULK_BATCH_SIZE, show_default=True,
+              help="Rows per COPY / insert batch in --bulk mode.")
+@click.option("--workers", type=click.IntRange(min=1), default=1, show_default=True,
+              help="Validation processes in --bulk mode; above 1, validation overlaps with writes.")
 @with_appcontext
-def seed_db() -> None:
+def seed_db(
+    bulk: bool = False, created_by: Optional[int] = None, batch_size: int = BULK_BATCH_SIZE, workers: int = 1
+) -> None:
     """Seed the database with products from CSV file.
 
     Skips rows with validation errors or duplicates.
@@ -26,43 +258,37 @@ def seed_db() -> None:
         click.echo(f"CSV file not found at {CSV_PATH}")
         return
 
+    if bulk and created_by is None:
+        click.echo("--created-by is required with --bulk")
+        return
+
     added: int = 0
     skipped: int = 0
     with open(CSV_PATH, newline="", encoding="utf-8") as fh:
         reader: csv.DictReader[str] = csv.DictReader(fh)
-        for row in reader:
-            type_value: str = (row.get("type") or row.get("category") or "").strip().lower()
-            schema_cls: Type[BaseModel] = {
-                "food": FoodProductCreate,
-                "electronic": ElectronicProductCreate,
-                "book": BookProductCreate,
-            }.get(type_value, ProductBase)
+        if bulk:
+            batches = (
+                _pipelined_batches(reader, created_by, batch_size, workers)
+                if workers > 1
+                else _iter_batches(reader, created_by, batch_size)
+            )
+            added, skipped = _seed_bulk(batches)
+            click.echo(f"Seeding finished. Added: {added}. Skipped: {skipped}.")
+            return
 
-            try:
-                validated: BaseModel = schema_cls(**row)
-            except ValidationError as e:
-                with open("errors.log", "a", encoding="utf-8") as ef:
-                    ef.write(f"Row {row} validation error: {e}\n")
+        for row in reader:
+            values: Optional[Dict[str, Any]] = _validate_row(row, created_by)
+            if values is None:
                 skipped += 1
                 continue
 
-            if Product.query.filter_by(product_id=validated.product_id).first():
+            if Product.query.filter_by(product_id=values["product_id"]).first():
                 skipped += 1
                 continue
 
-            product: Product = Product(
-                product_id=validated.product_id,
-                product_name=validated.product_name,
-                quantity=validated.quantity,
-                price=validated.price,
-                type=type_value or None,
-                expiry_date=getattr(validated, "expiry_date", None),
-                warranty_period=getattr(validated, "warranty_period", None),
-                author=getattr(validated, "author", None),
-                pages=getattr(validated, "pages", None),
-            )
+            product: Product = Product(**values)
             db.session.add(product)
             added += 1
 
         db.session.commit()
-    click.echo(f"Seeding finished. Added: {added}. Skipped: {skipped}.")
\ No newline at end of file
+    click.echo(f"Seeding finished. Added: {added}. Skipped: {skipped}.")
@@ -0,0 +1,198 @@
+"""Asymmetric JWT signing keys loaded from PEM files, with JWKS export."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import jwt
+from flask import Flask, current_app
+
+try:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+except ImportError:  # only needed when JWT_KEYS_DIR is configured
+    serialization = None
+    ed25519 = rsa = None
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_RELOAD_INTERVAL = 60.0
+_DEFAULT_MISS_RELOAD_INTERVAL = 1.0
+
+
+class KeyRing:
+    """Signing and verification keys read from a directory of PEM files.
+
+    Each `<kid>.pem` file holds one RSA (RS256) or Ed25519 (EdDSA) key; the file
+    stem is its key id. Private keys can sign and verify; public-only files keep
+    retired keys verifiable until the tokens they signed have expired. Tokens are
+    signed with `active_kid`, or the last private key in file-name order.
+
+    Parsed keys are cached and the directory is re-scanned at most every
+    `reload_interval` seconds, so keys can be rotated without a restart. A token
+    with an unknown kid triggers an immediate re-scan, at most once every
+    `miss_reload_interval` seconds, so a key published by another instance is
+    picked up without waiting for the next scheduled scan.
+
+    Args:
+        directory (str | Path): Directory holding the PEM files.
+        active_kid (Optional[str]): Key id used for signing.
+        reload_interval (float): Minimum seconds between directory scans.
+        miss_reload_interval (float): Minimum seconds between scans forced by unknown key ids.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        active_kid: Optional[str] = None,
+        reload_interval: float = _DEFAULT_RELOAD_INTERVAL,
+        miss_reload_interval: float = _DEFAULT_MISS_RELOAD_INTERVAL,
+    ) -> None:
+        if serialization is None:
+            raise ValueError("The cryptography package is required for asymmetric JWT keys")
+        self.directory: Path = Path(directory)
+        self.active_kid: Optional[str] = active_kid
+        self.reload_interval: float = reload_interval
+        self.miss_reload_interval: float = miss_reload_interval
+        self._lock = threading.Lock()
+        self._forced_at: float = float("-inf")
+        self._signature: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self._checked_at: float = 0.0
+        # (private keys, public keys, algorithms, signing kid, JWKS), swapped as one.
+        self._state: Tuple[Dict[str, Any], Dict[str, Any], Dict[str, str], str, Dict[str, Any]]
+        self._refresh(force=True)
+
+    @staticmethod
+    def _algorithm_for(public_key: Any) -> str:
+        if isinstance(public_key, rsa.RSAPublicKey):
+            return "RS256"
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            return "EdDSA"
+        raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+    def _scan(self) -> Tuple[Tuple[str, int, int], ...]:
+        entries: List[Tuple[str, int, int]] = []
+        for path in sorted(self.directory.glob("*.pem")):
+            stat = path.stat()
+            entries.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(entries)
+
+    def _refresh(self, force: bool = False) -> None:
+        """Reload the keys if the directory changed since the last scan.
+
+        Errors on the first load propagate. Later, a directory that cannot be
+        loaded (a malformed PEM, a missing active key) is logged and the last good
+        keys stay in use; the load is retried on the next scan.
+        """
+        now: float = time.monotonic()
+        if not force and now - self._checked_at < self.reload_interval:
+            return
+        with self._lock:
+            if not force and now - self._checked_at < self.reload_interval:
+                return
+            self._checked_at = now
+            try:
+                signature = self._scan()
+                if signature == self._signature:
+                    return
+                state = self._load(signature)
+            except Exception:
+                if self._signature is None:
+                    raise
+                logger.exception("Could not reload JWT keys from %s; keeping the previous keys", self.directory)
+                return
+            self._state = state
+            self._signature = signature
+
+    def _load(
+        self, signature: Tuple[Tuple[str, int, int], ...]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, str], str, Dict[str, Any]]:
+        """Parse the PEM files listed in `signature` into a new key state."""
+        private: Dict[str, Any] = {}
+        public: Dict[str, Any] = {}
+        algorithms: Dict[str, str] = {}
+        for name, _, _ in signature:
+            kid: str = name[: -len(".pem")]
+            data: bytes = (self.directory / name).read_bytes()
+            if b"PRIVATE KEY" in data:
+                private[kid] = serialization.load_pem_private_key(data, password=None)
+                public[kid] = private[kid].public_key()
+            else:
+                public[kid] = serialization.load_pem_public_key(data)
+            algorithms[kid] = self._algorithm_for(public[kid])
+
+        signing_kid: Optional[str] = self.active_kid
+        if signing_kid is None and private:
+            signing_kid = sorted(private)[-1]
+        if signing_kid not in private:
+            raise ValueError(f"No private key for active JWT key id {signing_kid!r} in {self.directory}")
+
+        keys: List[Dict[str, Any]] = []
+        for kid, key in public.items():
+            algorithm = jwt.get_algorithm_by_name(algorithms[kid])
+            jwk: Dict[str, Any] = algorithm.to_jwk(key, as_dict=True)
+            keys.append({**jwk, "kid": kid, "alg": algorithms[kid], "use": "sig"})
+        return private, public, algorithms, signing_kid, {"keys": keys}
+
+    def signing_key(self) -> Tuple[str, Any, str]:
+        """Return the active (kid, private key, algorithm)."""
+        self._refresh()
+        private, _, algorithms, kid, _ = self._state
+        return kid, private[kid], algorithms[kid]
+
+    def verification_key(self, kid: Optional[str]) -> Tuple[Any, str]:
+        """Return the (public key, algorithm) for `kid`.
+
+        Raises:
+            jwt.InvalidTokenError: If no key with that id is loaded.
+        """
+        self._refresh()
+        _, public, algorithms, _, _ = self._state
+        if kid not in public and self._force_refresh_for_miss():
+            _, public, algorithms, _, _ = self._state
+        if kid not in public:
+            raise jwt.InvalidTokenError(f"Unknown JWT key id {kid!r}")
+        return public[kid], algorithms[kid]
+
+    def _force_refresh_for_miss(self) -> bool:
+        """Re-scan now for an unknown kid unless one was forced recently; return whether it ran."""
+        now: float = time.monotonic()
+        with self._lock:
+            if now - self._forced_at < self.miss_reload_interval:
+                return False
+            self._forced_at = now
+        self._refresh(force=True)
+        return True
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the public keys as a JSON Web Key Set."""
+        self._refresh()
+        return self._state[4]
+
+
+def get_keyring(app: Optional[Flask] = None) -> Optional[KeyRing]:
+    """Return the app's `KeyRing`, or None when tokens are signed with JWT_SECRET_KEY.
+
+    Enabled by JWT_KEYS_DIR; JWT_ACTIVE_KID picks the signing key and
+    JWT_KEYS_RELOAD_INTERVAL how often the directory is re-scanned and
+    JWT_KEYS_MISS_RELOAD_INTERVAL how often an unknown kid may force a re-scan.
+    """
+    app = app or current_app._get_current_object()
+    keyring: Optional[KeyRing] = app.extensions.get("jwt_keyring")
+    if keyring is None:
+        directory = app.config.get("JWT_KEYS_DIR")
+        if not directory:
+            return None
+        keyring = app.extensions.setdefault("jwt_keyring", KeyRing(
+            directory,
+            active_kid=app.config.get("JWT_ACTIVE_KID"),
+            reload_interval=float(app.config.get("JWT_KEYS_RELOAD_INTERVAL", _DEFAULT_RELOAD_INTERVAL)),
+            miss_reload_interval=float(
+                app.config.get("JWT_KEYS_MISS_RELOAD_INTERVAL", _DEFAULT_MISS_RELOAD_INTERVAL)
+            ),
+        ))
+    return keyring
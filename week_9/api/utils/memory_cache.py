@@ -0,0 +1,79 @@
+"""Bounded, thread-safe in-process cache with per-entry expiry."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class BoundedTTLCache:
+    """Least-recently-used cache whose entries also expire at a wall-clock time.
+
+    Entries are evicted when they expire or, once `max_size` entries are held,
+    in least-recently-used order. All operations are O(1) and guarded by one lock,
+    so an instance can be shared by every request thread of a worker process.
+
+    Args:
+        max_size (int): Maximum number of live entries.
+        ttl (Optional[float]): Upper bound in seconds on any entry's lifetime,
+            or None to rely only on the expiry passed to `set`.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: Optional[float] = None) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size: int = max_size
+        self.ttl: Optional[float] = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for `key`, or `default` if it is missing or expired."""
+        now: float = time.time()
+        with self._lock:
+            entry: Optional[Tuple[float, Any]] = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """Store `value` until `expires_at` (epoch seconds), capped by the cache's `ttl`.
+
+        Values that would already be expired are not stored.
+        """
+        now: float = time.time()
+        if self.ttl is not None:
+            expires_at = now + self.ttl if expires_at is None else min(expires_at, now + self.ttl)
+        if expires_at is None:
+            expires_at = float("inf")
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its value (expired or not), or `default`."""
+        with self._lock:
+            entry: Optional[Tuple[float, Any]] = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,165 @@
+"""Password hashing with configurable cost and a bounded verification pool."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from flask import Flask, current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# Default configuration values (used if app config does not provide them)
+_DEFAULT_METHOD = "scrypt"
+_DEFAULT_SALT_LENGTH = 16
+_DEFAULT_VERIFY_WORKERS = 2
+_DEFAULT_VERIFY_TIMEOUT = 10.0
+
+
+class PasswordVerifierBusy(RuntimeError):
+    """Raised when the verification pool already holds its maximum of pending jobs."""
+
+
+class PasswordHasher:
+    """Hash and verify passwords with one configured werkzeug method.
+
+    Verification runs on a small dedicated thread pool. At most `max_pending`
+    jobs (running plus queued) are accepted; beyond that `verify` raises
+    `PasswordVerifierBusy` at once, so a burst of logins sheds load instead of
+    tying up every request thread behind a deep queue.
+
+    Args:
+        method (str): werkzeug hash method, e.g. "scrypt", "scrypt:65536:8:1" or
+            "pbkdf2:sha256:600000".
+        salt_length (int): Salt length for new hashes.
+        workers (int): Verification threads.
+        max_pending (Optional[int]): Jobs accepted at once; defaults to 8 per worker.
+    """
+
+    def __init__(
+        self,
+        method: str = _DEFAULT_METHOD,
+        salt_length: int = _DEFAULT_SALT_LENGTH,
+        workers: int = _DEFAULT_VERIFY_WORKERS,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.method: str = method
+        self.salt_length: int = salt_length
+        self.workers: int = workers
+        self.max_pending: int = max_pending if max_pending is not None else 8 * workers
+        if self.max_pending < workers:
+            raise ValueError("max_pending must be at least the number of workers")
+        # werkzeug fills in default parameters ("scrypt" -> "scrypt:32768:8:1"),
+        # so take the canonical prefix from a real hash.
+        self.canonical_method: str = generate_password_hash("", method, salt_length).split("$", 1)[0]
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: int = 0
+        self._running: int = 0
+        self._stats: Dict[str, int] = {"completed": 0, "rejected": 0, "peak_pending": 0}
+
+    def hash(self, password: str) -> str:
+        """Return a new hash of `password` with the configured method and salt length."""
+        return generate_password_hash(password, self.method, self.salt_length)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """Return True if `pwhash` was made with another method, cost or salt length."""
+        parts = pwhash.split("$", 2)
+        return len(parts) != 3 or parts[0] != self.canonical_method or len(parts[1]) != self.salt_length
+
+    def check(self, pwhash: str, password: str) -> Tuple[bool, Optional[str]]:
+        """Verify `password` in the calling thread.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Whether it matched, and a replacement hash
+            when it matched but `pwhash` uses outdated parameters.
+        """
+        if not check_password_hash(pwhash, password):
+            return False, None
+        return True, self.hash(password) if self.needs_rehash(pwhash) else None
+
+    def verify(self, pwhash: str, password: str, timeout: Optional[float] = None) -> Tuple[bool, Optional[str]]:
+        """Verify `password` on the pool, waiting at most `timeout` seconds.
+
+        Returns the same as `check`.
+
+        Raises:
+            PasswordVerifierBusy: If `max_pending` jobs are already pending.
+            concurrent.futures.TimeoutError: If the result is not ready in time.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                raise PasswordVerifierBusy("Password verification queue is full")
+            self._pending += 1
+            self._stats["peak_pending"] = max(self._stats["peak_pending"], self._pending)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-verify")
+            executor = self._executor
+        try:
+            future: Future = executor.submit(self._run, pwhash, password)
+        except BaseException:
+            self._finish(started=False)
+            raise
+        return future.result(timeout=timeout)
+
+    def _run(self, pwhash: str, password: str) -> Tuple[bool, Optional[str]]:
+        with self._lock:
+            self._running += 1
+        try:
+            return self.check(pwhash, password)
+        finally:
+            self._finish(started=True)
+
+    def _finish(self, started: bool) -> None:
+        with self._lock:
+            self._pending -= 1
+            if started:
+                self._running -= 1
+                self._stats["completed"] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return queue-depth and throughput counters for the verification pool."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                **self._stats,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the verification threads; a later `verify` starts new ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def get_password_hasher(app: Optional[Flask] = None) -> PasswordHasher:
+    """Return the app's shared `PasswordHasher`, creating it on first use.
+
+    Configured by PASSWORD_HASH_METHOD, PASSWORD_SALT_LENGTH,
+    PASSWORD_VERIFY_WORKERS and PASSWORD_VERIFY_MAX_PENDING.
+    """
+    app = app or current_app._get_current_object()
+    hasher: Optional[PasswordHasher] = app.extensions.get("password_hasher")
+    if hasher is None:
+        max_pending = app.config.get("PASSWORD_VERIFY_MAX_PENDING")
+        hasher = app.extensions.setdefault("password_hasher", PasswordHasher(
+            method=app.config.get("PASSWORD_HASH_METHOD", _DEFAULT_METHOD),
+            salt_length=int(app.config.get("PASSWORD_SALT_LENGTH", _DEFAULT_SALT_LENGTH)),
+            workers=int(app.config.get("PASSWORD_VERIFY_WORKERS", _DEFAULT_VERIFY_WORKERS)),
+            max_pending=int(max_pending) if max_pending is not None else None,
+        ))
+    return hasher
+
+
+def verify_timeout(app: Optional[Flask] = None) -> float:
+    """Return PASSWORD_VERIFY_TIMEOUT, the seconds a login waits for its verification."""
+    app = app or current_app._get_current_object()
+    return float(app.config.get("PASSWORD_VERIFY_TIMEOUT", _DEFAULT_VERIFY_TIMEOUT))
@@ -0,0 +1,165 @@
+"""Revocation state for refresh-token families, optionally shared between workers."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from flask import Flask, current_app
+
+_DEFAULT_BUCKET_SECONDS = 60
+_DEFAULT_KEY_PREFIX = "inventory:jwt:"
+
+
+class ExpiringIdSet:
+    """Set of ids that each drop out at their own expiry time.
+
+    Membership is one dict lookup. Ids are also filed in time buckets of
+    `bucket_seconds` by expiry, so cleanup discards whole buckets once they have
+    passed instead of scanning every entry, and memory stays proportional to
+    the ids that are still live.
+
+    Args:
+        bucket_seconds (int): Width of an expiry bucket.
+    """
+
+    def __init__(self, bucket_seconds: int = _DEFAULT_BUCKET_SECONDS) -> None:
+        if bucket_seconds < 1:
+            raise ValueError("bucket_seconds must be at least 1")
+        self.bucket_seconds: int = bucket_seconds
+        self._expiry: Dict[str, float] = {}
+        self._buckets: Dict[int, Set[str]] = {}
+        self._bucket_heap: List[int] = []
+        self._lock = threading.Lock()
+
+    def add(self, item: str, expires_at: float) -> bool:
+        """Add `item` until `expires_at` (epoch seconds).
+
+        Returns:
+            bool: False if `item` was already present and unexpired, else True.
+        """
+        now: float = time.time()
+        with self._lock:
+            self._purge(now)
+            current: Optional[float] = self._expiry.get(item)
+            if current is not None and current > now:
+                if expires_at > current:
+                    self._file(item, expires_at)
+                return False
+            if expires_at <= now:
+                return True
+            self._file(item, expires_at)
+            return True
+
+    def _file(self, item: str, expires_at: float) -> None:
+        self._expiry[item] = expires_at
+        bucket: int = math.ceil(expires_at / self.bucket_seconds)
+        if bucket not in self._buckets:
+            self._buckets[bucket] = set()
+            heapq.heappush(self._bucket_heap, bucket)
+        self._buckets[bucket].add(item)
+
+    def _purge(self, now: float) -> None:
+        """Drop every bucket whose whole time range has passed."""
+        while self._bucket_heap and self._bucket_heap[0] * self.bucket_seconds <= now:
+            for item in self._buckets.pop(heapq.heappop(self._bucket_heap)):
+                # An id re-added with a later expiry also sits in a later bucket.
+                if self._expiry.get(item, math.inf) <= now:
+                    del self._expiry[item]
+
+    def __contains__(self, item: object) -> bool:
+        expires_at: Optional[float] = self._expiry.get(item)  # type: ignore[arg-type]
+        return expires_at is not None and expires_at > time.time()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge(time.time())
+            return len(self._expiry)
+
+
+class RevocationStore:
+    """Revoked token families and spent refresh-token ids.
+
+    Each rotation spends the presented refresh token's `jti`; presenting a spent
+    one again means the token was copied, and its whole family is revoked.
+    Entries are kept only until every token they could match has expired.
+
+    With a shared `backend` every worker sees the same state: spending is an
+    atomic set-if-absent on the backend, so a token replayed against another
+    worker is still detected. The local sets then act as a read-through filter.
+    Entries only ever become true until they expire, so a local hit is answered
+    without a round trip. Without a backend the state is local to the process.
+
+    Args:
+        bucket_seconds (int): Expiry bucket width for both local sets.
+        backend (Any): Optional shared store with redis-style `get(key)` and
+            `set(key, value, ex=seconds, nx=bool)` methods, e.g. a `redis.Redis`
+            instance. `set` with `nx=True` must return a falsy value when the key
+            already exists.
+        prefix (str): Namespace for the backend keys.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = _DEFAULT_BUCKET_SECONDS,
+        backend: Any = None,
+        prefix: str = _DEFAULT_KEY_PREFIX,
+    ) -> None:
+        self.revoked_families: ExpiringIdSet = ExpiringIdSet(bucket_seconds)
+        self.spent_ids: ExpiringIdSet = ExpiringIdSet(bucket_seconds)
+        self.backend: Any = backend
+        self.prefix: str = prefix
+
+    @staticmethod
+    def _seconds_until(until: float) -> int:
+        return max(1, math.ceil(until - time.time()))
+
+    def revoke_family(self, family: str, until: float) -> None:
+        """Reject every token of `family` until `until` (epoch seconds)."""
+        self.revoked_families.add(family, until)
+        if self.backend is not None and until > time.time():
+            self.backend.set(f"{self.prefix}family:{family}", repr(until), ex=self._seconds_until(until))
+
+    def is_family_revoked(self, family: Optional[str]) -> bool:
+        if family is None:
+            return False
+        if family in self.revoked_families:
+            return True
+        if self.backend is None:
+            return False
+        until = self.backend.get(f"{self.prefix}family:{family}")
+        if until is None:
+            return False
+        self.revoked_families.add(family, float(until))
+        return True
+
+    def spend(self, jti: str, until: float) -> bool:
+        """Mark a refresh token id as used, returning False if it already was."""
+        if self.backend is None:
+            return self.spent_ids.add(jti, until)
+        if jti in self.spent_ids:
+            return False
+        first: bool = bool(self.backend.set(
+            f"{self.prefix}spent:{jti}", repr(until), ex=self._seconds_until(until), nx=True
+        ))
+        self.spent_ids.add(jti, until)
+        return first
+
+
+def get_revocation_store(app: Optional[Flask] = None) -> RevocationStore:
+    """Return the app's `RevocationStore`, bucketed by JWT_REVOCATION_BUCKET_SECONDS.
+
+    JWT_REVOCATION_BACKEND names the shared store; it defaults to
+    USER_CACHE_BACKEND so one configured redis client covers both.
+    """
+    app = app or current_app._get_current_object()
+    store: Optional[RevocationStore] = app.extensions.get("jwt_revocations")
+    if store is None:
+        store = app.extensions.setdefault("jwt_revocations", RevocationStore(
+            int(app.config.get("JWT_REVOCATION_BUCKET_SECONDS", _DEFAULT_BUCKET_SECONDS)),
+            backend=app.config.get("JWT_REVOCATION_BACKEND", app.config.get("USER_CACHE_BACKEND")),
+        ))
+    return store
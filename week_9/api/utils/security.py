@@ -1,19 +1,32 @@
 """JWT generation, verification, and refresh token utilities."""
 
+import hashlib
+import uuid
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from typing import Callable, Any, Dict, Optional
+from typing import Callable, Any, Dict, Optional, Tuple
 
 import jwt
-from flask import current_app, request, jsonify, g
-from pydantic import BaseModel
+from flask import current_app, request, jsonify, g, has_app_context, Response
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 from ..models import User
 from ..db import db
+from .keys import get_keyring
+from .memory_cache import BoundedTTLCache
+from .revocation import get_revocation_store
 
 # Default configuration values (used if app config does not provide them)
 _DEFAULT_ALGORITHM = "HS256"
 _DEFAULT_EXPIRES_MINUTES = 60
 _DEFAULT_REFRESH_EXPIRES_DAYS = 30
+_DEFAULT_TOKEN_CACHE_SIZE = 10_000
+_DEFAULT_TOKEN_CACHE_TTL = 300
+_DEFAULT_USER_CACHE_SIZE = 10_000
+_DEFAULT_USER_CACHE_TTL = 60
+_IDENTITY_KEY_PREFIX = "inventory:identity:"
+_CHANGED_USERS_KEY = "changed_user_ids"
 
 
 class TokenPayload(BaseModel):
@@ -24,6 +37,16 @@ class TokenPayload(BaseModel):
     exp: datetime
 
 
+class CurrentIdentity(BaseModel):
+    """The id, username and role of an authenticated user, as cached between requests."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    username: str
+    role: str
+
+
 def _get_secret() -> str:
     return current_app.config.get("JWT_SECRET_KEY", "fallback_secret_for_dev")
 
@@ -36,8 +59,45 @@ def _get_exp_minutes() -> int:
     return int(current_app.config.get("JWT_EXP_MINUTES", _DEFAULT_EXPIRES_MINUTES))
 
 
-def create_access_token(user_id: int, role: str, expires_in_minutes: Optional[int] = None) -> str:
-    """Create a JWT access token for a user ID with role included."""
+def _encode(payload: Dict[str, Any]) -> str:
+    """Sign `payload` with the active keyring key (adding its `kid`), else JWT_SECRET_KEY."""
+    keyring = get_keyring()
+    if keyring is not None:
+        kid, key, alg = keyring.signing_key()
+        token = jwt.encode(payload, key, algorithm=alg, headers={"kid": kid})
+    else:
+        token = jwt.encode(payload, _get_secret(), algorithm=_get_algorithm())
+    if isinstance(token, bytes):
+        token = token.decode("utf-8")
+    return token
+
+
+def _verify(token: str) -> Dict[str, Any]:
+    """Verify `token` against the key named by its `kid` header, else JWT_SECRET_KEY.
+
+    Only the algorithm of the selected key is accepted, so a token cannot pick
+    a weaker one.
+    """
+    keyring = get_keyring()
+    if keyring is not None:
+        key, alg = keyring.verification_key(jwt.get_unverified_header(token).get("kid"))
+        return jwt.decode(token, key, algorithms=[alg])
+    return jwt.decode(token, _get_secret(), algorithms=[_get_algorithm()])
+
+
+def new_token_family() -> str:
+    """Return a new id for a login session's chain of rotated tokens."""
+    return uuid.uuid4().hex
+
+
+def create_access_token(
+    user_id: int, role: str, expires_in_minutes: Optional[int] = None, family: Optional[str] = None
+) -> str:
+    """Create a JWT access token for a user ID with role included.
+
+    `family` ties the token to its login session, so revoking the family also
+    rejects the access token.
+    """
     if expires_in_minutes is None:
         expires_in_minutes = _get_exp_minutes()
 
@@ -48,38 +108,124 @@ def create_access_token(user_id: int, role: str, expires_in_minutes: Optional[in
         "iat": now,
         "exp": now + timedelta(minutes=expires_in_minutes),
     }
-    secret = _get_secret()
-    alg = _get_algorithm()
-    token = jwt.encode(payload, secret, algorithm=alg)
-    if isinstance(token, bytes):
-        token = token.decode("utf-8")
-    return token
+    if family is not None:
+        payload["fam"] = family
+    return _encode(payload)
 
 
-def create_refresh_token(user_id: int, role: str, expires_in_days: int = _DEFAULT_REFRESH_EXPIRES_DAYS) -> str:
-    """Create a long-lived refresh token with role included."""
+def create_refresh_token(
+    user_id: int, role: str, expires_in_days: int = _DEFAULT_REFRESH_EXPIRES_DAYS, family: Optional[str] = None
+) -> str:
+    """Create a long-lived, single-use refresh token with role included.
+
+    Each token gets its own `jti`; `fam` is shared by every token rotated from
+    the same login (a new family is started when `family` is None).
+    """
     now = datetime.now(timezone.utc)
     payload: Dict[str, Any] = {
         "sub": str(user_id),
         "role": role,  # <-- include role here too
         "iat": now,
         "exp": now + timedelta(days=expires_in_days),
-        "type": "refresh"
+        "type": "refresh",
+        "jti": uuid.uuid4().hex,
+        "fam": family or new_token_family(),
     }
-    secret = _get_secret()
-    alg = _get_algorithm()
-    token = jwt.encode(payload, secret, algorithm=alg)
-    if isinstance(token, bytes):
-        token = token.decode("utf-8")
-    return token
+    return _encode(payload)
+
+
+def revoke_token_family(family: str) -> None:
+    """Reject every access and refresh token of `family` from now on.
+
+    The entry is kept for one refresh-token lifetime, after which any token the
+    family could still hold has expired on its own.
+    """
+    until = datetime.now(timezone.utc) + timedelta(days=_DEFAULT_REFRESH_EXPIRES_DAYS)
+    get_revocation_store().revoke_family(family, until.timestamp())
+
+
+
+def _token_cache() -> Optional[BoundedTTLCache]:
+    """Return the app's cache of verified token payloads, or None if disabled.
 
+    Sized by JWT_TOKEN_CACHE_SIZE (0 disables it); JWT_TOKEN_CACHE_TTL caps how
+    long a payload is trusted without re-verifying, on top of the token's `exp`.
+    """
+    cache: Optional[BoundedTTLCache] = current_app.extensions.get("jwt_token_cache")
+    if cache is None:
+        size = int(current_app.config.get("JWT_TOKEN_CACHE_SIZE", _DEFAULT_TOKEN_CACHE_SIZE))
+        if size <= 0:
+            return None
+        ttl = float(current_app.config.get("JWT_TOKEN_CACHE_TTL", _DEFAULT_TOKEN_CACHE_TTL))
+        cache = current_app.extensions.setdefault("jwt_token_cache", BoundedTTLCache(max_size=size, ttl=ttl))
+    return cache
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
-    """Decode and validate JWT, returning the payload."""
-    secret = _get_secret()
-    alg = _get_algorithm()
-    return jwt.decode(token, secret, algorithms=[alg])
+    """Decode and validate JWT, returning the payload.
+
+    Verified payloads are cached by a digest of the signing mode and token until
+    the token's `exp`, so repeated requests with the same token skip signature
+    verification. Failures are never cached.
+    """
+    cache = _token_cache()
+    if cache is None:
+        return _verify(token)
+
+    mode = "keyring" if get_keyring() is not None else _get_algorithm()
+    key = hashlib.sha256(f"{mode}:{token}".encode("utf-8")).digest()
+    payload: Optional[Dict[str, Any]] = cache.get(key)
+    if payload is None:
+        payload = _verify(token)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            cache.set(key, payload, expires_at=float(exp))
+    return dict(payload)
+
+
+def _authenticate() -> Optional[Tuple[Response, int]]:
+    """Verify the request's bearer token once and expose its claims on `g`.
+
+    Sets g.jwt_payload, g.current_user_id and g.current_user_role. Later calls
+    during the same request reuse the result, so stacked decorators decode once.
+    Refresh tokens and tokens of a revoked family are rejected.
+
+    Returns:
+        Optional[Tuple[Response, int]]: A 401 error response, or None if authenticated.
+    """
+    current = request._get_current_object()
+    if g.get("_jwt_request") is current:
+        return None
+
+    auth_header = request.headers.get("Authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return jsonify({"error": "Missing or invalid Authorization header"}), 401
+
+    token = auth_header.split(" ", 1)[1].strip()
+    if not token:
+        return jsonify({"error": "Missing token"}), 401
+
+    try:
+        payload = decode_access_token(token)
+        user_id = payload.get("sub")
+        role = payload.get("role")
+        if not user_id or not role:
+            return jsonify({"error": "Invalid token payload"}), 401
+        if payload.get("type") == "refresh":
+            return jsonify({"error": "Invalid token type"}), 401
+        if get_revocation_store().is_family_revoked(payload.get("fam")):
+            return jsonify({"error": "Token has been revoked"}), 401
+        g.current_user_id = int(user_id)
+        g.current_user_role = role
+        g.pop("current_identity", None)
+    except jwt.ExpiredSignatureError:
+        return jsonify({"error": "Token has expired"}), 401
+    except jwt.InvalidTokenError:
+        return jsonify({"error": "Invalid token"}), 401
+
+    g.jwt_payload = payload
+    g._jwt_request = current
+    return None
 
 
 def jwt_required(func: Optional[Callable] = None) -> Callable:
@@ -88,26 +234,9 @@ def jwt_required(func: Optional[Callable] = None) -> Callable:
     def decorator(fn: Callable) -> Callable:
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            auth_header = request.headers.get("Authorization", "")
-            if not auth_header.startswith("Bearer "):
-                return jsonify({"error": "Missing or invalid Authorization header"}), 401
-
-            token = auth_header.split(" ", 1)[1].strip()
-            if not token:
-                return jsonify({"error": "Missing token"}), 401
-
-            try:
-                payload = decode_access_token(token)
-                user_id = payload.get("sub")
-                role = payload.get("role")
-                if not user_id or not role:
-                    return jsonify({"error": "Invalid token payload"}), 401
-                g.current_user_id = int(user_id)
-                g.current_user_role = role
-            except jwt.ExpiredSignatureError:
-                return jsonify({"error": "Token has expired"}), 401
-            except jwt.InvalidTokenError:
-                return jsonify({"error": "Invalid token"}), 401
+            auth_resp = _authenticate()
+            if auth_resp is not None:
+                return auth_resp
 
             return fn(*args, **kwargs)
 
@@ -124,11 +253,11 @@ def roles_required(*allowed_roles: str) -> Callable:
         @wraps(fn)
         def wrapper(*args, **kwargs):
             # First ensure user is authenticated
-            auth_resp = jwt_required(lambda: None)()
+            auth_resp = _authenticate()
             if auth_resp is not None:
                 return auth_resp
 
-            # Check role from g.current_user_role (set in jwt_required)
+            # Check role from g.current_user_role (set in _authenticate)
             if g.current_user_role not in allowed_roles:
                 return jsonify({"error": "Forbidden: Insufficient role"}), 403
 
@@ -153,4 +282,117 @@ def get_current_user():
                 return None
         return db.session.get(User, int(user_id))
     except Exception:
-        return None
\ No newline at end of file
+        return None
+
+
+def _identity_cache() -> BoundedTTLCache:
+    """Return the app's process-local identity cache, sized by USER_CACHE_SIZE and USER_CACHE_TTL."""
+    cache: Optional[BoundedTTLCache] = current_app.extensions.get("user_identity_cache")
+    if cache is None:
+        cache = current_app.extensions.setdefault("user_identity_cache", BoundedTTLCache(
+            max_size=int(current_app.config.get("USER_CACHE_SIZE", _DEFAULT_USER_CACHE_SIZE)),
+            ttl=float(current_app.config.get("USER_CACHE_TTL", _DEFAULT_USER_CACHE_TTL)),
+        ))
+    return cache
+
+
+def _identity_backend() -> Any:
+    """Return the optional shared identity cache configured as USER_CACHE_BACKEND.
+
+    Any client with redis-style `get(key)`, `set(key, value, ex=seconds)` and
+    `delete(key)` methods works, e.g. a `redis.Redis` instance shared by all workers.
+    """
+    return current_app.config.get("USER_CACHE_BACKEND")
+
+
+def get_current_identity() -> Optional[CurrentIdentity]:
+    """Return the authenticated user's id, username and role without loading the ORM row.
+
+    Looks in the current request first. With a shared USER_CACHE_BACKEND the
+    backend is the only cache consulted, so an invalidation by any worker is seen
+    by all of them at once; otherwise the process-local cache is used. Only on a
+    miss is the users table queried. Returns None when the request is not
+    authenticated or the user no longer exists.
+    """
+    user_id = getattr(g, "current_user_id", None)
+    if user_id is None:
+        return None
+    identity: Optional[CurrentIdentity] = getattr(g, "current_identity", None)
+    if identity is not None and identity.id == user_id:
+        return identity
+
+    backend = _identity_backend()
+    key = f"{_IDENTITY_KEY_PREFIX}{user_id}"
+    local: Optional[BoundedTTLCache] = _identity_cache() if backend is None else None
+    if local is not None:
+        identity = local.get(user_id)
+    else:
+        try:
+            cached = backend.get(key)
+            if cached is not None:
+                identity = CurrentIdentity.model_validate_json(cached)
+        except Exception:
+            identity = None
+
+    if identity is None:
+        row = db.session.query(User.id, User.username, User.role).filter(User.id == int(user_id)).first()
+        if row is None:
+            return None
+        identity = CurrentIdentity(id=row.id, username=row.username, role=row.role)
+        if local is not None:
+            local.set(user_id, identity)
+        else:
+            ttl = int(current_app.config.get("USER_CACHE_TTL", _DEFAULT_USER_CACHE_TTL))
+            try:
+                backend.set(key, identity.model_dump_json(), ex=ttl)
+            except Exception:
+                pass
+
+    g.current_identity = identity
+    return identity
+
+
+def invalidate_identity(user_id: int) -> None:
+    """Drop a user's cached identity from this process, the shared backend and the current request."""
+    if not has_app_context():
+        return
+    cache: Optional[BoundedTTLCache] = current_app.extensions.get("user_identity_cache")
+    if cache is not None:
+        cache.pop(user_id)
+    backend = _identity_backend()
+    if backend is not None:
+        try:
+            backend.delete(f"{_IDENTITY_KEY_PREFIX}{user_id}")
+        except Exception:
+            pass
+    identity: Optional[CurrentIdentity] = getattr(g, "current_identity", None)
+    if identity is not None and identity.id == user_id:
+        del g.current_identity
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_changed_user(mapper, connection, target: User) -> None:
+    """Remember users updated or deleted through the ORM until their transaction ends.
+
+    Invalidating at flush time would let another request re-cache the old row
+    before the change commits, so ids are only queued on the session here.
+    Set-based `update(User)` / `delete(User)` statements bypass these events and
+    must call `invalidate_identity` themselves after committing.
+    """
+    session = object_session(target)
+    if session is not None and target.id is not None:
+        session.info.setdefault(_CHANGED_USERS_KEY, set()).add(int(target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """Invalidate the cached identities of users changed by the committed transaction."""
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        invalidate_identity(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    """Drop queued invalidations whose changes were rolled back."""
+    session.info.pop(_CHANGED_USERS_KEY, None)
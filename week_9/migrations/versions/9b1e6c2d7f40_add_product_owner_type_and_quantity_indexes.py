@@ -0,0 +1,30 @@
+"""Add product owner, type and quantity indexes
+
+Revision ID: 9b1e6c2d7f40
+Revises: 3f30b44855e5
+Create Date: 2025-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b1e6c2d7f40'
+down_revision = '3f30b44855e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.create_index('ix_products_created_by_product_id', ['created_by', 'product_id'], unique=False)
+        batch_op.create_index('ix_products_type_lower_product_id', [sa.text('lower(type)'), 'product_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_products_quantity'), ['quantity'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('products', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_products_quantity'))
+        batch_op.drop_index('ix_products_type_lower_product_id')
+        batch_op.drop_index('ix_products_created_by_product_id')
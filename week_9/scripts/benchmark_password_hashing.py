@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Script: Measure password hashing cost and login throughput through the verification pool.
+
+For every hash method given, times single hash/verify calls, then fires a burst
+of concurrent verifications at a PasswordHasher configured like the API and
+reports throughput, latency percentiles and how many attempts were shed. Use it
+to pick PASSWORD_HASH_METHOD, PASSWORD_VERIFY_WORKERS and
+PASSWORD_VERIFY_MAX_PENDING for a host. No database is needed.
+
+Usage:
+  python -m week_9.scripts.benchmark_password_hashing --methods scrypt pbkdf2:sha256:600000 \\
+      --workers 4 --max-pending 32 --burst 200 --clients 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from week_9.api.utils.passwords import PasswordHasher, PasswordVerifierBusy
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+PASSWORD: str = "correct horse battery staple"
+
+
+def time_single(hasher: PasswordHasher, repeats: int) -> Dict[str, float]:
+    """Return the median milliseconds of one hash and one verify in the calling thread."""
+    hash_ms: List[float] = []
+    verify_ms: List[float] = []
+    pwhash: str = hasher.hash(PASSWORD)
+    for _ in range(repeats):
+        start: float = time.perf_counter()
+        hasher.hash(PASSWORD)
+        hash_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        hasher.check(pwhash, PASSWORD)
+        verify_ms.append((time.perf_counter() - start) * 1000)
+    return {"hash": statistics.median(hash_ms), "verify": statistics.median(verify_ms)}
+
+
+def run_burst(hasher: PasswordHasher, burst: int, clients: int) -> Dict[str, float]:
+    """Send `burst` verifications from `clients` threads and summarize the outcome."""
+    pwhash: str = hasher.hash(PASSWORD)
+    latencies: List[float] = []
+    rejected: int = 0
+
+    def attempt(_: int) -> Optional[float]:
+        start: float = time.perf_counter()
+        try:
+            hasher.verify(pwhash, PASSWORD)
+        except PasswordVerifierBusy:
+            return None
+        return (time.perf_counter() - start) * 1000
+
+    started: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for result in pool.map(attempt, range(burst)):
+            if result is None:
+                rejected += 1
+            else:
+                latencies.append(result)
+    elapsed: float = time.perf_counter() - started
+
+    latencies.sort()
+    p99_index: int = max(0, int(len(latencies) * 0.99) - 1)
+    return {
+        "accepted/s": len(latencies) / elapsed,
+        "p50 ms": statistics.median(latencies) if latencies else 0.0,
+        "p99 ms": latencies[p99_index] if latencies else 0.0,
+        "rejected": float(rejected),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--methods", nargs="+", default=["scrypt", "pbkdf2:sha256:600000"],
+                        help="werkzeug hash methods to compare")
+    parser.add_argument("--salt-length", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2, help="Verification pool threads")
+    parser.add_argument("--max-pending", type=int, default=None, help="Accepted jobs (default: 8 per worker)")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed single calls per method")
+    parser.add_argument("--burst", type=int, default=100, help="Concurrent login attempts per method")
+    parser.add_argument("--clients", type=int, default=32, help="Threads issuing the burst")
+    args = parser.parse_args()
+
+    rows: List[tuple] = []
+    for method in args.methods:
+        logger.info("Benchmarking %s...", method)
+        hasher = PasswordHasher(method, args.salt_length, args.workers, args.max_pending)
+        try:
+            single = time_single(hasher, args.repeats)
+            burst = run_burst(hasher, args.burst, args.clients)
+        finally:
+            hasher.shutdown()
+        rows.append((hasher.canonical_method, single, burst))
+
+    print(f"{'method':<28}{'hash ms':>9}{'verify ms':>11}{'login/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'shed':>6}")
+    for method, single, burst in rows:
+        print(
+            f"{method:<28}{single['hash']:>9.1f}{single['verify']:>11.1f}{burst['accepted/s']:>10.1f}"
+            f"{burst['p50 ms']:>9.1f}{burst['p99 ms']:>9.1f}{int(burst['rejected']):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
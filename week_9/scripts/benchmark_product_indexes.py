@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Script: Compare query plans and latencies of product queries with and without indexes.
+
+Builds a scratch copy of the products table filled with generated rows, runs the
+owner-, type- and low-stock queries the API issues with EXPLAIN ANALYZE, then adds
+the indexes from migration 9b1e6c2d7f40 and runs them again. The real products
+table is never touched; the scratch table is dropped at the end.
+
+Usage:
+  export DATABASE_URL="postgresql://..."
+  python -m scripts.benchmark_product_indexes --rows 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+import psycopg2
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+TABLE: str = "products_index_bench"
+
+#: Index DDL matching the Product model, with the table name left open.
+INDEXES: List[str] = [
+    "CREATE INDEX ON {table} (created_by, product_id)",
+    "CREATE INDEX ON {table} (lower(type), product_id)",
+    "CREATE INDEX ON {table} (quantity)",
+]
+
+#: Queries shaped like the ones the API and loaders send, by label.
+QUERIES: Dict[str, str] = {
+    "owner page": (
+        "SELECT product_id, product_name, quantity, price FROM {table} "
+        "WHERE created_by = 42 AND product_id > 1000 ORDER BY product_id LIMIT 50"
+    ),
+    "type page": (
+        "SELECT product_id, product_name, quantity, price FROM {table} "
+        "WHERE lower(type) = 'book' AND product_id > 2500000 ORDER BY product_id LIMIT 50"
+    ),
+    "low stock": "SELECT product_id, quantity FROM {table} WHERE quantity < 3 ORDER BY quantity LIMIT 500",
+    "owner count": "SELECT count(*) FROM {table} WHERE created_by = 42",
+}
+
+
+def build_table(cursor, rows: int, owners: int) -> None:
+    """Create and fill the scratch table with `rows` generated products."""
+    logger.info("Generating %s rows in %s...", f"{rows:,}", TABLE)
+    cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    cursor.execute(f"CREATE UNLOGGED TABLE {TABLE} (LIKE products INCLUDING DEFAULTS)")
+    cursor.execute(
+        f"""
+        INSERT INTO {TABLE} (product_id, product_name, quantity, price, type, created_by)
+        SELECT g,
+               'Product ' || g,
+               (g * 7919) %% 500,
+               1 + (g %% 1000) / 10.0,
+               (ARRAY['food', 'electronic', 'book', ''])[1 + g %% 4],
+               1 + (g * 31) %% %(owners)s
+        FROM generate_series(1, %(rows)s) AS g
+        """,
+        {"rows": rows, "owners": owners},
+    )
+    cursor.execute(f"ALTER TABLE {TABLE} ADD PRIMARY KEY (product_id)")
+    cursor.execute(f"ANALYZE {TABLE}")
+
+
+def run_queries(cursor, repeats: int) -> Dict[str, Tuple[float, str]]:
+    """Return the median latency (ms) and the EXPLAIN ANALYZE plan of every query."""
+    results: Dict[str, Tuple[float, str]] = {}
+    for label, template in QUERIES.items():
+        sql: str = template.format(table=TABLE)
+        cursor.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql)
+        plan: str = "\n".join(row[0] for row in cursor.fetchall())
+        timings: List[float] = []
+        for _ in range(repeats):
+            start: float = time.perf_counter()
+            cursor.execute(sql)
+            cursor.fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        results[label] = (statistics.median(timings), plan)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Generated products (default: 5M)")
+    parser.add_argument("--owners", type=int, default=200, help="Distinct created_by values")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per query")
+    parser.add_argument("--show-plans", action="store_true", help="Print full EXPLAIN ANALYZE output")
+    args = parser.parse_args()
+
+    db_url = os.getenv("DATABASE_URL")
+    if not db_url:
+        raise ValueError("DATABASE_URL not found in environment variables")
+
+    with psycopg2.connect(db_url) as conn:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            build_table(cursor, args.rows, args.owners)
+            try:
+                before = run_queries(cursor, args.repeats)
+                logger.info("Creating indexes...")
+                for ddl in INDEXES:
+                    cursor.execute(ddl.format(table=TABLE))
+                cursor.execute(f"ANALYZE {TABLE}")
+                after = run_queries(cursor, args.repeats)
+            finally:
+                cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+
+    print(f"{'query':<14}{'before (ms)':>14}{'after (ms)':>14}{'speed-up':>11}")
+    for label in QUERIES:
+        (slow, slow_plan), (fast, fast_plan) = before[label], after[label]
+        print(f"{label:<14}{slow:>14.2f}{fast:>14.2f}{slow / max(fast, 1e-6):>10.1f}x")
+        if args.show_plans:
+            print(f"\n--- {label}: before ---\n{slow_plan}\n--- {label}: after ---\n{fast_plan}\n")
+
+
+if __name__ == "__main__":
+    main()
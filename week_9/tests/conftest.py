@@ -1,9 +1,10 @@
 """Pytest fixtures for Week 6–7 Inventory API tests (patched for JWT/RBAC)."""
 
+import importlib
+from typing import Any, Dict
+
 import pytest
 from flask import Flask
-from week_6_and_7.api.app import create_app
-from week_6_and_7.api.db import db as _db
 
 
 @pytest.fixture
@@ -21,9 +22,28 @@ def sample_product() -> dict:
 
 
 @pytest.fixture()
-def app() -> Flask:
+def api_package() -> str:
+    """
+    Package whose app the tests run against.
+
+    Modules testing the week 9 API override it with
+    ``pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])``.
+    """
+    return "week_6_and_7.api"
+
+
+@pytest.fixture()
+def app_config() -> Dict[str, Any]:
+    """Extra Flask config for the `app` fixture; override or parametrize it per module or test."""
+    return {}
+
+
+@pytest.fixture()
+def app(api_package: str, app_config: Dict[str, Any]) -> Flask:
     """Create Flask app with in-memory SQLite database for testing."""
-    app: Flask = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
+    create_app = importlib.import_module(f"{api_package}.app").create_app
+    _db = importlib.import_module(f"{api_package}.db").db
+    app: Flask = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:", **app_config})
     with app.app_context():
         _db.create_all()
         yield app
@@ -37,15 +57,16 @@ def client(app: Flask):
 
 
 @pytest.fixture()
-def db(app: Flask):
+def db(app: Flask, api_package: str):
     """Provide database session for tests."""
-    return _db
+    return importlib.import_module(f"{api_package}.db").db
 
 
 @pytest.fixture(autouse=True)
-def clear_db(db):
+def clear_db(db, api_package: str):
     """Clear Product and User tables before each test."""
-    from week_6_and_7.api.models import Product, User
+    models = importlib.import_module(f"{api_package}.models")
+    Product, User = models.Product, models.User
     db.session.query(Product).delete()
     db.session.query(User).delete()
     db.session.commit()
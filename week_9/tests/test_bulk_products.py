@@ -0,0 +1,67 @@
+"""Tests for the week 9 bulk product endpoints."""
+
+import pytest
+
+from week_9.api.db import db as _db
+from week_9.api.models import Product
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+
+def _headers(client, role: str, username: str) -> dict:
+    client.post("/auth/register", json={"username": username, "password": "pw", "role": role})
+    token = client.post("/auth/login", json={"username": username, "password": "pw"}).json["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _item(pid: int, **extra) -> dict:
+    return {"product_id": pid, "product_name": f"P{pid}", "quantity": 1, "price": 2.0, **extra}
+
+
+def test_bulk_create_reports_each_item(client) -> None:
+    headers = _headers(client, "manager", "mgr")
+    client.post("/api/products", json=_item(1), headers=headers)
+
+    resp = client.post("/api/products/bulk", headers=headers, json=[
+        _item(1), _item(2), _item(3, type="book"), _item(2), "nope", _item(4, type="book", author="A", pages=3),
+    ])
+    assert resp.status_code == 200
+    assert [r["status"] for r in resp.json["results"]] == [409, 201, 400, 409, 400, 201]
+    assert resp.json["succeeded"] == 2 and resp.json["failed"] == 4
+    assert _db.session.query(Product).count() == 3
+
+
+def test_bulk_update_checks_ownership(client) -> None:
+    owner = _headers(client, "manager", "owner")
+    other = _headers(client, "manager", "other")
+    client.post("/api/products/bulk", json=[_item(1), _item(2)], headers=owner)
+
+    resp = client.patch("/api/products/bulk", headers=owner, json=[
+        {"product_id": 1, "quantity": 50}, {"product_id": 2, "price": 9.5}, {"product_id": 99, "quantity": 1},
+        {"product_id": 1, "quantity": -1}, {"product_id": 2, "quantity": 3},
+    ])
+    assert [r["status"] for r in resp.json["results"]] == [200, 200, 404, 400, 409]
+    assert _db.session.get(Product, 1).quantity == 50
+    assert _db.session.get(Product, 2).price == 9.5
+
+    forbidden = client.patch("/api/products/bulk", headers=other, json=[{"product_id": 1, "quantity": 7}])
+    assert forbidden.json["results"][0]["status"] == 403
+
+
+def test_bulk_delete_requires_admin(client) -> None:
+    admin = _headers(client, "admin", "root")
+    client.post("/api/products/bulk", json=[_item(1), _item(2), _item(3)], headers=admin)
+
+    manager = _headers(client, "manager", "mgr")
+    assert client.delete("/api/products/bulk", json={"product_ids": [1]}, headers=manager).status_code == 403
+
+    resp = client.delete("/api/products/bulk", json={"product_ids": [1, 3, 42]}, headers=admin)
+    assert [r["status"] for r in resp.json["results"]] == [200, 200, 404]
+    assert [p.product_id for p in _db.session.query(Product)] == [2]
+
+
+def test_bulk_rejects_oversized_or_malformed_batches(app, client) -> None:
+    app.config["BULK_MAX_ITEMS"] = 2
+    headers = _headers(client, "admin", "root")
+    assert client.post("/api/products/bulk", json=[_item(1)] * 3, headers=headers).status_code == 413
+    assert client.post("/api/products/bulk", json={"product_id": 1}, headers=headers).status_code == 400
@@ -0,0 +1,132 @@
+"""Tests for the cached user identity used by week 9 routes that only need id and role."""
+
+import pytest
+from flask import Flask, g
+from sqlalchemy import event
+
+from week_9.api.db import db as _db
+from week_9.api.models import User
+from week_9.api.utils.security import CurrentIdentity, get_current_identity
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+
+class _DictBackend:
+    """Minimal redis-style client keeping values in a dict."""
+
+    def __init__(self) -> None:
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture()
+def identity_app(app: Flask) -> Flask:
+    """Return the week 9 app with one user."""
+    user = User(username="alice", role="manager")
+    user.set_password("pw")
+    _db.session.add(user)
+    _db.session.commit()
+    return app
+
+
+@pytest.fixture()
+def user_queries(identity_app):
+    """Record SQL statements that read the users table."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(_db.engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(_db.engine, "before_cursor_execute", record)
+
+
+def _identity(app: Flask, user_id: int):
+    with app.test_request_context():
+        # The fixture's app context (and its `g`) outlives each request context here.
+        g.pop("current_identity", None)
+        g.current_user_id = user_id
+        return get_current_identity()
+
+
+def test_identity_is_loaded_once(identity_app, user_queries) -> None:
+    assert _identity(identity_app, 1) == CurrentIdentity(id=1, username="alice", role="manager")
+    assert _identity(identity_app, 1).role == "manager"
+    assert len(user_queries) == 1
+    assert _identity(identity_app, 42) is None
+
+
+def test_identity_is_invalidated_on_update_and_delete(identity_app) -> None:
+    assert _identity(identity_app, 1).role == "manager"
+    user = _db.session.get(User, 1)
+    user.role = "admin"
+    _db.session.commit()
+    assert _identity(identity_app, 1).role == "admin"
+
+    _db.session.delete(user)
+    _db.session.commit()
+    assert _identity(identity_app, 1) is None
+
+
+def test_identity_is_invalidated_only_when_the_change_commits(identity_app, user_queries) -> None:
+    assert _identity(identity_app, 1).role == "manager"
+    user = _db.session.get(User, 1)
+    user.role = "admin"
+    _db.session.flush()
+    # Flushed but uncommitted: other requests keep reading the committed identity.
+    assert _identity(identity_app, 1).role == "manager"
+    _db.session.rollback()
+    assert _identity(identity_app, 1).role == "manager"
+    assert sum("users.password_hash" not in q for q in user_queries) == 1
+
+    user = _db.session.get(User, 1)
+    user.role = "admin"
+    _db.session.commit()
+    assert _identity(identity_app, 1).role == "admin"
+
+
+def test_shared_backend_is_used_across_processes(identity_app, user_queries) -> None:
+    backend = _DictBackend()
+    identity_app.config["USER_CACHE_BACKEND"] = backend
+    assert _identity(identity_app, 1).username == "alice"
+    assert list(backend.values) == ["inventory:identity:1"]
+
+    # Another worker reads the backend, not a process-local copy.
+    assert "user_identity_cache" not in identity_app.extensions
+    assert _identity(identity_app, 1).username == "alice"
+    assert len(user_queries) == 1
+    backend.delete("inventory:identity:1")
+    assert _identity(identity_app, 1).username == "alice"
+    assert len(user_queries) == 2
+
+    user = _db.session.get(User, 1)
+    user.username = "alice2"
+    _db.session.commit()
+    assert backend.values == {}
+    assert _identity(identity_app, 1).username == "alice2"
+
+
+def test_authenticated_route_reads_identity_from_cache(identity_app, user_queries) -> None:
+    client = identity_app.test_client()
+    token = client.post("/auth/login", json={"username": "alice", "password": "pw"}).json["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    user_queries.clear()
+    for _ in range(3):
+        assert client.post("/documents/upload", headers=headers).status_code == 400
+    assert len(user_queries) == 1
+
+    # A deleted user's still-valid token is refused rather than reaching the handler.
+    _db.session.delete(_db.session.get(User, 1))
+    _db.session.commit()
+    assert client.post("/documents/upload", headers=headers).status_code == 401
@@ -0,0 +1,141 @@
+"""Tests for asymmetric JWT signing with the week 9 key ring and the JWKS endpoint."""
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from week_9.api.utils.keys import KeyRing
+
+FAST = {"PASSWORD_HASH_METHOD": "pbkdf2:sha256:1000"}
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+
+def _write_key(directory, kid: str, kind: str = "rsa", public_only: bool = False) -> None:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048) if kind == "rsa" \
+        else ed25519.Ed25519PrivateKey.generate()
+    if public_only:
+        data = key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+    else:
+        data = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    (directory / f"{kid}.pem").write_bytes(data)
+
+
+@pytest.fixture()
+def key_dir(tmp_path):
+    directory = tmp_path / "keys"
+    directory.mkdir()
+    _write_key(directory, "2024-rsa", "rsa")
+    _write_key(directory, "2025-ed", "ed25519")
+    return directory
+
+
+@pytest.fixture()
+def app_config(key_dir):
+    """Sign tokens with the keys in `key_dir`."""
+    return {**FAST, "JWT_KEYS_DIR": str(key_dir), "JWT_KEYS_RELOAD_INTERVAL": 0, "JWT_TOKEN_CACHE_SIZE": 0}
+
+
+def _login(client) -> str:
+    client.post("/auth/register", json={"username": "u", "password": "pw", "role": "manager"})
+    return client.post("/auth/login", json={"username": "u", "password": "pw"}).json["access_token"]
+
+
+def test_tokens_carry_kid_and_verify_with_published_keys(client) -> None:
+    token = _login(client)
+    assert jwt.get_unverified_header(token) == {"alg": "EdDSA", "kid": "2025-ed", "typ": "JWT"}
+
+    body = {"product_id": 1, "product_name": "P", "quantity": 1, "price": 1.0}
+    assert client.post("/api/products", json=body, headers={"Authorization": f"Bearer {token}"}).status_code == 201
+
+    resp = client.get("/auth/jwks")
+    assert resp.cache_control.max_age == 300
+    keys = {k["kid"]: k for k in resp.json["keys"]}
+    assert {k: v["alg"] for k, v in keys.items()} == {"2024-rsa": "RS256", "2025-ed": "EdDSA"}
+    assert all("d" not in k for k in keys.values())
+
+    # A downstream service verifies locally from the key set alone.
+    public = jwt.PyJWK(keys["2025-ed"])
+    assert jwt.decode(token, public.key, algorithms=["EdDSA"])["role"] == "manager"
+
+
+def test_rotation_keeps_retired_keys_verifiable(client, key_dir) -> None:
+    old_token = _login(client)
+    headers = {"Authorization": f"Bearer {old_token}"}
+
+    # Publish a new signing key and retire the old one to public-only.
+    _write_key(key_dir, "2026-rsa", "rsa")
+    old = serialization.load_pem_private_key((key_dir / "2025-ed.pem").read_bytes(), password=None)
+    (key_dir / "2025-ed.pem").write_bytes(old.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo))
+
+    new_token = client.post("/auth/login", json={"username": "u", "password": "pw"}).json["access_token"]
+    assert jwt.get_unverified_header(new_token)["kid"] == "2026-rsa"
+    assert client.put("/api/products/1", json={"quantity": 2}, headers=headers).status_code == 404
+
+    (key_dir / "2025-ed.pem").unlink()
+    assert client.put("/api/products/1", json={"quantity": 2}, headers=headers).status_code == 401
+
+
+def test_rejects_unknown_kid_and_algorithm_confusion(client) -> None:
+    claims = {"sub": "1", "role": "admin", "exp": 4_102_444_800}
+    forged = [
+        jwt.encode(claims, "fallback_secret", algorithm="HS256", headers={"kid": "2024-rsa"}),
+        jwt.encode(claims, "fallback_secret", algorithm="HS256"),
+        jwt.encode(claims, ed25519.Ed25519PrivateKey.generate(), algorithm="EdDSA", headers={"kid": "nope"}),
+    ]
+    for token in forged:
+        resp = client.delete("/api/products/1", headers={"Authorization": f"Bearer {token}"})
+        assert resp.status_code == 401
+
+
+def test_unknown_kid_forces_one_rate_limited_reload(key_dir, monkeypatch) -> None:
+    keyring = KeyRing(key_dir, reload_interval=3600, miss_reload_interval=3600)
+    scans = []
+    real_scan = keyring._scan
+    monkeypatch.setattr(keyring, "_scan", lambda: scans.append(1) or real_scan())
+
+    # A key published after the last scheduled scan is found on first use.
+    _write_key(key_dir, "2026-rsa", "rsa", public_only=True)
+    assert keyring.verification_key("2026-rsa")[1] == "RS256"
+    assert len(scans) == 1
+
+    # Further unknown kids are rejected without scanning until the interval passes.
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidTokenError):
+            keyring.verification_key("nope")
+    assert len(scans) == 1
+    keyring.miss_reload_interval = 0
+    with pytest.raises(jwt.InvalidTokenError):
+        keyring.verification_key("nope")
+    assert len(scans) == 2
+
+
+def test_broken_reload_keeps_previous_keys(client, key_dir) -> None:
+    token = _login(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    (key_dir / "broken.pem").write_bytes(b"-----BEGIN PUBLIC KEY-----\nnot a key\n-----END PUBLIC KEY-----\n")
+
+    forged = jwt.encode({"sub": "1", "role": "admin", "exp": 4_102_444_800},
+                        ed25519.Ed25519PrivateKey.generate(), algorithm="EdDSA", headers={"kid": "made-up"})
+    assert client.delete("/api/products/1", headers={"Authorization": f"Bearer {forged}"}).status_code == 401
+    assert client.put("/api/products/1", json={"quantity": 2}, headers=headers).status_code == 404
+    assert jwt.get_unverified_header(_login(client))["kid"] == "2025-ed"
+
+
+def test_keyring_requires_a_signing_key(tmp_path) -> None:
+    _write_key(tmp_path, "retired", "rsa", public_only=True)
+    with pytest.raises(ValueError):
+        KeyRing(tmp_path)
+    _write_key(tmp_path, "current", "rsa")
+    with pytest.raises(ValueError):
+        KeyRing(tmp_path, active_kid="missing")
+    assert KeyRing(tmp_path).signing_key()[0] == "current"
+
+
+@pytest.mark.parametrize("app_config", [FAST])
+def test_jwks_is_empty_with_shared_secret(client) -> None:
+    assert client.get("/auth/jwks").json == {"keys": []}
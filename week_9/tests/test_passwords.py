@@ -0,0 +1,98 @@
+"""Tests for the week 9 password hasher and its use by /auth/login."""
+
+import threading
+
+import pytest
+
+from week_9.api.db import db as _db
+from week_9.api.models import User
+from week_9.api.utils.passwords import PasswordHasher, PasswordVerifierBusy
+
+FAST = "pbkdf2:sha256:1000"
+
+pytestmark = pytest.mark.parametrize(
+    "api_package, app_config", [("week_9.api", {"PASSWORD_HASH_METHOD": FAST})], ids=["week_9"]
+)
+
+
+def _block(hasher: PasswordHasher):
+    """Make the hasher's jobs wait until the returned event is set."""
+    release = threading.Event()
+    real_check = hasher.check
+
+    def slow_check(pwhash, password):
+        release.wait(5)
+        return real_check(pwhash, password)
+
+    hasher.check = slow_check
+    return release
+
+
+def test_needs_rehash_tracks_method_and_salt() -> None:
+    hasher = PasswordHasher(method=FAST, salt_length=8)
+    pwhash = hasher.hash("pw")
+    assert pwhash.startswith(FAST + "$")
+    assert not hasher.needs_rehash(pwhash)
+    assert hasher.needs_rehash(PasswordHasher(method="pbkdf2:sha256:2000", salt_length=8).hash("pw"))
+    assert hasher.needs_rehash(PasswordHasher(method=FAST, salt_length=12).hash("pw"))
+    assert PasswordHasher(method="pbkdf2:sha256").canonical_method.startswith("pbkdf2:sha256:")
+
+
+def test_verify_returns_replacement_hash_for_outdated_parameters() -> None:
+    old = PasswordHasher(method="pbkdf2:sha256:500").hash("pw")
+    hasher = PasswordHasher(method=FAST)
+    assert hasher.verify(old, "nope") == (False, None)
+    valid, new_hash = hasher.verify(old, "pw")
+    assert valid and new_hash.startswith(FAST + "$")
+    assert hasher.verify(new_hash, "pw") == (True, None)
+    assert hasher.stats()["completed"] == 3
+    hasher.shutdown()
+
+
+def test_verify_sheds_load_when_pool_is_full() -> None:
+    hasher = PasswordHasher(method=FAST, workers=1, max_pending=1)
+    pwhash = hasher.hash("pw")
+    release = _block(hasher)
+    worker = threading.Thread(target=hasher.verify, args=(pwhash, "pw"))
+    worker.start()
+    while hasher.stats()["running"] == 0:
+        pass
+    with pytest.raises(PasswordVerifierBusy):
+        hasher.verify(pwhash, "pw")
+    stats = hasher.stats()
+    assert stats["pending"] == 1 and stats["queued"] == 0 and stats["rejected"] == 1
+    release.set()
+    worker.join()
+    assert hasher.stats()["pending"] == 0
+    hasher.shutdown()
+
+
+def test_login_rehashes_outdated_password(app) -> None:
+    client = app.test_client()
+    user = User(username="u", role="staff", password_hash=PasswordHasher(method="pbkdf2:sha256:500").hash("pw"))
+    _db.session.add(user)
+    _db.session.commit()
+
+    assert client.post("/auth/login", json={"username": "u", "password": "bad"}).status_code == 401
+    assert user.password_hash.startswith("pbkdf2:sha256:500$")
+    assert client.post("/auth/login", json={"username": "u", "password": "pw"}).status_code == 200
+    assert _db.session.get(User, user.id).password_hash.startswith(FAST + "$")
+
+
+def test_login_returns_503_when_verification_is_saturated(app) -> None:
+    client = app.test_client()
+    client.post("/auth/register", json={"username": "u", "password": "pw"})
+    hasher = PasswordHasher(method=FAST, workers=1, max_pending=1)
+    app.extensions["password_hasher"] = hasher
+    release = _block(hasher)
+    worker = threading.Thread(target=hasher.verify, args=(hasher.hash("pw"), "pw"))
+    worker.start()
+    try:
+        resp = client.post("/auth/login", json={"username": "u", "password": "pw"})
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "1"
+    finally:
+        release.set()
+        worker.join()
+    assert client.post("/auth/login", json={"username": "u", "password": "pw"}).status_code == 200
+    hasher.shutdown()
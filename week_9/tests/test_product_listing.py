@@ -0,0 +1,96 @@
+"""Tests for filtering, projection and pagination of the week 9 product listing."""
+
+import json
+
+import pytest
+from flask import Flask
+from sqlalchemy import text
+
+from week_9.api.db import db as _db
+from week_9.api.models import Product, User
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+
+@pytest.fixture()
+def listing_client(app: Flask):
+    """Return a client for the week 9 app seeded with 25 products."""
+    owner = User(username="owner", role="admin")
+    owner.set_password("pw")
+    _db.session.add(owner)
+    _db.session.flush()
+    types = ["food", "book", "", "electronic", None]
+    _db.session.add_all(
+        Product(product_id=i, product_name=f"P{i}", quantity=i, price=float(i * 2),
+                type=types[i % len(types)], created_by=owner.id)
+        for i in range(1, 26)
+    )
+    _db.session.commit()
+    return app.test_client()
+
+
+def test_listing_without_params_returns_everything(listing_client) -> None:
+    resp = listing_client.get("/api/products")
+    assert resp.status_code == 200
+    assert [p["product_id"] for p in resp.json] == list(range(1, 26))
+    assert "X-Next-Cursor" not in resp.headers
+
+
+def test_keyset_pagination_walks_all_pages(listing_client) -> None:
+    seen, url = [], "/api/products?limit=10&fields=product_id"
+    while url:
+        resp = listing_client.get(url)
+        assert resp.status_code == 200
+        seen.extend(p["product_id"] for p in resp.json)
+        url = None
+        if "X-Next-Cursor" in resp.headers:
+            url = f"/api/products?limit=10&fields=product_id&after={resp.headers['X-Next-Cursor']}"
+            assert 'rel="next"' in resp.headers["Link"]
+    assert seen == list(range(1, 26))
+
+
+def test_filters_and_projection(listing_client) -> None:
+    resp = listing_client.get("/api/products?type=Food&min_quantity=5&max_price=40&fields=product_name,quantity")
+    assert resp.json == [{"product_name": "P5", "quantity": 5}, {"product_name": "P10", "quantity": 10},
+                         {"product_name": "P15", "quantity": 15}, {"product_name": "P20", "quantity": 20}]
+
+    generic = listing_client.get("/api/products?type=&fields=product_id").json
+    assert [p["product_id"] for p in generic] == [2, 4, 7, 9, 12, 14, 17, 19, 22, 24]
+
+
+def test_invalid_listing_params_are_rejected(listing_client) -> None:
+    assert listing_client.get("/api/products?limit=0").status_code == 400
+    assert listing_client.get("/api/products?min_price=cheap").status_code == 400
+    assert listing_client.get("/api/products?fields=password_hash").status_code == 400
+
+
+def test_ndjson_listing_streams_one_product_per_line(listing_client) -> None:
+    resp = listing_client.get("/api/products?fields=product_id&after=20",
+                              headers={"Accept": "application/x-ndjson"})
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    lines = resp.get_data(as_text=True).splitlines()
+    assert [json.loads(line)["product_id"] for line in lines] == [21, 22, 23, 24, 25]
+
+
+def test_chunked_array_matches_buffered_listing(listing_client) -> None:
+    streamed = listing_client.get("/api/products?stream=true&type=book")
+    assert streamed.is_streamed
+    assert streamed.json == listing_client.get("/api/products?type=book").json
+    assert listing_client.get("/api/products?stream=true&type=nothing").json == []
+
+
+def test_owner_filter_uses_owner_index(listing_client) -> None:
+    owner_id = _db.session.query(User.id).scalar()
+    resp = listing_client.get(f"/api/products?created_by={owner_id}&limit=3&fields=product_id")
+    assert [p["product_id"] for p in resp.json] == [1, 2, 3]
+    assert listing_client.get(f"/api/products?created_by={owner_id + 1}").json == []
+
+    names = set(_db.session.scalars(text(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'products'")))
+    assert {"ix_products_created_by_product_id", "ix_products_type_lower_product_id",
+            "ix_products_quantity"} <= names
+    plan = _db.session.execute(text(
+        "EXPLAIN QUERY PLAN SELECT product_id FROM products WHERE created_by = 1 ORDER BY product_id"
+    )).all()
+    assert "ix_products_created_by_product_id" in " ".join(str(row[-1]) for row in plan)
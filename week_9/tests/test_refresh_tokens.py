@@ -0,0 +1,156 @@
+"""Tests for refresh-token rotation, reuse detection and revocation in week 9."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from week_9.api.utils.revocation import ExpiringIdSet, RevocationStore
+
+FAST = {"PASSWORD_HASH_METHOD": "pbkdf2:sha256:1000"}
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+
+@pytest.fixture()
+def app_config() -> dict:
+    """Hash passwords cheaply."""
+    return FAST
+
+
+class _SharedBackend:
+    """Minimal redis-style client keeping values in a dict, as several workers would share."""
+
+    def __init__(self) -> None:
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+
+@pytest.fixture()
+def auth_client(client):
+    """Return the test client with one registered manager."""
+    client.post("/auth/register", json={"username": "u", "password": "pw", "role": "manager"})
+    return client
+
+
+def _login(client) -> dict:
+    return client.post("/auth/login", json={"username": "u", "password": "pw"}).json
+
+
+def _refresh(client, token: str):
+    return client.post("/auth/refresh", json={"refresh_token": token})
+
+
+def _can_read(client, access_token: str) -> bool:
+    resp = client.put("/api/products/1", json={"quantity": 1}, headers={"Authorization": f"Bearer {access_token}"})
+    return resp.status_code != 401
+
+
+def test_expiring_id_set_drops_ids_by_bucket() -> None:
+    ids = ExpiringIdSet(bucket_seconds=1)
+    now = time.time()
+    assert ids.add("a", now + 0.2)
+    assert not ids.add("a", now + 0.2)
+    assert ids.add("b", now + 60)
+    assert ids.add("gone", now - 1)
+    assert "a" in ids and "b" in ids and "gone" not in ids
+    time.sleep(0.3)
+    assert "a" not in ids
+    assert ids.add("a", now + 60)
+    assert len(ids) == 2
+    with pytest.raises(ValueError):
+        ExpiringIdSet(bucket_seconds=0)
+
+
+def test_stores_sharing_a_backend_detect_reuse_across_workers() -> None:
+    backend = _SharedBackend()
+    first, second = RevocationStore(backend=backend), RevocationStore(backend=backend)
+    until = time.time() + 60
+
+    assert first.spend("jti-1", until)
+    assert not second.spend("jti-1", until)
+    assert not first.spend("jti-1", until)
+
+    assert not second.is_family_revoked("fam-1")
+    first.revoke_family("fam-1", until)
+    assert second.is_family_revoked("fam-1")
+    # The positive answer is kept locally; the backend is not asked again.
+    backend.values.clear()
+    assert second.is_family_revoked("fam-1")
+    assert not RevocationStore(backend=backend).is_family_revoked("fam-1")
+
+
+@pytest.mark.parametrize("app_config", [{**FAST, "JWT_REVOCATION_BACKEND": _SharedBackend()}])
+def test_reuse_on_another_worker_revokes_the_family(app, auth_client) -> None:
+    tokens = _login(auth_client)
+    rotated = _refresh(auth_client, tokens["refresh_token"]).json
+
+    # A fresh store stands in for a worker that never saw the rotation.
+    app.extensions.pop("jwt_revocations")
+    reused = _refresh(auth_client, tokens["refresh_token"])
+    assert reused.json["error"] == "Refresh token reuse detected"
+
+    app.extensions.pop("jwt_revocations")
+    assert _refresh(auth_client, rotated["refresh_token"]).status_code == 401
+    assert not _can_read(auth_client, rotated["access_token"])
+
+
+def test_rotation_keeps_family_and_issues_new_jti(auth_client) -> None:
+    tokens = _login(auth_client)
+    rotated = _refresh(auth_client, tokens["refresh_token"])
+    assert rotated.status_code == 200
+
+    old = jwt.decode(tokens["refresh_token"], options={"verify_signature": False})
+    new = jwt.decode(rotated.json["refresh_token"], options={"verify_signature": False})
+    access = jwt.decode(rotated.json["access_token"], options={"verify_signature": False})
+    assert new["fam"] == old["fam"] == access["fam"]
+    assert new["jti"] != old["jti"]
+    assert _can_read(auth_client, rotated.json["access_token"])
+
+
+def test_reuse_revokes_the_whole_family(auth_client) -> None:
+    tokens = _login(auth_client)
+    other_session = _login(auth_client)
+    rotated = _refresh(auth_client, tokens["refresh_token"]).json
+
+    reused = _refresh(auth_client, tokens["refresh_token"])
+    assert reused.status_code == 401
+    assert reused.json["error"] == "Refresh token reuse detected"
+
+    assert _refresh(auth_client, rotated["refresh_token"]).status_code == 401
+    assert not _can_read(auth_client, rotated["access_token"])
+    assert not _can_read(auth_client, tokens["access_token"])
+    # Other logins of the same user are unaffected.
+    assert _can_read(auth_client, other_session["access_token"])
+    assert _refresh(auth_client, other_session["refresh_token"]).status_code == 200
+
+
+def test_logout_revokes_access_and_refresh_tokens(auth_client) -> None:
+    tokens = _login(auth_client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert auth_client.post("/auth/logout", headers=headers).status_code == 204
+    assert not _can_read(auth_client, tokens["access_token"])
+    assert _refresh(auth_client, tokens["refresh_token"]).status_code == 401
+    assert auth_client.post("/auth/logout", headers=headers).status_code == 401
+
+
+def test_refresh_tokens_are_not_access_tokens(auth_client) -> None:
+    tokens = _login(auth_client)
+    assert not _can_read(auth_client, tokens["refresh_token"])
+
+    app = auth_client.application
+    now = datetime.now(timezone.utc)
+    legacy = jwt.encode(
+        {"sub": "1", "role": "manager", "iat": now, "exp": now + timedelta(days=1), "type": "refresh"},
+        app.config["JWT_SECRET_KEY"], algorithm="HS256",
+    )
+    assert _refresh(auth_client, legacy).json["error"] == "Invalid token payload"
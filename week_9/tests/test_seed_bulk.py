@@ -0,0 +1,77 @@
+"""Tests for the bulk mode of the week 9 seed-db command."""
+
+import pytest
+from click.testing import CliRunner
+from flask import Flask
+
+from week_9.api import bulk
+from week_9.api.db import db as _db
+from week_9.api.models import Product, User
+from week_9.api.seed import seed_db
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+HEADER = "product_id,product_name,quantity,price,type,expiry_date,warranty_period,author,pages\n"
+
+
+@pytest.fixture()
+def owner_id(app: Flask, tmp_path, monkeypatch) -> int:
+    """Seed an owner user and point the seed command at a products CSV."""
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text(
+        HEADER
+        + "1,Apples,3,1.5,food,2030-01-01,,,\n"
+        + "2,Radio,1,20,electronic,,12,,\n"
+        + "3,Broken,x,1,food,2030-01-01,,,\n"
+        + "1,Apples again,3,1.5,food,2030-01-01,,,\n"
+        + "4,Novel,2,9.5,book,,,Someone,300\n"
+    )
+    monkeypatch.setattr("week_9.api.seed.CSV_PATH", str(csv_file))
+    monkeypatch.chdir(tmp_path)
+    owner = User(username="seeder", role="admin")
+    owner.set_password("pw")
+    _db.session.add(owner)
+    _db.session.commit()
+    return owner.id
+
+
+def test_bulk_seed_counts_added_and_skipped(owner_id) -> None:
+    runner = CliRunner()
+    first = runner.invoke(seed_db, ["--bulk", "--created-by", str(owner_id), "--batch-size", "2"])
+    assert "Added: 3. Skipped: 2." in first.output
+    assert [p.product_name for p in _db.session.query(Product).order_by(Product.product_id)] == [
+        "Apples", "Radio", "Novel"]
+    assert {p.created_by for p in _db.session.query(Product)} == {owner_id}
+
+    again = runner.invoke(seed_db, ["--bulk", "--created-by", str(owner_id)])
+    assert "Added: 0. Skipped: 5." in again.output
+
+
+def test_bulk_seed_requires_owner(owner_id) -> None:
+    result = CliRunner().invoke(seed_db, ["--bulk"])
+    assert "--created-by is required" in result.output
+
+
+def test_copy_rows_follow_column_order() -> None:
+    rows = bulk.as_copy_rows([{"product_id": 7, "product_name": "X", "created_by": 1}])
+    assert rows == [(7, "X", None, None, None, None, None, None, None, 1)]
+
+
+def test_pipelined_bulk_seed_matches_serial(owner_id, monkeypatch) -> None:
+    monkeypatch.setattr("week_9.api.seed.VALIDATION_CHUNK_SIZE", 2)
+    result = CliRunner().invoke(seed_db, ["--bulk", "--created-by", str(owner_id), "--workers", "2",
+                                          "--batch-size", "1"])
+    assert result.exit_code == 0, result.output
+    assert "Added: 3. Skipped: 2." in result.output
+    assert "rows/s" in result.output
+    assert [p.product_name for p in _db.session.query(Product).order_by(Product.product_id)] == [
+        "Apples", "Radio", "Novel"]
+
+
+def test_existing_ids_are_looked_up_in_chunks(owner_id, monkeypatch) -> None:
+    monkeypatch.setattr("week_9.api.seed.EXISTING_ID_CHUNK_SIZE", 2)
+    runner = CliRunner()
+    assert "Added: 3. Skipped: 2." in runner.invoke(seed_db, ["--bulk", "--created-by", str(owner_id)]).output
+    again = runner.invoke(seed_db, ["--bulk", "--created-by", str(owner_id)])
+    assert "Added: 0. Skipped: 5." in again.output
+    assert _db.session.query(Product).count() == 3
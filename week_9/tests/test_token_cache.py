@@ -0,0 +1,98 @@
+"""Tests for the bounded TTL cache and verified-token caching in the week 9 auth layer."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from week_9.api.utils import security
+from week_9.api.utils.memory_cache import BoundedTTLCache
+
+pytestmark = pytest.mark.parametrize("api_package", ["week_9.api"])
+
+
+@pytest.fixture()
+def decode_calls(monkeypatch):
+    """Count calls to jwt.decode made by the security module."""
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(security.jwt, "decode", counting_decode)
+    return calls
+
+
+def _token(client, role: str = "manager") -> str:
+    client.post("/auth/register", json={"username": "u", "password": "pw", "role": role})
+    return client.post("/auth/login", json={"username": "u", "password": "pw"}).json["access_token"]
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = BoundedTTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_cache_expires_entries() -> None:
+    cache = BoundedTTLCache(ttl=60)
+    cache.set("past", 1, expires_at=time.time() - 1)
+    cache.set("soon", 2, expires_at=time.time() + 0.05)
+    cache.set("capped", 3, expires_at=time.time() + 3600)
+    assert cache.get("past") is None
+    assert cache.get("soon") == 2
+    time.sleep(0.06)
+    assert cache.get("soon") is None
+    assert cache.get("capped") == 3
+    with pytest.raises(ValueError):
+        BoundedTTLCache(max_size=0)
+
+
+def test_stacked_decorators_decode_once_per_request(client, decode_calls) -> None:
+    headers = {"Authorization": f"Bearer {_token(client)}"}
+
+    body = {"product_id": 1, "product_name": "P", "quantity": 1, "price": 1.0}
+    assert client.post("/api/products", json=body, headers=headers).status_code == 201
+    assert len(decode_calls) == 1
+
+    # Later requests with the same token are served from the cache.
+    assert client.put("/api/products/1", json={"quantity": 5}, headers=headers).status_code == 200
+    assert len(decode_calls) == 1
+
+
+def test_cache_disabled_and_failures_not_cached(app, client, decode_calls) -> None:
+    token = _token(client)
+    app.config["JWT_TOKEN_CACHE_SIZE"] = 0
+    for _ in range(2):
+        with app.test_request_context():
+            security.decode_access_token(token)
+    assert len(decode_calls) == 2
+
+    app.config["JWT_TOKEN_CACHE_SIZE"] = 10
+    bad = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+    for _ in range(2):
+        resp = client.post("/api/products", json={}, headers={"Authorization": f"Bearer {bad}"})
+        assert resp.status_code == 401
+    assert len(decode_calls) == 4
+
+
+def test_expired_token_is_not_served_from_cache(app) -> None:
+    now = datetime.now(timezone.utc)
+    token = jwt.encode(
+        {"sub": "1", "role": "admin", "iat": now, "exp": now + timedelta(seconds=1)},
+        app.config["JWT_SECRET_KEY"],
+        algorithm="HS256",
+    )
+    with app.test_request_context():
+        assert security.decode_access_token(token)["sub"] == "1"
+        time.sleep(1.1)
+        with pytest.raises(jwt.ExpiredSignatureError):
+            security.decode_access_token(token)